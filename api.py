@@ -0,0 +1,149 @@
+"""백테스트 작업 API 서버
+
+    uvicorn api:app --host 0.0.0.0 --port 8000
+
+BACKTEST_JOB_WORKERS(기본 CPU 수)개 작업을 동시에 실행하고, 대기 작업이
+BACKTEST_JOB_QUEUE(기본 64)개를 넘으면 429로 거절함. 앱이 이 서버를 쓸 때는
+가격 차트 데이터도 /chart로 받아 앱 프로세스가 캔들을 직접 받지 않음.
+"""
+import logging
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, Field
+
+from jobs import DONE, FAILED, JobManager, JobQueueFull
+from report import encode_result
+from signal_strategy import list_strategies
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+class BacktestParams(BaseModel):
+    ticker: str = Field(pattern=r"^KRW-[A-Z0-9]+$")
+    interval: str = "minute30"
+    days: int = Field(90, ge=1, le=3650)
+    fast_period: int = Field(12, ge=1)
+    slow_period: int = Field(26, ge=2)
+    signal_period: int = Field(9, ge=1)
+    take_profit: float = Field(0.03, gt=0)
+    stop_loss: float = Field(0.01, gt=0)
+    macd_threshold: float = 0.0
+    min_holding_period: int = Field(2, ge=0)
+    macd_crossover_threshold: float = 0.0
+    cash: float = Field(1_000_000, gt=0)
+    commission: float = Field(0.0005, ge=0)
+    engine: Literal["backtesting", "vector"] = "backtesting"
+    intrabar: bool = False
+    # 등록된 전략 이름 (없으면 기본 MACD v2)
+    strategy: Optional[str] = None
+    # 상위 차트 추세 필터 전략(macd_mtf)의 추세 확인 차트 단위
+    trend_interval: Optional[str] = None
+
+
+class ChartRequest(BaseModel):
+    params: BacktestParams
+    # 실행의 데이터 구간 (지표는 이 구간 첫 봉부터 계산)
+    start: datetime
+    end: datetime
+    # 화면에 보이는 구간 (없으면 실행 구간 전체)
+    view_start: Optional[datetime] = None
+    view_end: Optional[datetime] = None
+    method: Literal["lttb", "minmax"] = "lttb"
+
+
+manager: JobManager = None
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    global manager
+    workers = os.environ.get("BACKTEST_JOB_WORKERS")
+    manager = JobManager(
+        max_workers=int(workers) if workers else None,
+        max_pending=int(os.environ.get("BACKTEST_JOB_QUEUE", "64")),
+    )
+    yield
+    manager.shutdown()
+
+
+app = FastAPI(title="업비트 MACD 백테스트 작업 API", lifespan=lifespan)
+
+
+def _get_job(job_id: str) -> dict:
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok", "workers": manager.max_workers}
+
+
+@app.post("/jobs", status_code=202)
+def submit_job(params: BacktestParams):
+    if params.fast_period >= params.slow_period:
+        raise HTTPException(status_code=422, detail="단기 EMA는 장기 EMA보다 작아야 합니다.")
+    if params.strategy is not None and params.strategy not in list_strategies():
+        raise HTTPException(status_code=422, detail=f"등록되지 않은 전략: {params.strategy}")
+    try:
+        # 파라미터 정리(기본값/형식 통일)는 JobManager.submit에서 함
+        job, deduplicated = manager.submit(params.model_dump(exclude_none=True))
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return {**job, "deduplicated": deduplicated}
+
+
+@app.get("/jobs")
+def list_jobs(limit: int = 50):
+    return manager.list(limit)
+
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    return _get_job(job_id)
+
+
+@app.get("/jobs/{job_id}/result")
+def get_result(job_id: str):
+    job = _get_job(job_id)
+    if job["status"] == FAILED:
+        raise HTTPException(status_code=409, detail=job["error"])
+    if job["status"] != DONE:
+        raise HTTPException(status_code=409, detail="작업이 아직 끝나지 않았습니다.")
+    result = manager.result(job_id)
+    if result is None:
+        raise HTTPException(status_code=410, detail="결과 보관 기간이 지났습니다.")
+    return encode_result(result)
+
+
+@app.post("/chart")
+def get_chart(request: ChartRequest):
+    """실행 구간의 종가/지표를 보이는 구간만 줄여서 반환 (앱의 가격 차트용)"""
+    from chart_data import chart_frame, load_chart_data
+
+    try:
+        df, spec, indicators = load_chart_data(
+            request.params.model_dump(exclude_none=True), request.start, request.end
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        # 업비트 요청 실패 (없는 종목 등)
+        raise HTTPException(status_code=502, detail=f"캔들을 받지 못했습니다: {e}")
+    if df.empty:
+        raise HTTPException(status_code=404, detail="실행 구간의 캔들이 없습니다.")
+    frame = chart_frame(
+        df, spec, indicators, request.view_start, request.view_end, request.method
+    )
+    return encode_result({"frame": frame})
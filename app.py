@@ -1,7 +1,29 @@
 import streamlit as st
+import json
 import logging
+import numpy as np
+import pandas as pd
 import traceback
-from backtest_runner import run_backtest
+import os
+import time
+from contextlib import nullcontext
+import chart_data
+from backtest_runner import normalize_params, run_backtest
+from data_collector import get_ohlcv
+from profiling import profile, stage
+from report import (
+    column_mapping,
+    extract_trades,
+    rename_and_filter_columns,
+    summarize_trades,
+)
+from result_cache import ResultCache, result_key
+from run_store import METRIC_COLUMNS, RunStore
+from signal_strategy import (
+    DEFAULT_STRATEGY,
+    get_strategy,
+    list_strategies,
+)
 from datetime import datetime, timedelta
 
 logging.basicConfig(
@@ -31,6 +53,119 @@ interval_options = {
     "월봉": "month",
 }
 
+# 백테스트 엔진 옵션 (결과는 동일, 벡터 엔진이 훨씬 빠름)
+engine_options = {
+    "backtesting.py": "backtesting",
+    "고속 벡터 엔진": "vector",
+}
+
+# 등록된 전략 (설명:이름 매핑)
+strategy_options = {label: name for name, label in list_strategies().items()}
+
+
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    """세션 간에 공유되는 백테스트 결과 캐시"""
+    return ResultCache(
+        max_items=int(os.environ.get("BACKTEST_RESULT_CACHE_ITEMS", "128")),
+        ttl_seconds=float(os.environ.get("BACKTEST_RESULT_CACHE_TTL", str(6 * 3600))),
+        disk_dir=os.environ.get("BACKTEST_RESULT_CACHE_DIR") or None,
+    )
+
+
+# 지정하면 백테스트를 작업 API 서버(api.py)에 맡기고 결과만 받아 표시
+BACKTEST_API_URL = os.environ.get("BACKTEST_API_URL", "").rstrip("/")
+
+
+def run_remote_backtest(params: dict):
+    """작업 API에 제출하고 끝날 때까지 진행 상황을 표시한 뒤 (결과, 캐시 여부) 반환"""
+    import requests
+    from report import decode_result
+
+    response = requests.post(
+        f"{BACKTEST_API_URL}/jobs",
+        json={**params, "ticker": params["ticker"].upper()},
+        timeout=10,
+    )
+    if response.status_code == 429:
+        raise RuntimeError("백테스트 서버가 바쁩니다. 잠시 후 다시 시도해 주세요.")
+    response.raise_for_status()
+    job = response.json()
+    progress_bar = st.progress(0.0, text=job["stage"])
+    while job["status"] not in ("done", "failed"):
+        time.sleep(0.5)
+        job = requests.get(f"{BACKTEST_API_URL}/jobs/{job['id']}", timeout=10).json()
+        progress_bar.progress(job["progress"], text=job["stage"])
+    progress_bar.empty()
+    if job["status"] == "failed":
+        raise RuntimeError(job["error"])
+    response = requests.get(f"{BACKTEST_API_URL}/jobs/{job['id']}/result", timeout=60)
+    response.raise_for_status()
+    return decode_result(response.json()), job["from_cache"]
+
+
+@st.cache_resource(max_entries=2)
+def load_chart_data(params_json: str, start: str, end: str):
+    """차트용 캔들과 전략 지표 (구간/방식을 바꿀 때마다 다시 계산하지 않도록 보관)"""
+    return chart_data.load_chart_data(json.loads(params_json), start, end)
+
+
+@st.cache_resource(max_entries=16)
+def load_remote_chart_data(
+    params_json: str, start: str, end: str, view_start: str, view_end: str, method: str
+):
+    """작업 API에서 보이는 구간만 줄인 종가/지표를 받아 옴 (앱에서는 캔들을 받지 않음)"""
+    import requests
+    from report import decode_result
+
+    params = json.loads(params_json)
+    response = requests.post(
+        f"{BACKTEST_API_URL}/chart",
+        json={
+            "params": params,
+            "start": start,
+            "end": end,
+            "view_start": view_start,
+            "view_end": view_end,
+            "method": method,
+        },
+        timeout=60,
+    )
+    response.raise_for_status()
+    frame = decode_result(response.json())["frame"]
+    return chart_data.from_chart_frame(frame, get_strategy(params.get("strategy")))
+
+
+@st.cache_resource
+def get_run_store() -> RunStore:
+    """지난 실행 기록 저장소 (BACKTEST_RUN_DB로 경로 지정)"""
+    return RunStore()
+
+
+def remember_result(
+    result, ticker: str, from_cache: bool = False, timings=None, params=None
+) -> None:
+    """결과 구조 확인 및 세션 저장 (아래 결과 화면이 세션 상태를 읽어 표시)"""
+    if hasattr(result, "to_dict"):
+        result = result.to_dict()
+
+    trades_df = extract_trades(result)
+    summary = summarize_trades(trades_df)
+
+    st.session_state["result"] = result
+    st.session_state["trades_df"] = trades_df
+    st.session_state["win_rate"] = summary["win_rate"]
+    st.session_state["max_investment"] = summary["max_investment"]
+    st.session_state["total_trades"] = summary["total_trades"]
+    st.session_state["profit_trades"] = summary["profit_trades"]
+    st.session_state["loss_trades"] = summary["loss_trades"]
+    st.session_state["ticker"] = ticker
+    st.session_state["from_cache"] = from_cache
+    st.session_state["timings"] = timings.to_frame() if timings else None
+    st.session_state["profile_path"] = timings.profile_path if timings else None
+    st.session_state["params"] = params
+    st.session_state.pop("monte_carlo", None)
+
 
 def validate_ticker(ticker: str) -> bool:
     """입력된 ticker가 업비트에서 지원하는 형식인지 검증"""
@@ -43,32 +178,6 @@ def validate_ticker(ticker: str) -> bool:
     return False
 
 
-column_mapping = {
-    "EntryBar": "진입 바 (인덱스)",
-    "ExitBar": "종료 바 (인덱스)",
-    "EntryTime": "진입 시간",
-    "ExitTime": "종료 시간",
-    "EntryPrice": "진입 가격",
-    "ExitPrice": "종료 가격",
-    "PnL": "손익",
-    "ReturnPct": "수익률 (%)",
-    "Size": "거래 수량",
-    "Value": "거래 금액",
-    "Commission": "수수료",
-    "TradeDuration": "보유 기간 (바)",
-}
-
-
-def rename_and_filter_columns(df, mapping):
-    # 실제로 존재하는 칼럼만 매핑
-    available_cols = [col for col in mapping.keys() if col in df.columns]
-    # 한글로 변환
-    renamed_df = df[available_cols].rename(columns=mapping)
-    if "수익률 (%)" in renamed_df.columns:
-        renamed_df["수익률 (%)"] = (renamed_df["수익률 (%)"] * 100).round(2)
-    return renamed_df
-
-
 with st.sidebar:
     st.header("⚙️ 백테스트 설정")
     # 1. 데이터 기간 선택 방식 선택
@@ -91,6 +200,11 @@ with st.sidebar:
         horizontal=True,
     )
     ascending = True if sort_order == "오름차순" else False
+    measure_timings = st.checkbox(
+        "단계별 소요 시간 측정",
+        value=True,
+        help="데이터 수집/지표 계산/시뮬레이션 등 단계별 시간을 결과 아래에 표시합니다.",
+    )
     with st.form("input_form"):
         # 거래 종목 직접 입력 및 검증
         ticker = st.text_input("거래 종목 (예: BTC, ETH, KRW-BTC, DOGE)", value="DOGE")
@@ -101,6 +215,24 @@ with st.sidebar:
             help="차트 데이터의 시간 단위를 선택하세요.",
         )
         selected_interval = interval_options[selected_interval_name]
+        selected_strategy_name = st.selectbox(
+            "전략",
+            list(strategy_options.keys()),
+            index=list(strategy_options.values()).index(DEFAULT_STRATEGY),
+            help="MACD/EMA 파라미터는 모든 전략에서 같은 의미로 쓰입니다.",
+        )
+        selected_trend_interval_name = st.selectbox(
+            "추세 확인 차트 단위",
+            list(interval_options.keys()),
+            index=6,  # 기본값: 60분봉
+            help="상위 차트 추세 필터 전략에서만 쓰이며, 차트 단위보다 길어야 합니다.",
+        )
+        # 단일 실행/최적화/일괄 실행에 공통으로 넣을 전략 선택 값
+        strategy_params = {}
+        if strategy_options[selected_strategy_name] != DEFAULT_STRATEGY:
+            strategy_params["strategy"] = strategy_options[selected_strategy_name]
+        if "trend_interval" in get_strategy(strategy_params.get("strategy")).params:
+            strategy_params["trend_interval"] = interval_options[selected_trend_interval_name]
         if period_type == "슬라이더로 선택":
             # 슬라이더로 일수 선택 (예: 1~365일)
             days = st.slider(
@@ -132,6 +264,17 @@ with st.sidebar:
         take_profit = st.number_input("Take Profit (%)", 0.5, 50.0, 3.0, 0.5) / 100
         stop_loss = st.number_input("Stop Loss (%)", 0.5, 50.0, 1.0, 0.5) / 100
         cash = st.number_input("초기 자본 (원)", 100_000, 100_000_000_000, 1_000_000)
+        selected_engine_name = st.selectbox(
+            "백테스트 엔진",
+            list(engine_options.keys()),
+            help="고속 벡터 엔진은 backtesting.py와 같은 결과를 훨씬 빠르게 계산합니다.",
+        )
+        intrabar = st.checkbox(
+            "봉 안에서 익절/손절 판정 (1분봉)",
+            value=False,
+            help="벡터 엔진 전용. 봉 종가 대신 캐시된 1분봉 고가/저가로 익절/손절 "
+            "도달 시점을 찾아 그 가격에 체결합니다.",
+        )
 
         # 미세 조정 파라미터
         if fine_tune_type == "직접 입력 (미세 조정)":
@@ -165,6 +308,8 @@ if submitted:
         try:
             if fast_period >= slow_period:
                 raise ValueError("단기 EMA는 장기 EMA보다 작아야 합니다.")
+            if intrabar and engine_options[selected_engine_name] != "vector":
+                raise ValueError("봉 안 익절/손절 판정은 고속 벡터 엔진에서만 사용할 수 있습니다.")
             params = {
                 "ticker": f"KRW-{ticker}",
                 "interval": selected_interval,
@@ -179,45 +324,246 @@ if submitted:
                 "macd_crossover_threshold": macd_crossover_threshold,
                 "cash": cash,
                 "commission": 0.0005,
+                "engine": engine_options[selected_engine_name],
             }
-            with st.spinner("백테스트 실행 중…"):
-                result = run_backtest(params)
-
-            # 결과 구조 확인 및 세션 저장
-            if hasattr(result, "to_dict"):
-                result = result.to_dict()
-
-            trades_df = None
-            if hasattr(result, "_trades"):
-                trades_df = result._trades
-            elif isinstance(result, dict) and "_trades" in result:
-                trades_df = result["_trades"]
-
-            if trades_df is not None and not trades_df.empty:
-                total_trades = len(trades_df)
-                profit_trades = (trades_df["PnL"] > 0).sum()
-                loss_trades = (trades_df["PnL"] <= 0).sum()
-                max_investment = (trades_df["Size"] * trades_df["EntryPrice"]).max()
-                win_rate = (
-                    (profit_trades / total_trades * 100) if total_trades > 0 else 0
+            if intrabar:
+                params["intrabar"] = True
+            params.update(strategy_params)
+            # 작업 API로 제출한 실행과 같은 결과 캐시/실행 기록 키를 쓰도록 정리
+            params = normalize_params(params)
+            # BACKTEST_PROFILE_DIR를 지정하면 실행마다 cProfile 결과(.prof)를 남김
+            profile_dir = os.environ.get("BACKTEST_PROFILE_DIR")
+            profile_path = None
+            if measure_timings and profile_dir:
+                stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                profile_path = os.path.join(
+                    profile_dir, f"{params['ticker']}_{params['interval']}_{stamp}.prof"
                 )
+            if BACKTEST_API_URL:
+                timings = None
+                result, from_cache = run_remote_backtest(params)
             else:
-                total_trades = profit_trades = loss_trades = max_investment = (
-                    win_rate
-                ) = 0
-
-            st.session_state["result"] = result
-            st.session_state["trades_df"] = trades_df
-            st.session_state["win_rate"] = win_rate
-            st.session_state["max_investment"] = max_investment
-            st.session_state["total_trades"] = total_trades
-            st.session_state["profit_trades"] = profit_trades
-            st.session_state["loss_trades"] = loss_trades
-            st.session_state["ticker"] = ticker
+                with st.spinner("백테스트 실행 중…"):
+                    timing = profile(profile_path) if measure_timings else nullcontext()
+                    with timing as timings:
+                        df = get_ohlcv(params["ticker"], params["interval"], params["days"])
+                        with stage("result_cache"):
+                            cache_key = result_key(params, df)
+                            result_cache = get_result_cache()
+                            result = result_cache.get(cache_key)
+                        from_cache = result is not None
+                        if not from_cache:
+                            result = run_backtest(params, df=df)
+                            result_cache.put(cache_key, result)
+
+                if not from_cache:
+                    try:
+                        get_run_store().save(params, result)
+                    except Exception as e:
+                        logger.warning(f"실행 기록 저장 실패: {e}")
+
+            remember_result(result, ticker, from_cache, timings, params)
         except Exception as e:
             st.error(f"오류 발생: {str(e)}")
             st.code(traceback.format_exc(), language="python")
 
+# ====== 파라미터 최적화 ======
+with st.expander("🔍 파라미터 최적화"):
+    st.caption(
+        "사이드바의 종목/차트 단위/기간/자본 설정으로 여러 파라미터 조합을 한 번에 평가합니다."
+    )
+    with st.form("optimize_form"):
+        opt_col1, opt_col2, opt_col3 = st.columns(3)
+        with opt_col1:
+            fast_range = st.slider("단기 EMA 범위", 1, 50, (8, 16))
+            fast_step = st.number_input("단기 EMA 간격", 1, 10, 2)
+        with opt_col2:
+            slow_range = st.slider("장기 EMA 범위", 5, 240, (20, 40))
+            slow_step = st.number_input("장기 EMA 간격", 1, 20, 5)
+        with opt_col3:
+            signal_range = st.slider("신호선 기간 범위", 1, 50, (7, 11))
+            signal_step = st.number_input("신호선 기간 간격", 1, 10, 2)
+        opt_col4, opt_col5 = st.columns(2)
+        with opt_col4:
+            tp_range = st.slider("Take Profit 범위 (%)", 0.5, 50.0, (1.0, 5.0), 0.5)
+            tp_step = st.number_input("Take Profit 간격 (%)", 0.5, 10.0, 1.0, 0.5)
+        with opt_col5:
+            sl_range = st.slider("Stop Loss 범위 (%)", 0.5, 50.0, (0.5, 2.0), 0.5)
+            sl_step = st.number_input("Stop Loss 간격 (%)", 0.5, 10.0, 0.5, 0.5)
+        opt_col6, opt_col7, opt_col8 = st.columns(3)
+        with opt_col6:
+            opt_metric = st.selectbox(
+                "정렬 기준",
+                [
+                    "Return [%]",
+                    "Sharpe Ratio",
+                    "Max. Drawdown [%]",
+                    "Win Rate [%]",
+                    "Profit Factor",
+                ],
+            )
+        with opt_col7:
+            opt_method = st.radio("탐색 방식", ["grid", "random"], horizontal=True)
+        with opt_col8:
+            opt_samples = st.number_input("무작위 탐색 횟수", 10, 100_000, 200)
+        optimize_submitted = st.form_submit_button("최적화 실행")
+
+    if optimize_submitted:
+        if not validate_ticker(ticker):
+            st.error("올바른 거래 종목 형식이 아닙니다. (예: BTC, ETH, KRW-BTC)")
+        else:
+            try:
+                from optimizer import optimize
+
+                base_params = {
+                    "ticker": f"KRW-{ticker}",
+                    "interval": selected_interval,
+                    "days": days,
+                    "macd_threshold": macd_threshold,
+                    "min_holding_period": min_holding_period,
+                    "macd_crossover_threshold": macd_crossover_threshold,
+                    "cash": cash,
+                    "commission": 0.0005,
+                    **strategy_params,
+                }
+                param_ranges = {
+                    "fast_period": (fast_range[0], fast_range[1], fast_step),
+                    "slow_period": (slow_range[0], slow_range[1], slow_step),
+                    "signal_period": (signal_range[0], signal_range[1], signal_step),
+                    "take_profit": (tp_range[0] / 100, tp_range[1] / 100, tp_step / 100),
+                    "stop_loss": (sl_range[0] / 100, sl_range[1] / 100, sl_step / 100),
+                }
+                with st.spinner("파라미터 최적화 실행 중…"):
+                    st.session_state["optimize_table"] = optimize(
+                        base_params,
+                        param_ranges,
+                        metric=opt_metric,
+                        method=opt_method,
+                        n_samples=opt_samples,
+                    )
+            except Exception as e:
+                st.error(f"오류 발생: {str(e)}")
+                st.code(traceback.format_exc(), language="python")
+
+    if "optimize_table" in st.session_state:
+        st.dataframe(st.session_state["optimize_table"])
+
+# ====== 여러 종목 일괄 백테스트 ======
+with st.expander("📋 여러 종목 일괄 백테스트"):
+    st.caption(
+        "사이드바의 차트 단위/기간/전략 파라미터를 여러 종목에 똑같이 적용해 순위표를 만듭니다."
+    )
+    with st.form("batch_form"):
+        batch_all_krw = st.checkbox("KRW 마켓 전체")
+        batch_tickers_text = st.text_area(
+            "종목 목록 (쉼표 또는 줄바꿈으로 구분)",
+            value="BTC, ETH, XRP, DOGE, SOL",
+            help="KRW 마켓 전체를 선택하면 이 목록은 무시됩니다.",
+        )
+        batch_metric = st.selectbox(
+            "정렬 기준",
+            ["Return [%]", "Max. Drawdown [%]", "Win Rate [%]", "Sharpe Ratio"],
+            key="batch_metric",
+        )
+        batch_submitted = st.form_submit_button("일괄 백테스트 실행")
+
+    if batch_submitted:
+        try:
+            from batch import krw_tickers, run_batch
+
+            if batch_all_krw:
+                batch_tickers = krw_tickers()
+            else:
+                names = batch_tickers_text.replace("\n", ",").split(",")
+                names = [name.strip().upper() for name in names if name.strip()]
+                invalid = [name for name in names if not validate_ticker(name)]
+                if invalid:
+                    raise ValueError(f"올바르지 않은 종목: {', '.join(invalid)}")
+                batch_tickers = [
+                    name if name.startswith("KRW-") else f"KRW-{name}" for name in names
+                ]
+            if fast_period >= slow_period:
+                raise ValueError("단기 EMA는 장기 EMA보다 작아야 합니다.")
+            batch_params = {
+                "interval": selected_interval,
+                "days": days,
+                "fast_period": fast_period,
+                "slow_period": slow_period,
+                "signal_period": signal_period,
+                "take_profit": take_profit,
+                "stop_loss": stop_loss,
+                "macd_threshold": macd_threshold,
+                "min_holding_period": min_holding_period,
+                "macd_crossover_threshold": macd_crossover_threshold,
+                "cash": cash,
+                "commission": 0.0005,
+                **strategy_params,
+            }
+            progress_bar = st.progress(0.0, text="일괄 백테스트 실행 중…")
+            st.session_state["batch_table"] = run_batch(
+                batch_tickers,
+                batch_params,
+                metric=batch_metric,
+                progress=lambda done, total: progress_bar.progress(
+                    done / total, text=f"{done}/{total} 종목 완료"
+                ),
+            )
+        except Exception as e:
+            st.error(f"오류 발생: {str(e)}")
+            st.code(traceback.format_exc(), language="python")
+
+    if "batch_table" in st.session_state:
+        # 표 머리글을 누르면 원하는 지표로 다시 정렬할 수 있음
+        st.dataframe(st.session_state["batch_table"], hide_index=True)
+
+# ====== 지난 실행 기록 ======
+with st.expander("🗂️ 지난 실행 기록"):
+    history_col1, history_col2, history_col3, history_col4 = st.columns(4)
+    with history_col1:
+        history_ticker = st.text_input("종목 (비우면 전체)", value=ticker, key="history_ticker")
+    with history_col2:
+        history_interval_name = st.selectbox(
+            "차트 단위",
+            ["전체", *interval_options.keys()],
+            key="history_interval",
+        )
+    with history_col3:
+        history_metric = st.selectbox("정렬 기준", list(METRIC_COLUMNS), key="history_metric")
+    with history_col4:
+        history_limit = st.number_input("개수", 1, 500, 20, key="history_limit")
+
+    history_ticker = history_ticker.strip().upper()
+    if history_ticker and not history_ticker.startswith("KRW-"):
+        history_ticker = f"KRW-{history_ticker}"
+    try:
+        history = get_run_store().top(
+            ticker=history_ticker or None,
+            interval=interval_options.get(history_interval_name),
+            metric=history_metric,
+            limit=history_limit,
+        )
+    except Exception as e:
+        history = None
+        st.error(f"실행 기록 조회 실패: {str(e)}")
+
+    if history is not None and not history.empty:
+        st.dataframe(history.drop(columns=["params"]), hide_index=True)
+        history_id = st.selectbox("불러올 실행 번호", history["id"].tolist())
+        if st.button("결과 불러오기"):
+            stored = get_run_store().load(int(history_id))
+            if stored is None:
+                st.error("저장된 결과를 찾을 수 없습니다.")
+            else:
+                stored_ticker = history.loc[history["id"] == history_id, "ticker"].iloc[0]
+                remember_result(
+                    stored,
+                    stored_ticker.removeprefix("KRW-"),
+                    params=get_run_store().params(int(history_id)),
+                )
+                st.caption(f"실행 #{history_id} 결과를 다시 계산하지 않고 불러왔습니다.")
+    elif history is not None:
+        st.write("저장된 실행 기록 없음")
+
 # ====== 결과 표시 (세션 상태에 있을 때 항상 표시) ======
 if (
     "result" in st.session_state
@@ -245,6 +591,8 @@ if (
     )
 
     st.subheader(f"📊 백테스트 결과 < {ticker} >")
+    if st.session_state.get("from_cache"):
+        st.caption("⚡ 같은 설정/데이터의 저장된 결과를 불러왔습니다.")
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric(
@@ -274,6 +622,66 @@ if (
     with col6:
         st.metric("손실 거래", f"{loss_trades:,}")
 
+    equity_curve = result.get("_equity_curve")
+    if equity_curve is not None and len(equity_curve) > 1:
+        with st.expander("📈 차트", expanded=True):
+            from charts import equity_chart, price_chart
+
+            chart_col1, chart_col2 = st.columns([3, 1])
+            times = equity_curve.index
+            with chart_col1:
+                chart_start, chart_end = st.slider(
+                    "표시 구간",
+                    min_value=times[0].to_pydatetime(),
+                    max_value=times[-1].to_pydatetime(),
+                    value=(times[0].to_pydatetime(), times[-1].to_pydatetime()),
+                    step=(times[1] - times[0]).to_pytimedelta(),
+                    format="YYYY-MM-DD HH:mm",
+                    help="구간을 좁히면 그 구간만 다시 줄여서 더 자세히 그립니다.",
+                )
+            with chart_col2:
+                chart_method_name = st.radio(
+                    "점 줄이는 방식",
+                    ["LTTB", "구간 최소/최대"],
+                    help="수십만 개 봉을 모양을 유지하는 수천 개 점으로 줄여 그립니다.",
+                )
+            chart_method = "lttb" if chart_method_name == "LTTB" else "minmax"
+            chart_params = st.session_state.get("params")
+            rendered = 0
+            if chart_params:
+                try:
+                    chart_key = (
+                        json.dumps(chart_params, sort_keys=True, default=str),
+                        times[0].isoformat(),
+                        times[-1].isoformat(),
+                    )
+                    if BACKTEST_API_URL:
+                        chart_df, chart_spec, chart_indicators = load_remote_chart_data(
+                            *chart_key,
+                            chart_start.isoformat(),
+                            chart_end.isoformat(),
+                            chart_method,
+                        )
+                    else:
+                        chart_df, chart_spec, chart_indicators = load_chart_data(*chart_key)
+                    chart, n_points = price_chart(
+                        chart_df,
+                        chart_indicators,
+                        chart_spec,
+                        trades_df,
+                        chart_start,
+                        chart_end,
+                        chart_method,
+                    )
+                    st.altair_chart(chart, use_container_width=True)
+                    rendered += n_points
+                except Exception as e:
+                    st.warning(f"가격 차트를 그리지 못했습니다: {e}")
+            chart, n_points = equity_chart(equity_curve, chart_start, chart_end, chart_method)
+            st.altair_chart(chart, use_container_width=True)
+            rendered += n_points
+            st.caption(f"원본 {len(times):,}봉 → {rendered:,}개 점")
+
     # 거래 내역 표시
     with st.expander("전체 거래 내역"):
         if trades_df is not None and not trades_df.empty:
@@ -314,6 +722,73 @@ if (
         else:
             st.write("손실 거래 내역 없음")
 
+    with st.expander("🎲 몬테카를로 분석"):
+        mc_col1, mc_col2, mc_col3 = st.columns(3)
+        with mc_col1:
+            mc_method_name = st.selectbox(
+                "방식",
+                ["거래 복원 추출", "거래 순서 섞기", "자산 곡선 블록 추출"],
+                help="블록 추출은 봉별 자산 수익률을 구간 단위로 다시 뽑아 연속 손익의 뭉침을 유지합니다.",
+            )
+        with mc_col2:
+            mc_sims = st.number_input("시뮬레이션 횟수", 100, 100_000, 10_000, 1000)
+        with mc_col3:
+            mc_ruin = st.number_input("파산 기준 (초기 자본 대비 %)", 1, 99, 50)
+        mc_use_pnl = st.checkbox("수익률 대신 손익(원)을 더해서 계산", value=False)
+        if st.button("몬테카를로 실행"):
+            from robustness import monte_carlo
+
+            method = {
+                "거래 복원 추출": "bootstrap",
+                "거래 순서 섞기": "permute",
+                "자산 곡선 블록 추출": "block",
+            }[mc_method_name]
+            try:
+                equity_values = (
+                    equity_curve["Equity"].to_numpy() if equity_curve is not None else None
+                )
+                initial_cash = (
+                    float(equity_values[0])
+                    if equity_values is not None
+                    else float(end_value) / (1 + float(return_pct) / 100)
+                )
+                started = time.perf_counter()
+                st.session_state["monte_carlo"] = monte_carlo(
+                    trades_df,
+                    cash=initial_cash,
+                    n_sims=int(mc_sims),
+                    method=method,
+                    use_pnl=mc_use_pnl,
+                    equity=equity_values,
+                    ruin_fraction=mc_ruin / 100,
+                )
+                st.session_state["monte_carlo_seconds"] = time.perf_counter() - started
+            except ValueError as e:
+                st.error(str(e))
+        mc = st.session_state.get("monte_carlo")
+        if mc is not None:
+            st.caption(
+                f"{len(mc['final_equity']):,}회 계산 ({st.session_state['monte_carlo_seconds']:.2f}초)"
+            )
+            mc_m1, mc_m2, mc_m3 = st.columns(3)
+            with mc_m1:
+                st.metric("최종 자산 중앙값", f"{np.median(mc['final_equity']):,.0f}원")
+            with mc_m2:
+                st.metric("최대 낙폭 중앙값", f"{np.median(mc['max_drawdown']):.2f}%")
+            with mc_m3:
+                st.metric("파산 확률", f"{mc['ruin_probability'] * 100:.2f}%")
+            st.dataframe(mc["summary"].style.format("{:,.2f}"))
+            st.line_chart(pd.DataFrame(mc["paths"].T), height=250)
+            hist_col1, hist_col2 = st.columns(2)
+            with hist_col1:
+                st.caption("최종 자산 분포")
+                counts, edges = np.histogram(mc["final_equity"], bins=50)
+                st.bar_chart(pd.Series(counts, index=np.round(edges[:-1], 0)))
+            with hist_col2:
+                st.caption("최대 낙폭 분포 (%)")
+                counts, edges = np.histogram(mc["max_drawdown"], bins=50)
+                st.bar_chart(pd.Series(counts, index=np.round(edges[:-1], 2)))
+
     st.write("---")
 
     col7, col8, col9 = st.columns(3)
@@ -351,5 +826,40 @@ if (
     with col12:
         st.metric("백테스트 기간", f"{duration_str}")
 
+    timings_df = st.session_state.get("timings")
+    if timings_df is not None and not timings_df.empty:
+        with st.expander("⏱️ 단계별 소요 시간"):
+            view = timings_df.copy()
+            view["stage"] = [
+                "\u3000" * depth + name.rsplit("/", 1)[-1]
+                for depth, name in zip(view["depth"], view["stage"])
+            ]
+            view["ms"] = view["seconds"] * 1000
+            view["share"] = view["share"] * 100
+            st.dataframe(
+                view[["stage", "calls", "ms", "share", "requests", "rows", "bytes"]].rename(
+                    columns={
+                        "stage": "단계",
+                        "calls": "호출 수",
+                        "ms": "소요 시간 (ms)",
+                        "share": "비중 (%)",
+                        "requests": "API 요청 수",
+                        "rows": "행 수",
+                        "bytes": "바이트",
+                    }
+                ),
+                hide_index=True,
+            )
+            if st.session_state.get("profile_path"):
+                st.caption(f"cProfile 결과: {st.session_state['profile_path']}")
+
     with st.expander("상세 통계 보기"):
         st.write(result)
+        from indicator_cache import cache_stats
+
+        cache_info = cache_stats()
+        st.caption(
+            f"지표 캐시: 적중 {cache_info['hits']}회 / 미적중 {cache_info['misses']}회 "
+            f"(적중률 {cache_info['hit_rate'] * 100:.1f}%, "
+            f"{cache_info['bytes'] / 1024 / 1024:.1f}MB)"
+        )
@@ -1,34 +1,74 @@
-from backtesting import Backtest  # type: ignore
 import logging
 import traceback
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
+from profiling import stage
+
 logger = logging.getLogger(__name__)
 
 
-def run_backtest(params: dict):
+def normalize_params(params: dict) -> dict:
+    """제출 경로(앱/작업 API)와 관계없이 같은 백테스트면 같은 dict가 되도록 정리
+
+    결과 캐시/중복 작업 키와 실행 기록이 이 dict로 만들어짐. 실행 설정과 전략이
+    쓰는 파라미터만 남기고(빠진 값은 전략 기본값), 숫자는 기본값과 같은 형식으로
+    맞추며, 꺼진 옵션(intrabar=False)과 기본 전략 이름은 뺌.
+    """
+    from signal_strategy import DEFAULT_STRATEGY, get_strategy
+
+    spec = get_strategy(params.get("strategy"))
+    normalized = {
+        "ticker": params["ticker"],
+        "interval": params["interval"],
+        "days": int(params["days"]),
+        "cash": float(params["cash"]),
+        "commission": float(params["commission"]),
+        "engine": params.get("engine") or "backtesting",
+    }
+    if params.get("intrabar"):
+        normalized["intrabar"] = True
+    if spec.name != DEFAULT_STRATEGY:
+        normalized["strategy"] = spec.name
+    for name, value in spec.resolve_params(params).items():
+        default = spec.params[name]
+        if isinstance(default, (int, float)) and not isinstance(default, bool):
+            value = type(default)(value)
+        normalized[name] = value
+    return normalized
+
+
+def run_backtest(params: dict, df=None):
     logger.info("백테스트 시작")
     try:
         from data_collector import get_ohlcv
-        from strategy_v2 import MACDStrategy
+        from signal_strategy import backtesting_strategy, get_strategy
 
-        df = get_ohlcv(params["ticker"], params["interval"], params["days"])
+        # 이미 받아 둔 데이터가 있으면 그대로 사용 (최적화 등에서 재사용)
+        if df is None:
+            df = get_ohlcv(params["ticker"], params["interval"], params["days"])
         logger.info(f"백테스트 데이터 크기: {df.shape}")
 
-        # 모든 파라미터를 클래스 변수로 전달
-        class CustomStrategy(MACDStrategy):
-            fast_period = params["fast_period"]
-            slow_period = params["slow_period"]
-            signal_period = params["signal_period"]
-            take_profit = params["take_profit"]
-            stop_loss = params["stop_loss"]
-            macd_threshold = params["macd_threshold"]
-            min_holding_period = params.get("min_holding_period", 2)
-            macd_crossover_threshold = params.get("macd_crossover_threshold", 0.0)
+        if params.get("intrabar") and params.get("engine") != "vector":
+            raise ValueError("분봉 내 익절/손절 판정은 벡터 엔진에서만 사용할 수 있습니다.")
+
+        if params.get("engine") == "vector":
+            from vector_engine import run_vector_backtest
+
+            # 익절/손절을 봉 안의 1분봉으로 판단 (1분봉 캐시 재사용)
+            minute1 = None
+            if params.get("intrabar"):
+                minute1 = get_ohlcv(params["ticker"], "minute1", params["days"])
+            with stage("backtest"):
+                stats = run_vector_backtest(df, params, minute1)
+            logger.info("백테스트 완료 (벡터 엔진)")
+            return stats
+
+        from backtesting import Backtest  # type: ignore
+
+        # 전략이 쓰는 파라미터를 모두 클래스 변수로 전달
+        spec = get_strategy(params.get("strategy"))
+        CustomStrategy = type(
+            "CustomStrategy", (backtesting_strategy(spec),), spec.resolve_params(params)
+        )
 
         bt = Backtest(
             df,
@@ -36,7 +76,10 @@ def run_backtest(params: dict):
             cash=params["cash"],
             commission=params["commission"],
         )
-        stats = bt.run()
+        # backtesting.py는 봉 반복과 통계 계산을 한 번에 하므로 지표 외에는 나눌 수 없음
+        with stage("backtest") as s:
+            stats = bt.run()
+            s.add(rows=len(df))
         logger.info("백테스트 완료")
         return stats
     except Exception as e:
@@ -0,0 +1,132 @@
+import logging
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from multiprocessing import get_context
+from typing import Callable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 순위표에 보여줄 지표
+LEADERBOARD_METRICS = [
+    "Return [%]",
+    "Buy & Hold Return [%]",
+    "Max. Drawdown [%]",
+    "Win Rate [%]",
+    "# Trades",
+    "Sharpe Ratio",
+    "Equity Final [$]",
+]
+
+
+def krw_tickers() -> list:
+    """업비트 원화(KRW) 마켓 전체 종목"""
+    import pyupbit  # type: ignore
+
+    tickers = pyupbit.get_tickers(fiat="KRW")
+    if not tickers:
+        raise ValueError("KRW 마켓 목록을 가져오지 못했습니다.")
+    return list(tickers)
+
+
+def _init_worker() -> None:
+    import backtest_runner
+
+    # 종목마다 남는 INFO 로그는 생략
+    logging.getLogger(backtest_runner.__name__).setLevel(logging.WARNING)
+
+
+def _evaluate(params: dict, df: pd.DataFrame) -> dict:
+    from backtest_runner import run_backtest
+
+    stats = run_backtest(params, df=df)
+    return {metric: stats.get(metric) for metric in LEADERBOARD_METRICS}
+
+
+def run_batch(
+    tickers: list,
+    params: dict,
+    metric: str = "Return [%]",
+    fetch_workers: int = 4,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> pd.DataFrame:
+    """같은 파라미터로 여러 종목을 백테스트해 metric 기준 순위표를 반환
+
+    데이터 수집은 스레드 풀에서, 시뮬레이션은 프로세스 풀에서 실행하고 먼저
+    받아진 종목부터 바로 시뮬레이션에 넘겨 수집과 계산이 겹치도록 함.
+    max_workers가 1이면 시뮬레이션은 별도 스레드 하나에서 실행함.
+    progress(완료 종목 수, 전체 종목 수)는 호출한 스레드에서 불림.
+    """
+    from data_collector import get_ohlcv
+
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        raise ValueError("백테스트할 종목이 없습니다.")
+    # 일괄 실행은 결과가 같은 벡터 엔진을 기본으로 사용
+    base = {"engine": "vector", **params}
+    max_workers = max_workers or os.cpu_count() or 1
+    logger.info(
+        f"일괄 백테스트 시작: {len(tickers)}개 종목, 수집 {fetch_workers}개/계산 {max_workers}개 워커"
+    )
+
+    rows = {}
+    finished = 0
+    if max_workers > 1:
+        sim_executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+        )
+    else:
+        sim_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-sim")
+    try:
+        with ThreadPoolExecutor(
+            max_workers=fetch_workers, thread_name_prefix="batch-fetch"
+        ) as fetch_executor:
+            pending = {
+                fetch_executor.submit(
+                    get_ohlcv, ticker, base["interval"], base["days"]
+                ): ("fetch", ticker)
+                for ticker in tickers
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, ticker = pending.pop(future)
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        logger.warning(f"{ticker} 일괄 백테스트 실패: {e}")
+                        rows.setdefault(ticker, {"bars": None})["error"] = str(e)
+                    else:
+                        if kind == "simulate":
+                            rows[ticker].update(value)
+                        elif value is None or value.empty:
+                            rows[ticker] = {"bars": 0, "error": "데이터 없음"}
+                        else:
+                            # 받은 종목은 바로 시뮬레이션으로 넘기고 나머지 수집은 계속
+                            rows[ticker] = {"bars": len(value), "error": None}
+                            run_params = {**base, "ticker": ticker}
+                            future = sim_executor.submit(_evaluate, run_params, value)
+                            pending[future] = ("simulate", ticker)
+                            continue
+                    finished += 1
+                    if progress is not None:
+                        progress(finished, len(tickers))
+    finally:
+        sim_executor.shutdown(cancel_futures=True)
+
+    table = pd.DataFrame.from_dict(rows, orient="index").reindex(
+        columns=[*LEADERBOARD_METRICS, "bars", "error"]
+    )
+    table.index.name = "ticker"
+    table = table.sort_values(metric, ascending=False, na_position="last")
+    logger.info("일괄 백테스트 완료")
+    return table.reset_index()
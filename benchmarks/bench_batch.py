@@ -0,0 +1,81 @@
+"""여러 종목 일괄 백테스트 벤치마크 (캐시가 채워진 상태에서 시작)
+
+    python -m benchmarks.bench_batch --tickers 100 --interval minute30 --days 90
+
+종목마다 랜덤워크 1분봉을 임시 캐시에 미리 저장해 두고 run_batch 실행 시간을
+측정함. 캐시 이후의 최신 구간은 가짜 업비트 API가 채움.
+"""
+import argparse
+import logging
+import tempfile
+import time
+
+import pandas as pd
+
+import data_collector
+from batch import run_batch
+from benchmarks.fake_upbit import FakeUpbit
+from benchmarks.synthetic import random_walk_ohlcv
+from fetcher import PageFetcher, TokenBucket
+from ohlcv_store import OHLCVStore
+
+PARAMS = {
+    "fast_period": 12,
+    "slow_period": 26,
+    "signal_period": 9,
+    "take_profit": 0.03,
+    "stop_loss": 0.01,
+    "macd_threshold": 0.0,
+    "min_holding_period": 2,
+    "macd_crossover_threshold": 0.0,
+    "cash": 1_000_000,
+    "commission": 0.0005,
+}
+
+
+def _warm_store(tickers: list, days: int) -> OHLCVStore:
+    store = OHLCVStore(tempfile.mkdtemp(prefix="bench-batch-"))
+    end = pd.Timestamp(data_collector._now_kst()).floor("min")
+    n_bars = days * 1440 + 1
+    start = end - pd.Timedelta(minutes=n_bars - 1)
+    for i, ticker in enumerate(tickers):
+        store.save(ticker, "minute1", random_walk_ohlcv(n_bars, seed=i, start=start))
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--interval", default="minute30")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--fetch-workers", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=None, help="시뮬레이션 프로세스 수")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    tickers = [f"KRW-B{i:03d}" for i in range(args.tickers)]
+    started = time.perf_counter()
+    data_collector._store = _warm_store(tickers, args.days)
+    print(f"캐시 준비: {time.perf_counter() - started:.1f}s")
+    data_collector.set_fetcher(
+        PageFetcher(FakeUpbit(latency=0, quota=10**9).get_ohlcv, limiter=TokenBucket(rate=1e9))
+    )
+
+    started = time.perf_counter()
+    table = run_batch(
+        tickers,
+        {**PARAMS, "interval": args.interval, "days": args.days},
+        fetch_workers=args.fetch_workers,
+        max_workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+    print(table.head(10).to_string(index=False))
+    failed = table["error"].notna().sum()
+    print(
+        f"{len(table)}개 종목 ({args.interval}, {args.days}일) {elapsed:.1f}s, "
+        f"종목당 {elapsed / len(table) * 1000:.0f}ms, 실패 {failed}개"
+    )
+
+
+if __name__ == "__main__":
+    main()
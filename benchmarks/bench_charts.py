@@ -0,0 +1,66 @@
+"""차트 점 수/전송량/생성 시간이 백테스트 길이와 관계없이 일정한지 확인
+
+    python -m benchmarks.bench_charts --bars 10000 100000 525600
+
+벡터 엔진 결과로 가격(+MACD, 거래 표시)과 자산/낙폭 차트를 만들고, 전체
+구간과 좁힌 구간(마지막 1일)에서 그린 점 수와 Vega-Lite JSON 크기를 잼.
+"""
+import argparse
+import time
+
+from benchmarks.synthetic import random_walk_ohlcv
+from charts import equity_chart, price_chart
+from downsample import MAX_POINTS
+from signal_strategy import compute_indicators, get_strategy
+from vector_engine import run_vector_backtest
+
+PARAMS = dict(
+    fast_period=12,
+    slow_period=26,
+    signal_period=9,
+    take_profit=0.01,
+    stop_loss=0.005,
+    macd_threshold=0.0,
+    min_holding_period=2,
+    cash=1_000_000,
+    commission=0.0005,
+)
+
+
+def render(df, spec, indicators, result, method, start=None, end=None) -> tuple:
+    """(점 수, JSON 바이트 수, 소요 시간)"""
+    started = time.perf_counter()
+    price, price_points = price_chart(
+        df, indicators, spec, result._trades, start, end, method
+    )
+    equity, equity_points = equity_chart(result._equity_curve, start, end, method)
+    payload = len(price.to_json()) + len(equity.to_json())
+    return price_points + equity_points, payload, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, nargs="+", default=[10_000, 100_000, 525_600])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    spec = get_strategy()
+    for bars in args.bars:
+        df = random_walk_ohlcv(bars, seed=args.seed)
+        result = run_vector_backtest(df, PARAMS)
+        indicators = compute_indicators(spec, {"Close": df["Close"].to_numpy()}, PARAMS)
+        for method in ("lttb", "minmax"):
+            points, payload, elapsed = render(df, spec, indicators, result, method)
+            zoom_points, _, zoom_elapsed = render(
+                df, spec, indicators, result, method, df.index[-1440], df.index[-1]
+            )
+            assert points <= MAX_POINTS and zoom_points <= MAX_POINTS
+            print(
+                f"{bars:>8,}봉 {method:<6} 점 {points:>5,}개  JSON {payload / 1024:7.1f}KB  "
+                f"{elapsed * 1000:6.1f}ms  (마지막 1일: 점 {zoom_points:>5,}개 "
+                f"{zoom_elapsed * 1000:6.1f}ms)  거래 {len(result._trades):,}건"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""명령줄 실행기(cli.py)의 시작부터 첫 결과까지 걸리는 시간 (데이터가 캐시된 경우)
+
+    python -m benchmarks.bench_cli --runs 20 --jobs 1
+
+가짜 API로 임시 저장소에 캔들을 미리 받아 둔 뒤 cli.py를 새 프로세스로
+실행해 첫 줄/마지막 줄이 나온 시각을 재고, pandas를 불러오기만 하는
+프로세스의 시간(하한)과 비교함. 기본 벡터 엔진은 backtesting.py를 불러오지 않음.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import data_collector
+from benchmarks.fake_upbit import FakeUpbit
+from fetcher import PageFetcher, TokenBucket
+from ohlcv_store import OHLCVStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TICKERS = ("KRW-AAA", "KRW-BBB", "KRW-CCC")
+
+
+def seed_store(root: str, interval: str, days: int) -> None:
+    fake = FakeUpbit(latency=0, quota=10**9)
+    data_collector.set_fetcher(
+        PageFetcher(fake.get_ohlcv, max_workers=1, limiter=TokenBucket(rate=1e9))
+    )
+    data_collector._store = OHLCVStore(root)
+    for ticker in TICKERS:
+        data_collector.get_ohlcv(ticker, interval, days)
+
+
+def timed_lines(command: list, env: dict) -> tuple:
+    """(첫 줄까지 시간, 전체 시간, 줄 목록)"""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        command, cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    first, lines = None, []
+    for line in proc.stdout:
+        if first is None:
+            first = time.perf_counter() - started
+        lines.append(json.loads(line))
+    proc.wait()
+    return first, time.perf_counter() - started, lines
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--interval", default="minute30")
+    parser.add_argument("--days", type=int, default=90)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        seed_store(root, args.interval, args.days)
+        params_path = os.path.join(root, "runs.json")
+        with open(params_path, "w") as f:
+            json.dump(
+                [
+                    {
+                        "ticker": TICKERS[i % len(TICKERS)],
+                        "fast_period": 8 + i % 8,
+                        "interval": args.interval,
+                        "days": args.days,
+                    }
+                    for i in range(args.runs)
+                ],
+                f,
+            )
+        env = {**os.environ, "OHLCV_STORE_DIR": root}
+
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import pandas"], check=True)
+        floor = time.perf_counter() - started
+
+        first, total, lines = timed_lines(
+            [sys.executable, "cli.py", params_path, "--offline", "--jobs", str(args.jobs)], env
+        )
+        errors = [line["error"] for line in lines if "error" in line]
+        assert len(lines) == args.runs and not errors, errors
+        print(
+            f"실행 {args.runs}개 (jobs={args.jobs}): 첫 결과 {first:.2f}s, 전체 {total:.2f}s  "
+            f"(pandas 불러오기만: {floor:.2f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""backtesting.py 엔진과 벡터 엔진의 결과 일치 여부 및 속도 비교
+
+    python -m benchmarks.bench_engine --bars 500000
+
+두 엔진 모두 signal_strategy의 같은 선언에서 만들어지므로, 먼저 두 엔진의 거래가
+처음 전략(strategy.py / strategy_v2.py) 코드로 뽑아 고정해 둔 거래 목록
+(fixtures/baseline_trades.csv, benchmarks.pin_baseline_trades로 생성)과 같은지 확인함.
+"""
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from backtesting import Backtest  # type: ignore
+
+from backtest_runner import run_backtest
+from benchmarks.synthetic import random_walk_ohlcv
+from strategy_v2 import MACDStrategy
+from vector_engine import run_vector_backtest
+
+TRADE_COLUMNS = [
+    "Size",
+    "EntryBar",
+    "ExitBar",
+    "EntryPrice",
+    "ExitPrice",
+    "PnL",
+    "ReturnPct",
+    "EntryTime",
+    "ExitTime",
+    "Duration",
+]
+STAT_KEYS = ["Return [%]", "Max. Drawdown [%]", "Equity Final [$]", "# Trades"]
+
+PARAM_SETS = [
+    dict(min_holding_period=2, macd_crossover_threshold=0.0, take_profit=0.03, stop_loss=0.01),
+    dict(min_holding_period=0, macd_crossover_threshold=0.0, take_profit=0.003, stop_loss=0.002),
+    dict(min_holding_period=5, macd_crossover_threshold=0.01, take_profit=0.01, stop_loss=0.005),
+]
+
+BASE_PARAMS = dict(
+    fast_period=12,
+    slow_period=26,
+    signal_period=9,
+    macd_threshold=0.0,
+    cash=1_000_000,
+    commission=0.0005,
+)
+
+# 고정 거래 목록: 이름 -> (처음 전략 파일, 등록된 전략 이름, 파라미터)
+BASELINE_TRADES = os.path.join(os.path.dirname(__file__), "fixtures", "baseline_trades.csv")
+BASELINE_BARS = 20_000
+BASELINE_SEED = 1
+BASELINE_CASES = {
+    "v1": ("strategy.py", "macd_v1", dict(take_profit=0.05, stop_loss=0.03)),
+    **{
+        f"v2_{k}": ("strategy_v2.py", "macd_v2", overrides)
+        for k, overrides in enumerate(PARAM_SETS)
+    },
+}
+PINNED_COLUMNS = ["Size", "EntryBar", "ExitBar", "EntryPrice", "ExitPrice", "PnL"]
+
+
+def check_baseline() -> int:
+    """두 엔진의 거래가 처음 전략으로 고정해 둔 거래 목록과 같은지 확인 (확인한 거래 수)"""
+    df = random_walk_ohlcv(BASELINE_BARS, seed=BASELINE_SEED)
+    pinned = pd.read_csv(BASELINE_TRADES)
+    checked = 0
+    for case, (_, strategy, overrides) in BASELINE_CASES.items():
+        expected = pinned[pinned["case"] == case][PINNED_COLUMNS].reset_index(drop=True)
+        for engine in ("backtesting", "vector"):
+            params = {**BASE_PARAMS, **overrides, "strategy": strategy, "engine": engine}
+            actual = run_backtest(params, df=df)._trades[PINNED_COLUMNS].reset_index(drop=True)
+            pd.testing.assert_frame_equal(
+                expected, actual, check_dtype=False, rtol=1e-9, obj=f"{case} {engine}"
+            )
+        checked += len(expected)
+    return checked
+
+
+def check_parity(df: pd.DataFrame, params: dict) -> tuple:
+    class CustomStrategy(MACDStrategy):
+        fast_period = params["fast_period"]
+        slow_period = params["slow_period"]
+        signal_period = params["signal_period"]
+        take_profit = params["take_profit"]
+        stop_loss = params["stop_loss"]
+        macd_threshold = params["macd_threshold"]
+        min_holding_period = params["min_holding_period"]
+        macd_crossover_threshold = params["macd_crossover_threshold"]
+
+    started = time.perf_counter()
+    expected = Backtest(
+        df, CustomStrategy, cash=params["cash"], commission=params["commission"]
+    ).run()
+    reference_time = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = run_vector_backtest(df, params)
+    vector_time = time.perf_counter() - started
+
+    pd.testing.assert_frame_equal(
+        expected._trades[TRADE_COLUMNS].reset_index(drop=True),
+        actual._trades[TRADE_COLUMNS].reset_index(drop=True),
+    )
+    np.testing.assert_allclose(
+        expected._equity_curve["Equity"].values, actual._equity_curve["Equity"].values
+    )
+    for key in STAT_KEYS:
+        assert np.isclose(expected[key], actual[key]), (key, expected[key], actual[key])
+    return reference_time, vector_time, len(actual._trades)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=500_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    print(f"처음 전략으로 고정한 거래 {check_baseline()}건과 두 엔진 일치")
+    df = random_walk_ohlcv(args.bars, seed=args.seed)
+    for overrides in PARAM_SETS:
+        reference_time, vector_time, n_trades = check_parity(df, {**BASE_PARAMS, **overrides})
+        print(
+            f"{overrides}  거래 {n_trades}건 일치  "
+            f"backtesting.py {reference_time:.2f}s / 벡터 {vector_time:.3f}s "
+            f"({reference_time / vector_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
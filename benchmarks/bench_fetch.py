@@ -0,0 +1,118 @@
+"""순차 vs 병렬 캔들 다운로드 벤치마크 (가짜 업비트 API 사용)
+
+    python -m benchmarks.bench_fetch --interval minute1 --days 365 --time-scale 0.1
+
+time-scale은 지연 시간과 요청 제한을 같은 비율로 줄여서 실행 시간만 단축함
+(속도 향상 비율은 그대로 유지).
+
+    python -m benchmarks.bench_fetch --days 365 --listed-days 30
+
+listed-days를 주면 그만큼 전에 상장된 종목을 받아 봄. 상장 이전 빈 페이지를
+pyupbit처럼 실패(None)로 받을 때와 비교함. 마지막으로 없는 종목을 요청했을 때
+재시도 없이 바로 오류가 나는지 확인함.
+"""
+import argparse
+import tempfile
+import time
+from datetime import timedelta
+
+import data_collector
+from benchmarks.fake_upbit import FakeUpbit
+from fetcher import PageFetcher, TokenBucket, UPBIT_QUOTA_PER_SEC
+from ohlcv_store import OHLCVStore
+
+
+def _as_pyupbit(fetch_fn):
+    """빈 페이지를 None으로 바꿈 (pyupbit.get_ohlcv는 429와 빈 응답 모두 None)"""
+
+    def fetch(*args, **kwargs):
+        df = fetch_fn(*args, **kwargs)
+        return None if df.empty else df
+
+    return fetch
+
+
+def _run(args, max_workers: int, pyupbit_empty: bool = False) -> dict:
+    scale = args.time_scale
+    listed = None
+    if args.listed_days is not None:
+        listed = data_collector._now_kst() - timedelta(days=args.listed_days)
+    fake = FakeUpbit(
+        latency=args.latency * scale,
+        quota=int(UPBIT_QUOTA_PER_SEC / scale),
+        window=1.0,
+        listed=listed,
+    )
+    limiter = TokenBucket(rate=UPBIT_QUOTA_PER_SEC / scale)
+    fetcher = PageFetcher(
+        _as_pyupbit(fake.get_ohlcv) if pyupbit_empty else fake.get_ohlcv,
+        max_workers=max_workers,
+        limiter=limiter,
+        backoff=0.2 * scale,
+    )
+    data_collector.set_fetcher(fetcher)
+    data_collector._store = OHLCVStore(tempfile.mkdtemp(prefix="bench-fetch-"))
+    started = time.perf_counter()
+    df = data_collector.get_ohlcv("KRW-BENCH", args.interval, args.days)
+    elapsed = (time.perf_counter() - started) / scale
+    fetcher.shutdown()
+    return {
+        "label": "빈 페이지=실패" if pyupbit_empty else "",
+        "workers": max_workers,
+        "rows": len(df),
+        "requests": fetcher.request_count,
+        "retries": fetcher.retry_count,
+        "rejected": fake.rejected,
+        "seconds": elapsed,
+    }
+
+
+def _run_unknown(args) -> dict:
+    """없는 종목(404)은 남은 커서를 요청하지 않고 바로 실패해야 함"""
+    fake = FakeUpbit(latency=0, quota=10**9, markets={"KRW-BENCH"})
+    fetcher = PageFetcher(fake.get_ohlcv, max_workers=args.workers, limiter=TokenBucket(rate=1e9))
+    data_collector.set_fetcher(fetcher)
+    data_collector._store = OHLCVStore(tempfile.mkdtemp(prefix="bench-fetch-"))
+    started = time.perf_counter()
+    try:
+        data_collector.get_ohlcv("KRW-TYPO", args.interval, args.days)
+    except Exception as e:
+        error = e
+    else:
+        raise AssertionError("없는 종목인데 오류가 나지 않음")
+    elapsed = time.perf_counter() - started
+    fetcher.shutdown()
+    assert fake.calls <= args.workers * 2, fake.calls
+    assert data_collector._store.load("KRW-TYPO", args.interval) is None
+    return {"calls": fake.calls, "seconds": elapsed, "error": error}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--interval", default="minute1")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--latency", type=float, default=0.3, help="요청당 왕복 시간(초)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--time-scale", type=float, default=0.1)
+    parser.add_argument("--listed-days", type=int, help="며칠 전에 상장된 종목으로 시험")
+    args = parser.parse_args()
+
+    results = [_run(args, 1), _run(args, args.workers)]
+    if args.listed_days is not None:
+        results.append(_run(args, args.workers, pyupbit_empty=True))
+    for r in results:
+        print(
+            f"workers={r['workers']:>2}  rows={r['rows']:>7}  requests={r['requests']:>5}  "
+            f"retries={r['retries']:>4}  429={r['rejected']:>3}  {r['seconds']:8.1f}s (환산)"
+            f"  {r['label']}"
+        )
+    print(f"속도 향상: {results[0]['seconds'] / results[1]['seconds']:.2f}x")
+    unknown = _run_unknown(args)
+    print(
+        f"없는 종목: 요청 {unknown['calls']}회, {unknown['seconds']:.2f}s 만에 "
+        f"{type(unknown['error']).__name__}: {unknown['error']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
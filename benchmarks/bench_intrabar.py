@@ -0,0 +1,103 @@
+"""봉 안 익절/손절 판정(1분봉)의 정확성과 속도 확인
+
+    python -m benchmarks.bench_intrabar --days 365
+
+1분봉 랜덤워크를 상위 차트 단위로 합친 뒤, 벡터 엔진의 결과를 1분봉을
+하나씩 도는 단순 구현과 비교하고 봉 종가 기준 판정과 소요 시간을 비교함.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import random_walk_ohlcv
+from data_collector import resample_ohlcv
+from signal_strategy import compute_signals, get_strategy
+from vector_engine import run_vector_backtest
+
+INTERVALS = ("minute15", "minute60", "minute240", "day")
+
+
+def reference_trades(df, minute1, params) -> list:
+    """1분봉을 하나씩 검사하는 단순 구현의 (진입 봉, 청산 봉, 청산가) 목록"""
+    close = df["Close"].to_numpy()
+    buy, sell = compute_signals(get_strategy(), {"Close": close}, params)
+    bar_ts = df.index.asi8
+    ts = minute1.index.asi8
+    bar_of = np.searchsorted(bar_ts, ts, side="right") - 1
+    open_ = minute1["Open"].to_numpy()
+    high = minute1["High"].to_numpy()
+    low = minute1["Low"].to_numpy()
+    n = len(df)
+    trades = []
+    i = 1
+    while True:
+        signal_bars = np.flatnonzero(buy[i:]) + i
+        if not len(signal_bars) or signal_bars[0] + 1 >= n:
+            break
+        entry_bar = signal_bars[0] + 1
+        tp_price = close[entry_bar - 1] * (1 + params["take_profit"])
+        sl_price = close[entry_bar - 1] * (1 - params["stop_loss"])
+        first_sell = max(entry_bar, entry_bar - 1 + params["min_holding_period"])
+        sell_bars = np.flatnonzero(sell[first_sell:]) + first_sell
+        signal_exit = sell_bars[0] + 1 if len(sell_bars) else n
+        exit_ = None
+        for k in range(np.searchsorted(ts, bar_ts[entry_bar]), len(ts)):
+            if bar_of[k] >= signal_exit:
+                break
+            if low[k] <= sl_price:
+                exit_ = (bar_of[k], min(open_[k], sl_price))
+                break
+            if high[k] >= tp_price:
+                exit_ = (bar_of[k], max(open_[k], tp_price))
+                break
+        if exit_ is None:
+            if signal_exit >= n:
+                break
+            exit_ = (signal_exit, df["Open"].iloc[signal_exit])
+        trades.append((entry_bar, *exit_))
+        i = exit_[0]
+    return trades
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    minute1 = random_walk_ohlcv(args.days * 1440, seed=args.seed)
+    params = dict(
+        fast_period=12,
+        slow_period=26,
+        signal_period=9,
+        macd_threshold=0.0,
+        min_holding_period=2,
+        take_profit=0.01,
+        stop_loss=0.005,
+        cash=1_000_000,
+        commission=0.0005,
+    )
+    for interval in INTERVALS:
+        df = resample_ohlcv(minute1, interval)
+        started = time.perf_counter()
+        close_based = run_vector_backtest(df, params)
+        close_time = time.perf_counter() - started
+        started = time.perf_counter()
+        intrabar = run_vector_backtest(df, params, minute1)
+        intrabar_time = time.perf_counter() - started
+
+        trades = intrabar._trades
+        expected = np.array(reference_trades(df, minute1, params)).reshape(-1, 3)
+        np.testing.assert_array_equal(trades["EntryBar"].to_numpy(), expected[:, 0])
+        np.testing.assert_array_equal(trades["ExitBar"].to_numpy(), expected[:, 1])
+        np.testing.assert_allclose(trades["ExitPrice"].to_numpy(), expected[:, 2])
+        print(
+            f"{interval:<10} 봉 {len(df):>7,}개  거래 {len(trades):>5}회  "
+            f"종가 판정 {close_time * 1000:7.1f}ms ({close_based['Return [%]']:8.2f}%)  "
+            f"1분봉 판정 {intrabar_time * 1000:7.1f}ms ({intrabar['Return [%]']:8.2f}%)  일치"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""1분봉 1년치 로딩 시 최대 메모리(RSS): get_ohlcv(DataFrame) vs CompactOHLCV
+
+    python -m benchmarks.bench_memory --days 365
+
+시나리오마다 새 프로세스에서 실행해 (최대 RSS - 시작 전 RSS)를 비교함.
+cold는 빈 캐시에서 가짜 업비트 API로 받는 경우, warm은 저장된 캐시를 읽는 경우,
+tail은 캐시 이후 하루치 최신 캔들을 더 받아 병합/저장하는 경우.
+결과가 실행 시각에 따라 달라지지 않도록 현재 시각은 고정함.
+compact=True는 같은 페이지를 CompactOHLCV(float32)에 바로 채우고 .npy 사본을
+메모리 매핑으로 읽는 경우 (get_ohlcv는 엔진과 같은 float64 DataFrame만 반환).
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+SCENARIOS = ("cold", "warm", "tail")
+TICKER = "KRW-BENCH"
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+def _fetch_compact(start: datetime, end: datetime):
+    """data_collector._fetch_range와 같은 페이지를 CompactOHLCV에 바로 채움"""
+    import data_collector
+    from compact_ohlcv import CompactOHLCV
+
+    cursors = data_collector.plan_cursors("minute1", start, end)
+    pages = data_collector._fetcher.iter_pages(
+        TICKER,
+        "minute1",
+        data_collector.UPBIT_PAGE_SIZE,
+        [to - data_collector.KST_OFFSET for to in cursors],
+        stop_short=True,
+    )
+    return CompactOHLCV.from_pages(pages, capacity=len(cursors) * data_collector.UPBIT_PAGE_SIZE)
+
+
+def _load_compact(store_dir: str, start: datetime, end: datetime, scenario: str):
+    from compact_ohlcv import CompactOHLCV
+
+    directory = os.path.join(store_dir, "compact")
+    if scenario == "cold":
+        data = _fetch_compact(start, end)
+    else:
+        data = CompactOHLCV.load(directory)
+        if scenario == "tail":
+            data = CompactOHLCV.merge(data, _fetch_compact(data.index[-1], end))
+    if scenario != "warm":
+        data.save(directory)
+    return data.since(start).to_frame()
+
+
+def _child(scenario: str, store_dir: str, days: int, compact: bool, now: str) -> dict:
+    from datetime import timedelta
+
+    import data_collector
+    from benchmarks.fake_upbit import FakeUpbit
+    from fetcher import PageFetcher, TokenBucket
+    from ohlcv_store import OHLCVStore
+
+    logging.disable(logging.INFO)
+    data_collector.set_fetcher(
+        PageFetcher(FakeUpbit(latency=0, quota=10**9).get_ohlcv, limiter=TokenBucket(rate=1e9))
+    )
+    data_collector._store = OHLCVStore(store_dir)
+    frozen = datetime.fromisoformat(now) + timedelta(days=1 if scenario == "tail" else 0)
+    data_collector._now_kst = lambda: frozen
+    before = _rss_mb()
+    started = time.perf_counter()
+    if compact:
+        df = _load_compact(store_dir, frozen - timedelta(days=days), frozen, scenario)
+    else:
+        df = data_collector.get_ohlcv(TICKER, "minute1", days)
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    # 메모리 매핑된 데이터는 읽을 때 올라오므로 전부 한 번 읽은 뒤도 측정
+    for col in df.columns:
+        df[col].to_numpy().sum()
+    touched = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        "scenario": scenario,
+        "compact": compact,
+        "rows": len(df),
+        "frame_mb": df.memory_usage(index=True).sum() / 1024 / 1024,
+        "peak_mb": peak - before,
+        "touched_mb": touched - before,
+        "seconds": elapsed,
+    }
+
+
+def _spawn(scenario: str, store_dir: str, days: int, compact: bool, now: str) -> dict:
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_memory",
+            "--child",
+            scenario,
+            "--store",
+            store_dir,
+            "--days",
+            str(days),
+            "--now",
+            now,
+            *(["--compact"] if compact else []),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--child")
+    parser.add_argument("--store")
+    parser.add_argument("--now")
+    parser.add_argument("--compact", action="store_true")
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child, args.store, args.days, args.compact, args.now)))
+        return
+
+    now = datetime.now().replace(second=0, microsecond=0).isoformat()
+    results = []
+    for compact in (False, True):
+        store_dir = tempfile.mkdtemp(prefix="bench-memory-")
+        for scenario in SCENARIOS:
+            results.append(_spawn(scenario, store_dir, args.days, compact, now))
+    for r in results:
+        print(
+            f"{r['scenario']:<5} compact={str(r['compact']):<5} rows={r['rows']:>8,}  "
+            f"frame={r['frame_mb']:7.1f}MB  peak={r['peak_mb']:7.1f}MB  "
+            f"(전체 읽은 후 {r['touched_mb']:7.1f}MB)  {r['seconds']:6.1f}s"
+        )
+    for scenario in SCENARIOS:
+        base, compact = [r for r in results if r["scenario"] == scenario]
+        print(
+            f"{scenario}: 최대 메모리 {base['peak_mb'] / max(compact['peak_mb'], 1e-9):.1f}배 감소 "
+            f"(전체 읽은 후 {base['touched_mb'] / max(compact['touched_mb'], 1e-9):.1f}배)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""몬테카를로 분석 소요 시간 (목표: 거래 1,000개 x 10,000회 1초 이내)
+
+    python -m benchmarks.bench_monte_carlo --trades 1000 --sims 10000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from robustness import METHODS, monte_carlo
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trades", type=int, default=1000)
+    parser.add_argument("--sims", type=int, default=10_000)
+    parser.add_argument("--bars", type=int, default=525_600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    trades = pd.DataFrame(
+        {
+            "ReturnPct": rng.normal(0.002, 0.02, args.trades),
+            "PnL": rng.normal(2_000, 20_000, args.trades),
+        }
+    )
+    equity = 1_000_000 * np.cumprod(1 + rng.normal(1e-5, 1e-3, args.bars))
+    for method in METHODS:
+        for use_pnl in (False, True) if method != "block" else (False,):
+            started = time.perf_counter()
+            result = monte_carlo(
+                trades,
+                n_sims=args.sims,
+                method=method,
+                use_pnl=use_pnl,
+                equity=equity,
+                seed=args.seed,
+            )
+            elapsed = time.perf_counter() - started
+            print(
+                f"{method:<9} {'PnL' if use_pnl else 'ReturnPct':<9} {elapsed * 1000:7.1f}ms  "
+                f"중앙 최종 자산 {np.median(result['final_equity']):>16,.0f}  "
+                f"파산 확률 {result['ruin_probability'] * 100:5.2f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
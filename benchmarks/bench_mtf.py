@@ -0,0 +1,129 @@
+"""다중 시간 프레임(상위 차트 MACD 필터) 전략의 정확성과 추가 비용 확인
+
+    python -m benchmarks.bench_mtf --bars 525600 --interval minute5
+
+1. 상위 차트 지표를 pandas(resample_ohlcv + ewm + merge_asof)로 따로 계산한 값과 비교
+2. 데이터를 중간에서 자른 뒤 다시 계산해도 그 앞 값이 같은지 (미래 참조 없음)
+3. 스트리밍 엔진을 봉 단위로 재생한 신호가 벡터 엔진과 같은지
+4. backtesting.py와 벡터 엔진의 거래가 같은지, 단일 차트 전략 대비 추가 시간
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+import indicator_cache
+from backtest_runner import run_backtest
+from benchmarks.synthetic import random_walk_ohlcv
+from data_collector import INTERVAL_DELTAS, resample_ohlcv
+from signal_strategy import compute_indicators, compute_signals, frame_data, get_strategy
+from streaming import BUY, SELL, StreamingStrategy
+
+PARAMS = dict(
+    fast_period=12,
+    slow_period=26,
+    signal_period=9,
+    take_profit=0.01,
+    stop_loss=0.005,
+    macd_threshold=0.0,
+    min_holding_period=2,
+    macd_crossover_threshold=0.0,
+    cash=1_000_000,
+    commission=0.0005,
+)
+
+
+def reference_trend(df: pd.DataFrame, params: dict) -> pd.DataFrame:
+    """상위 봉 MACD/신호선을 상위 봉이 끝나는 시각 기준으로 기준 봉에 붙인 값"""
+    htf = resample_ohlcv(df, params["trend_interval"])["Close"]
+    fast = htf.ewm(span=params["fast_period"], adjust=False).mean()
+    slow = htf.ewm(span=params["slow_period"], adjust=False).mean()
+    macd = fast - slow
+    signal = macd.ewm(span=params["signal_period"], adjust=False).mean()
+    htf_end = htf.index + INTERVAL_DELTAS[params["trend_interval"]]
+    available = pd.DataFrame({"available": htf_end, "macd": macd.values, "signal": signal.values})
+    bars = pd.DataFrame({"available": df.index + INTERVAL_DELTAS[params["interval"]]})
+    return pd.merge_asof(bars, available, on="available")
+
+
+def replay_signals(df: pd.DataFrame, params: dict) -> tuple:
+    spec = get_strategy("macd_mtf")
+    engine = StreamingStrategy("macd_mtf", **spec.resolve_params(params))
+    buys, sells = [], []
+    for i, (ts, close) in enumerate(zip(df.index.asi8, df["Close"].to_numpy())):
+        if i == len(df) // 2:
+            # 상위 차트 상태까지 체크포인트로 저장/복원되는지 확인
+            engine = StreamingStrategy.restore(json.loads(json.dumps(engine.checkpoint())))
+        signal = engine.update(close, Time=ts)
+        if signal == BUY:
+            buys.append(i)
+        elif signal == SELL:
+            sells.append(i)
+    return buys, sells
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=525_600)
+    parser.add_argument("--interval", default="minute5")
+    parser.add_argument("--trend-interval", default="minute60")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    minute1 = random_walk_ohlcv(args.bars, seed=args.seed)
+    # 빠진 캔들이 있어도 맞는지 보기 위해 일부 1분봉을 지움
+    drop = np.random.default_rng(args.seed).random(len(minute1)) < 0.01
+    df = resample_ohlcv(minute1[~drop], args.interval)
+    params = {**PARAMS, "interval": args.interval, "trend_interval": args.trend_interval}
+    spec = get_strategy("macd_mtf")
+    data = frame_data(df, spec.columns())
+
+    indicators = compute_indicators(spec, data, params)
+    expected = reference_trend(df, params)
+    np.testing.assert_allclose(indicators["trend_macd"], expected["macd"], rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(indicators["trend_signal"], expected["signal"], rtol=1e-9, atol=1e-9)
+    print(
+        f"상위 차트 지표 pandas 계산과 일치 "
+        f"({len(df):,}봉, {args.interval} -> {args.trend_interval})"
+    )
+
+    for cut in np.random.default_rng(args.seed).integers(100, len(df), 5):
+        indicator_cache.get_cache().clear()
+        head = compute_indicators(spec, {k: v[:cut] for k, v in data.items()}, params)
+        for name in ("trend_macd", "trend_signal"):
+            np.testing.assert_array_equal(head[name], indicators[name][:cut])
+    print("중간에서 자른 데이터로 다시 계산해도 같은 값 (미래 참조 없음)")
+
+    stream_buys, stream_sells = replay_signals(df, params)
+    vector = run_backtest({**params, "strategy": "macd_mtf", "engine": "vector"}, df=df)
+    # 신호는 다음 봉 시가에 체결 (마지막 봉의 신호와 끝까지 남은 포지션 청산은 제외)
+    entries = list(vector._trades["EntryBar"].to_numpy() - 1)
+    exits = list(vector._trades["ExitBar"].to_numpy() - 1)
+    assert stream_buys[: len(entries)] == entries and len(stream_buys) - len(entries) <= 1
+    assert exits[: len(stream_sells)] == stream_sells[: len(exits)]
+    print(f"스트리밍 매수 {len(stream_buys)}건 / 매도 {len(stream_sells)}건이 벡터 엔진 거래와 일치")
+
+    bt_bars = min(len(df), 20_000)
+    small = df.iloc[:bt_bars]
+    a = run_backtest({**params, "strategy": "macd_mtf"}, df=small)
+    b = run_backtest({**params, "strategy": "macd_mtf", "engine": "vector"}, df=small)
+    pd.testing.assert_frame_equal(
+        a._trades[["EntryBar", "ExitBar", "EntryPrice", "ExitPrice"]].reset_index(drop=True),
+        b._trades[["EntryBar", "ExitBar", "EntryPrice", "ExitPrice"]].reset_index(drop=True),
+    )
+    print(f"backtesting.py와 벡터 엔진 거래 {len(a._trades)}건 일치 ({bt_bars:,}봉)")
+
+    # 지표/신호 계산만 비교 (시뮬레이션 시간은 거래 수에 따라 달라짐)
+    for name in ("macd_v2", "macd_mtf"):
+        spec = get_strategy(name)
+        indicator_cache.get_cache().clear()
+        started = time.perf_counter()
+        buy, _ = compute_signals(spec, frame_data(df, spec.columns()), params)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<9} 지표+신호 계산 {elapsed * 1000:7.1f}ms  매수 신호 {buy.sum():>6}개")
+
+
+if __name__ == "__main__":
+    main()
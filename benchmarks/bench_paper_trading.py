@@ -0,0 +1,59 @@
+"""다종목 모의 매매 런타임 처리량/지연 시간 벤치마크 (재생 피드, 단일 코어)
+
+    python -m benchmarks.bench_paper_trading --tickers 100 --bars 1440
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import random_walk_ohlcv
+from paper_trading import PaperTrader, ReplayFeed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--bars", type=int, default=1440, help="종목당 1분봉 개수")
+    args = parser.parse_args()
+
+    frames = {
+        f"KRW-T{i:03d}": random_walk_ohlcv(args.bars, seed=i) for i in range(args.tickers)
+    }
+    # 백테스트와 같은 파라미터 묶음을 그대로 넘겨도 되는지 함께 확인
+    params = dict(
+        ticker="KRW-TEST",
+        interval="minute1",
+        days=1,
+        fast_period=12,
+        slow_period=26,
+        signal_period=9,
+        take_profit=0.004,
+        stop_loss=0.002,
+        cash=1_000_000,
+        commission=0.0005,
+        engine="vector",
+    )
+    trader = PaperTrader(ReplayFeed(frames), params, cash_per_ticker=1_000_000)
+    started = time.perf_counter()
+    summary = asyncio.run(trader.run())
+    elapsed = time.perf_counter() - started
+
+    events = int(summary["events"].sum())
+    latencies = trader.latencies_us()
+    # 1분봉 주기에서 필요한 처리량: 종목 수 / 60초
+    required = args.tickers / 60
+    print(
+        f"종목 {args.tickers}개, 이벤트 {events}건, 거래 {int(summary['trades'].sum())}건, "
+        f"{elapsed:.2f}s ({events / elapsed:,.0f} 이벤트/s, 1분봉 주기 요구치의 "
+        f"{events / elapsed / required:,.0f}배)"
+    )
+    print(
+        f"판단 지연 p50 {np.percentile(latencies, 50):.1f}µs / "
+        f"p99 {np.percentile(latencies, 99):.1f}µs / max {latencies.max():.1f}µs"
+    )
+
+
+if __name__ == "__main__":
+    main()
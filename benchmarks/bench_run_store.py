@@ -0,0 +1,82 @@
+"""실행 기록 저장/다시 불러오기 시간을 다시 계산하는 시간과 비교
+
+    python -m benchmarks.bench_run_store --bars 525600
+
+벡터 엔진 결과를 임시 저장소에 저장하고 불러온 뒤 거래/자산 곡선이 원래
+결과와 같은지 확인함. 예전 방식(표까지 JSON으로 압축)의 시간도 함께 잼.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import zlib
+
+import pandas as pd
+
+from benchmarks.synthetic import random_walk_ohlcv
+from report import decode_result, encode_result
+from run_store import RunStore
+from vector_engine import run_vector_backtest
+
+PARAMS = dict(
+    ticker="KRW-TEST",
+    interval="minute1",
+    fast_period=12,
+    slow_period=26,
+    signal_period=9,
+    take_profit=0.01,
+    stop_loss=0.005,
+    macd_threshold=0.0,
+    min_holding_period=2,
+    cash=1_000_000,
+    commission=0.0005,
+    engine="vector",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=525_600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    df = random_walk_ohlcv(args.bars, seed=args.seed)
+    started = time.perf_counter()
+    result = run_vector_backtest(df, PARAMS)
+    compute = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "runs.sqlite3")
+        store = RunStore(path)
+        started = time.perf_counter()
+        run_id = store.save(PARAMS, result)
+        save = time.perf_counter() - started
+        started = time.perf_counter()
+        loaded = store.load(run_id)
+        load = time.perf_counter() - started
+        size = os.path.getsize(path)
+
+    pd.testing.assert_frame_equal(loaded["_trades"], result._trades)
+    pd.testing.assert_frame_equal(
+        loaded["_equity_curve"], result._equity_curve, check_freq=False
+    )
+    assert loaded["Return [%]"] == result["Return [%]"]
+
+    started = time.perf_counter()
+    payload = zlib.compress(json.dumps(encode_result(result)).encode())
+    old_save = time.perf_counter() - started
+    started = time.perf_counter()
+    decode_result(json.loads(zlib.decompress(payload)))
+    old_load = time.perf_counter() - started
+
+    print(f"{args.bars:,}봉, 거래 {len(result._trades):,}건: 다시 계산 {compute:.2f}s")
+    print(f"저장 {save:.2f}s / 불러오기 {load:.2f}s  (DB {size / 1024 / 1024:.1f}MB)")
+    print(
+        f"예전 방식(JSON): 저장 {old_save:.2f}s / 불러오기 {old_load:.2f}s  "
+        f"({len(payload) / 1024 / 1024:.1f}MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
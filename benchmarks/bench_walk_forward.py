@@ -0,0 +1,70 @@
+"""워크포워드 최적화 벤치마크 (랜덤워크 데이터)
+
+    python -m benchmarks.bench_walk_forward --bars 35040 --folds 20
+
+기본값은 30분봉 2년치(35,040봉)를 20개 구간으로 나눈 경우.
+"""
+import argparse
+import logging
+import time
+
+from benchmarks.synthetic import random_walk_ohlcv
+from walk_forward import walk_forward
+
+BASE_PARAMS = {
+    "macd_threshold": 0.0,
+    "min_holding_period": 2,
+    "macd_crossover_threshold": 0.0,
+    "cash": 100_000_000,
+    "commission": 0.0005,
+}
+
+PARAM_RANGES = {
+    "fast_period": (8, 16, 2),
+    "slow_period": (20, 40, 5),
+    "signal_period": (7, 11, 2),
+    "take_profit": (0.01, 0.05, 0.02),
+    "stop_loss": (0.005, 0.015, 0.005),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=35_040)
+    parser.add_argument("--folds", type=int, default=20)
+    parser.add_argument("--train-ratio", type=float, default=4.0)
+    parser.add_argument("--anchored", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    df = random_walk_ohlcv(args.bars, seed=1, freq="30min")
+    started = time.perf_counter()
+    result = walk_forward(
+        BASE_PARAMS,
+        PARAM_RANGES,
+        n_folds=args.folds,
+        train_ratio=args.train_ratio,
+        anchored=args.anchored,
+        df=df,
+        max_workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+    folds = result["folds"]
+    columns = ["fold", "test_start", "fast_period", "slow_period", "signal_period"]
+    print(folds[columns + ["train Return [%]", "test Return [%]"]].to_string(index=False))
+    stats = result["stats"]
+    # 구간 끝 포지션도 청산되어 거래 목록과 이어 붙인 자산 곡선이 맞아야 함
+    trades = stats["_trades"]
+    expected = BASE_PARAMS["cash"] + trades["PnL"].sum() - stats["Commissions [$]"]
+    assert abs(result["equity"].iloc[-1] - expected) < 1e-6 * BASE_PARAMS["cash"]
+    assert stats["# Trades"] == folds["test # Trades"].sum()
+    print(
+        f"검증 구간 수익률 {stats['Return [%]']:.2f}%, 거래 {stats['# Trades']}회, "
+        f"MDD {stats['Max. Drawdown [%]']:.2f}%"
+    )
+    print(f"{args.bars}봉, {args.folds}개 구간: {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import requests
+
+_MINUTES = {
+    "minute1": 1,
+    "minute3": 3,
+    "minute5": 5,
+    "minute10": 10,
+    "minute15": 15,
+    "minute30": 30,
+    "minute60": 60,
+    "minute240": 240,
+    "day": 1440,
+}
+
+
+def _http_error(status: int, message: str) -> requests.HTTPError:
+    """fetcher.upbit_candles의 raise_for_status()가 던지는 것과 같은 오류"""
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} {message}", response=response)
+
+
+class FakeUpbit:
+    """fetcher.upbit_candles 대체용 가짜 API
+
+    요청마다 latency초 지연되며, 최근 1초간 요청이 quota를 넘으면 429 상황처럼
+    예외를 던짐. listed(KST)를 주면 그 이전 캔들은 없어서 상장 이전 구간은 빈
+    DataFrame을 돌려줌. markets를 주면 그 밖의 종목은 404. 캔들은 시각으로부터 결정적으로 생성되므로 같은 구간은
+    항상 같은 값을 돌려줌.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        quota: int = 10,
+        window: float = 1.0,
+        listed: Optional[datetime] = None,
+        markets: Optional[set] = None,
+    ):
+        self.latency = latency
+        self.quota = quota
+        self.window = window
+        self.listed = listed
+        self.markets = markets
+        self.calls = 0
+        self.rejected = 0
+        self._recent = deque()
+        self._lock = threading.Lock()
+
+    def _admit(self) -> bool:
+        with self._lock:
+            self.calls += 1
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= self.window:
+                self._recent.popleft()
+            if len(self._recent) >= self.quota:
+                self.rejected += 1
+                return False
+            self._recent.append(now)
+            return True
+
+    def get_ohlcv(self, ticker="KRW-BTC", interval="day", count=200, to=None, period=0.1):
+        if self.latency:
+            time.sleep(self.latency)
+        if not self._admit():
+            raise _http_error(429, f"{ticker} {interval} to={to}")
+        if self.markets is not None and ticker not in self.markets:
+            raise _http_error(404, f"{ticker} 없는 종목")
+        minutes = _MINUTES[interval]
+        if to is None:
+            to = datetime.utcnow()
+        # to는 UTC, 인덱스는 KST
+        to_kst = pd.Timestamp(to) + timedelta(hours=9)
+        if interval == "day":
+            last = (to_kst - timedelta(hours=9, seconds=1)).floor("D") + timedelta(hours=9)
+        else:
+            last = (to_kst - timedelta(seconds=1)).floor(f"{minutes}min")
+        index = pd.date_range(end=last, periods=count, freq=f"{minutes}min")
+        if self.listed is not None:
+            index = index[index >= self.listed]
+        return synthetic_candles(index, seed=hash(ticker) % 1000)
+
+
+def synthetic_candles(index: pd.DatetimeIndex, seed: int = 0) -> pd.DataFrame:
+    """시각에만 의존하는 결정적 가격 경로 (페이지를 나눠 받아도 값이 일치)"""
+    t = (index.asi8 // 60_000_000_000).astype(np.float64)
+    close = 100 + 10 * np.sin(t / 700.0 + seed) + 3 * np.sin(t / 53.0) + np.cos(t / 7.0)
+    open_ = close - 0.5 * np.sin(t / 3.0)
+    high = np.maximum(open_, close) + 0.6
+    low = np.minimum(open_, close) - 0.6
+    volume = 1000 + 500 * np.abs(np.sin(t / 11.0))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+            "value": volume * close,
+        },
+        index=index,
+    )
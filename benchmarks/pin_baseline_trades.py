@@ -0,0 +1,65 @@
+"""처음 전략 코드로 bench_engine의 고정 거래 목록(fixtures/baseline_trades.csv)을 만듦
+
+    python -m benchmarks.pin_baseline_trades --ref 0b02e15
+
+git의 ref 시점 strategy.py / strategy_v2.py를 그대로 불러와 backtesting.py로
+실행함. 지금 코드가 아니라 처음 코드로 만들어야 의미가 있으므로, 전략 동작을
+일부러 바꾼 경우에만 다시 만들고 그 이유를 커밋에 남김.
+"""
+import argparse
+import logging
+import os
+import subprocess
+import types
+
+import pandas as pd
+from backtesting import Backtest  # type: ignore
+
+from benchmarks.bench_engine import (
+    BASE_PARAMS,
+    BASELINE_BARS,
+    BASELINE_CASES,
+    BASELINE_SEED,
+    BASELINE_TRADES,
+    PINNED_COLUMNS,
+)
+from benchmarks.synthetic import random_walk_ohlcv
+
+
+def _load_strategy(ref: str, filename: str):
+    """ref 시점의 전략 파일을 모듈로 불러와 MACDStrategy 클래스를 반환"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    source = subprocess.run(
+        ["git", "show", f"{ref}:{filename}"], cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+    module = types.ModuleType(f"baseline_{filename[:-3]}")
+    exec(compile(source, f"{ref}:{filename}", "exec"), module.__dict__)
+    return module.MACDStrategy
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ref", required=True, help="처음 전략 코드가 있는 커밋")
+    args = parser.parse_args()
+
+    df = random_walk_ohlcv(BASELINE_BARS, seed=BASELINE_SEED)
+    frames = []
+    for case, (filename, _, overrides) in BASELINE_CASES.items():
+        base = _load_strategy(args.ref, filename)
+        params = {**BASE_PARAMS, **overrides}
+        # 처음 전략 클래스에 있는 파라미터만 클래스 변수로 덮어씀
+        strategy = type("Pinned", (base,), {k: v for k, v in params.items() if hasattr(base, k)})
+        logging.disable(logging.INFO)
+        stats = Backtest(
+            df, strategy, cash=params["cash"], commission=params["commission"]
+        ).run()
+        trades = stats._trades[PINNED_COLUMNS].assign(case=case)
+        frames.append(trades[["case", *PINNED_COLUMNS]])
+        print(f"{case}: {filename}@{args.ref} 거래 {len(trades)}건")
+    os.makedirs(os.path.dirname(BASELINE_TRADES), exist_ok=True)
+    pd.concat(frames, ignore_index=True).to_csv(BASELINE_TRADES, index=False)
+    print(f"저장: {BASELINE_TRADES}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""데이터 수집 → 지표 → 시뮬레이션 → 리포트 단계별 성능 벤치마크
+
+    # 기준값 기록
+    python -m benchmarks.pipeline run --sizes 1000,10000,100000,1000000 --out benchmarks/baseline.json
+    # 기준값과 비교 (threshold 이상 느려진 단계가 있으면 종료 코드 1)
+    python -m benchmarks.pipeline compare --baseline benchmarks/baseline.json --threshold 0.2
+
+업비트 API는 지연 없는 가짜 API(FakeUpbit)로, 데이터는 임시 디렉터리의
+캐시로 대체하므로 네트워크 없이 결정적으로 실행됨.
+"""
+import argparse
+import gc
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+import data_collector
+import indicator_cache
+from backtest_runner import run_backtest
+from benchmarks.fake_upbit import FakeUpbit
+from benchmarks.synthetic import random_walk_ohlcv
+from fetcher import PageFetcher, TokenBucket
+from ohlcv_store import OHLCVStore
+from report import (
+    column_mapping,
+    extract_trades,
+    rename_and_filter_columns,
+    summarize_trades,
+)
+from signal_strategy import compute_indicators, get_strategy
+
+PARAMS = {
+    "ticker": "KRW-BENCH",
+    "interval": "minute1",
+    "fast_period": 12,
+    "slow_period": 26,
+    "signal_period": 9,
+    "take_profit": 0.03,
+    "stop_loss": 0.01,
+    "macd_threshold": 0.0,
+    "min_holding_period": 2,
+    "macd_crossover_threshold": 0.0,
+    "cash": 1_000_000,
+    "commission": 0.0005,
+}
+
+
+def _measure(fn: Callable, repeat: int) -> dict:
+    """최소 실행 시간(반복 중 최솟값)과 tracemalloc 기준 최대 메모리"""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"wall_s": min(times), "peak_mb": peak / 1024 / 1024}
+
+
+def _stages(n_bars: int, max_reference_bars: int) -> dict:
+    """단계 이름 → 실행 함수 (각 함수는 독립적으로 여러 번 실행 가능)"""
+    df = random_walk_ohlcv(n_bars, seed=n_bars)
+    close = df["Close"].to_numpy()
+    days = max(1, int(np.ceil(n_bars / 1440)))
+    store_root = tempfile.mkdtemp(prefix="bench-pipeline-")
+    fake = FakeUpbit(latency=0, quota=10**9)
+
+    def use_fake_upbit(root: str) -> None:
+        data_collector.set_fetcher(
+            PageFetcher(fake.get_ohlcv, max_workers=1, limiter=TokenBucket(rate=1e9))
+        )
+        data_collector._store = OHLCVStore(root)
+
+    def fetch_cold():
+        use_fake_upbit(tempfile.mkdtemp(dir=store_root))
+        data_collector.get_ohlcv(PARAMS["ticker"], "minute1", days)
+
+    def fetch_warm():
+        data_collector.get_ohlcv(PARAMS["ticker"], "minute1", days)
+
+    def indicators():
+        indicator_cache.get_cache().clear()
+        compute_indicators(get_strategy(), {"Close": close}, PARAMS)
+
+    params = {**PARAMS, "days": days}
+    result = run_backtest({**params, "engine": "vector"}, df=df)
+
+    def simulate_vector():
+        indicator_cache.get_cache().clear()
+        run_backtest({**params, "engine": "vector"}, df=df)
+
+    def simulate_backtesting():
+        indicator_cache.get_cache().clear()
+        run_backtest({**params, "engine": "backtesting"}, df=df)
+
+    def report():
+        trades_df = extract_trades(result)
+        summarize_trades(trades_df)
+        rename_and_filter_columns(trades_df, column_mapping).sort_values(
+            by="진입 시간", ascending=False
+        )
+
+    stages = {"fetch_cold": fetch_cold, "fetch_warm": fetch_warm, "indicators": indicators}
+    # backtesting.py 엔진은 봉마다 파이썬 호출을 하므로 큰 데이터에서는 생략 가능
+    if n_bars <= max_reference_bars:
+        stages["simulate_backtesting"] = simulate_backtesting
+    stages["simulate_vector"] = simulate_vector
+    stages["report"] = report
+    return stages
+
+
+def run(sizes: list, repeat: int, max_reference_bars: int) -> dict:
+    results = {}
+    for n_bars in sizes:
+        for stage, fn in _stages(n_bars, max_reference_bars).items():
+            measured = _measure(fn, 1 if stage == "fetch_cold" else repeat)
+            measured["bars_per_s"] = n_bars / measured["wall_s"] if measured["wall_s"] else None
+            results[f"{stage}@{n_bars}"] = measured
+            print(
+                f"{stage:<22}{n_bars:>9,} bars  {measured['wall_s'] * 1000:10.1f}ms  "
+                f"{measured['peak_mb']:8.1f}MB  {measured['bars_per_s'] or 0:14,.0f} bars/s",
+                flush=True,
+            )
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """기준값 대비 (1 + threshold)배 넘게 느려진 단계 목록"""
+    regressions = []
+    for key, now in current["results"].items():
+        base = baseline["results"].get(key)
+        if not base:
+            continue
+        ratio = now["wall_s"] / base["wall_s"] if base["wall_s"] else float("inf")
+        flag = "느려짐" if ratio > 1 + threshold else ""
+        print(
+            f"{key:<32}{base['wall_s'] * 1000:10.1f}ms → "
+            f"{now['wall_s'] * 1000:10.1f}ms  x{ratio:5.2f} {flag}"
+        )
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("mode", choices=["run", "compare"])
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-reference-bars", type=int, default=100_000)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 JSON (compare)")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    sizes = [int(s) for s in args.sizes.split(",")]
+    if args.mode == "compare" and not args.baseline:
+        parser.error("compare 모드에는 --baseline이 필요합니다.")
+    current = run(sizes, args.repeat, args.max_reference_bars)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+    if args.mode == "compare":
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)}개 단계가 {args.threshold * 100:.0f}% 넘게 느려졌습니다.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
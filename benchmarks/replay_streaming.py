@@ -0,0 +1,82 @@
+"""스트리밍 엔진을 과거 데이터로 재생해 backtesting.py 전략과 신호가 같은지 확인
+
+    python -m benchmarks.replay_streaming --bars 200000
+
+중간에 체크포인트를 JSON으로 저장/복원한 뒤 이어서 재생해도 결과가 같아야 함.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+from backtesting import Backtest  # type: ignore
+
+from benchmarks.synthetic import random_walk_ohlcv
+from strategy_v2 import MACDStrategy
+from streaming import BUY, SELL, StreamingMACD
+
+
+def replay(closes: np.ndarray, params: dict, checkpoint_at: int):
+    engine = StreamingMACD(**params)
+    buys, sells = [], []
+    started = time.perf_counter()
+    for i, close in enumerate(closes):
+        if i == checkpoint_at:
+            engine = StreamingMACD.restore(json.loads(json.dumps(engine.checkpoint())))
+        signal = engine.update(close)
+        if signal == BUY:
+            buys.append(i)
+        elif signal == SELL:
+            sells.append(i)
+    per_candle = (time.perf_counter() - started) / len(closes)
+    return buys, sells, per_candle
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bars", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    df = random_walk_ohlcv(args.bars, seed=args.seed)
+    params = dict(
+        fast_period=12,
+        slow_period=26,
+        signal_period=9,
+        take_profit=0.004,
+        stop_loss=0.002,
+        macd_threshold=0.0,
+        min_holding_period=2,
+        macd_crossover_threshold=0.0,
+    )
+
+    class CustomStrategy(MACDStrategy):
+        pass
+
+    for name, value in params.items():
+        setattr(CustomStrategy, name, value)
+    stats = Backtest(df, CustomStrategy, cash=1_000_000, commission=0.0005).run()
+    trades = stats._trades
+    # 체결은 신호 다음 봉이므로 신호 봉 = 체결 봉 - 1
+    expected_buys = (trades["EntryBar"] - 1).tolist()
+    expected_sells = (trades["ExitBar"] - 1).tolist()
+
+    # 마지막까지 청산되지 않은 거래는 거래 표에 없으므로 따로 추가
+    expected_buys += [trade.entry_bar - 1 for trade in stats._strategy.trades]
+
+    buys, sells, per_candle = replay(df["Close"].to_numpy(), params, args.bars // 2)
+    # 마지막 봉의 신호는 체결될 다음 봉이 없음
+    last = len(df) - 1
+    buys = [b for b in buys if b < last]
+    sells = [s for s in sells if s < last]
+
+    assert buys == expected_buys, "매수 신호 불일치"
+    assert sells == expected_sells, "매도 신호 불일치"
+    print(
+        f"매수 {len(buys)}건 / 매도 {len(sells)}건 신호 일치, "
+        f"캔들당 {per_candle * 1e6:.1f}µs"
+    )
+
+
+if __name__ == "__main__":
+    main()
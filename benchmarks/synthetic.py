@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+
+def random_walk_ohlcv(
+    n_bars: int, seed: int = 0, freq: str = "1min", start: str = "2024-01-01 09:00"
+) -> pd.DataFrame:
+    """시드가 같으면 항상 같은 값이 나오는 랜덤워크 OHLCV (backtesting.py 형식)"""
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0, 0.002, n_bars)
+    close = 100.0 * np.exp(np.cumsum(returns))
+    open_ = np.empty(n_bars)
+    open_[0] = 100.0
+    open_[1:] = close[:-1] * np.exp(rng.normal(0, 0.0005, n_bars - 1))
+    spread = np.abs(rng.normal(0, 0.001, n_bars)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(10, 1, n_bars)
+    index = pd.date_range(start, periods=n_bars, freq=freq)
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=index,
+    )
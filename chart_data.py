@@ -0,0 +1,58 @@
+import pandas as pd
+
+from downsample import MAX_POINTS, downsample, visible_range
+from signal_strategy import PRICE_COLUMNS, compute_indicators, frame_data, get_strategy
+
+
+def split_indicators(spec, indicators: dict) -> tuple:
+    """가격 위에 겹쳐 그릴 지표(캔들 컬럼으로 계산)와 아래 패널 지표로 나눔"""
+    overlay, panel = {}, {}
+    for name, values in indicators.items():
+        inputs = spec.indicators[name].inputs
+        target = overlay if all(i in PRICE_COLUMNS for i in inputs) else panel
+        target[name] = values
+    return overlay, panel
+
+
+def load_chart_data(params: dict, start, end) -> tuple:
+    """실행의 데이터 구간(start~end) 캔들과 전략 지표. 반환값: (캔들, 전략, 지표)
+
+    지난 실행을 불러와도 그 실행의 구간을 그리도록, 지금부터 start까지 받은
+    캔들을 실행 구간으로 잘라서 지표도 같은 봉부터 계산함.
+    """
+    from data_collector import get_ohlcv
+
+    spec = get_strategy(params.get("strategy"))
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    now = pd.Timestamp.now(tz="Asia/Seoul").tz_localize(None)
+    days = max(params["days"], (now - start).days + 1)
+    df = get_ohlcv(params["ticker"], params["interval"], days)
+    df = df[(df.index >= start) & (df.index <= end)]
+    return df, spec, compute_indicators(spec, frame_data(df, spec.columns()), params)
+
+
+def chart_frame(
+    df: pd.DataFrame,
+    spec,
+    indicators: dict,
+    start=None,
+    end=None,
+    method: str = "lttb",
+    n_out: int = MAX_POINTS,
+) -> pd.DataFrame:
+    """start~end 구간의 종가와 지표를 한 표로 묶어 약 n_out행으로 줄임 (작업 API 응답용)
+
+    가격 위 지표는 종가를 따라가므로 종가와 아래 패널 지표의 모양으로 행을 고름.
+    """
+    window = visible_range(df.index, start or df.index[0], end or df.index[-1])
+    frame = pd.DataFrame(
+        {"Close": df["Close"].to_numpy()[window]}, index=df.index[window]
+    ).assign(**{name: values[window] for name, values in indicators.items()})
+    _, panel = split_indicators(spec, indicators)
+    return downsample(frame, n_out, method, columns=["Close", *panel])
+
+
+def from_chart_frame(frame: pd.DataFrame, spec) -> tuple:
+    """chart_frame 결과를 load_chart_data와 같은 (캔들, 전략, 지표)로 되돌림"""
+    indicators = {name: frame[name].to_numpy() for name in spec.indicators if name in frame}
+    return frame[["Close"]], spec, indicators
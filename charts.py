@@ -0,0 +1,149 @@
+import altair as alt
+import pandas as pd
+
+from chart_data import split_indicators
+from downsample import MAX_POINTS, downsample, visible_range
+
+# 한 화면의 점 수 배분 (합계 MAX_POINTS, 선이 여럿이면 선마다 나눠 씀)
+PRICE_POINTS = MAX_POINTS * 2 // 5
+INDICATOR_POINTS = MAX_POINTS // 5
+EQUITY_POINTS = MAX_POINTS // 5
+
+# 구간 안 거래가 이보다 많으면 일정 간격으로 골라 표시 (거래당 진입/청산 2개 점)
+MAX_MARKERS = MAX_POINTS // 10
+
+CHART_WIDTH = "container"
+
+
+def _long(frame: pd.DataFrame) -> pd.DataFrame:
+    """altair용 (time, series, value) 형식"""
+    frame = frame.rename_axis("time").reset_index()
+    return frame.melt("time", var_name="series", value_name="value")
+
+
+def _x_zoom():
+    """패널들이 같이 움직이는 가로 확대/이동 (브라우저에서 이미 받은 점 안에서만)"""
+    return alt.selection_interval(bind="scales", encodings=["x"])
+
+
+def _lines(frame: pd.DataFrame, title: str, height: int, zoom) -> alt.Chart:
+    return (
+        alt.Chart(_long(frame), height=height, width=CHART_WIDTH)
+        .mark_line(strokeWidth=1)
+        .encode(
+            x=alt.X("time:T", title=None),
+            y=alt.Y("value:Q", title=title, scale=alt.Scale(zero=False)),
+            color=alt.Color("series:N", legend=alt.Legend(orient="top", title=None)),
+        )
+        .add_params(zoom)
+    )
+
+
+def _markers(trades: pd.DataFrame, start, end) -> pd.DataFrame:
+    """구간 안 진입/청산 시점 (최대 MAX_MARKERS건)"""
+    in_range = trades[(trades["EntryTime"] <= end) & (trades["ExitTime"] >= start)]
+    if len(in_range) > MAX_MARKERS:
+        step = -(-len(in_range) // MAX_MARKERS)
+        in_range = in_range.iloc[::step]
+    entries = pd.DataFrame(
+        {"time": in_range["EntryTime"], "price": in_range["EntryPrice"], "side": "매수"}
+    )
+    exits = pd.DataFrame(
+        {"time": in_range["ExitTime"], "price": in_range["ExitPrice"], "side": "매도"}
+    )
+    markers = pd.concat([entries, exits], ignore_index=True)
+    return markers[(markers["time"] >= start) & (markers["time"] <= end)]
+
+
+def price_chart(
+    df: pd.DataFrame,
+    indicators: dict,
+    spec,
+    trades: pd.DataFrame = None,
+    start=None,
+    end=None,
+    method: str = "lttb",
+) -> tuple:
+    """종가/가격 지표 + 거래 표시, 그 아래 MACD 같은 지표 패널
+
+    start~end 구간만 잘라 다시 줄이므로 구간을 좁힐수록 원본에 가까워짐.
+    반환값: (차트, 그린 점 수)
+    """
+    window = visible_range(df.index, start or df.index[0], end or df.index[-1])
+    index = df.index[window]
+    overlay, panel = split_indicators(spec, indicators)
+    price = pd.DataFrame(
+        {"종가": df["Close"].to_numpy()[window], **{k: v[window] for k, v in overlay.items()}},
+        index=index,
+    )
+    # 가격 지표는 종가를 따라가므로 종가 모양으로 고른 점을 함께 씀
+    price = downsample(price, PRICE_POINTS // price.shape[1], method, columns=["종가"])
+    zoom = _x_zoom()
+    chart = _lines(price, "가격", 320, zoom)
+    n_points = price.size
+
+    if trades is not None and not trades.empty and len(index):
+        markers = _markers(trades, index[0], index[-1])
+        if not markers.empty:
+            sides = ["매수", "매도"]
+            points = alt.Chart(markers).mark_point(filled=True, size=60).encode(
+                x="time:T",
+                y="price:Q",
+                shape=alt.Shape(
+                    "side:N",
+                    scale=alt.Scale(domain=sides, range=["triangle-up", "triangle-down"]),
+                    legend=None,
+                ),
+                color=alt.Color(
+                    "side:N",
+                    scale=alt.Scale(domain=sides, range=["#d62728", "#1f77b4"]),
+                    legend=None,
+                ),
+                tooltip=["time:T", "side:N", alt.Tooltip("price:Q", format=",.2f")],
+            )
+            chart = alt.layer(chart, points).resolve_scale(color="independent")
+            n_points += len(markers)
+
+    if panel:
+        lower = downsample(
+            pd.DataFrame({k: v[window] for k, v in panel.items()}, index=index),
+            INDICATOR_POINTS // len(panel),
+            method,
+        )
+        chart = alt.vconcat(chart, _lines(lower, "지표", 160, zoom)).resolve_scale(
+            color="independent"
+        )
+        n_points += lower.size
+    return chart, n_points
+
+
+def equity_chart(equity_curve: pd.DataFrame, start=None, end=None, method: str = "lttb") -> tuple:
+    """자산 곡선과 낙폭(%) 차트. 반환값: (차트, 그린 점 수)"""
+    index = equity_curve.index
+    window = visible_range(index, start or index[0], end or index[-1])
+    frame = pd.DataFrame(
+        {
+            "자산": equity_curve["Equity"].to_numpy()[window],
+            "낙폭": -equity_curve["DrawdownPct"].to_numpy()[window] * 100,
+        },
+        index=index[window],
+    )
+    frame = downsample(frame, EQUITY_POINTS // frame.shape[1], method)
+    zoom = _x_zoom()
+    base = alt.Chart(frame.rename_axis("time").reset_index(), width=CHART_WIDTH)
+    equity = (
+        base.mark_line(strokeWidth=1)
+        .encode(
+            x=alt.X("time:T", title=None),
+            y=alt.Y("자산:Q", title="자산 (원)", scale=alt.Scale(zero=False)),
+        )
+        .properties(height=220)
+        .add_params(zoom)
+    )
+    drawdown = (
+        base.mark_area(opacity=0.5, color="#d62728")
+        .encode(x=alt.X("time:T", title=None), y=alt.Y("낙폭:Q", title="낙폭 (%)"))
+        .properties(height=120)
+        .add_params(zoom)
+    )
+    return alt.vconcat(equity, drawdown), frame.size
@@ -0,0 +1,207 @@
+"""명령줄 백테스트 실행기 (Streamlit 없이 스크립트/cron에서 실행)
+
+    python cli.py runs.json --jobs 4 > results.jsonl
+    python cli.py runs.csv --set engine=backtesting --set days=30 -o results.jsonl
+    python cli.py runs.json --offline   # 저장된 캔들만 사용 (업비트 요청 없음)
+
+파라미터 파일은 JSON(객체 하나 또는 객체 목록)이나 CSV(머리글이 파라미터
+이름, 빈 칸은 기본값)이고, --set으로 모든 실행에 같은 값을 덮어씀. 실행이
+끝나는 대로 한 줄에 하나씩 JSON으로 출력함. 시작 시간을 줄이기 위해
+pandas 등은 실제로 실행할 때만 불러오고, 벡터 엔진(기본값)은 backtesting.py를
+불러오지 않음.
+"""
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 파일/--set에 없는 파라미터의 기본값 (앱/작업 API와 같음, 일괄 실행이므로 벡터 엔진)
+DEFAULT_PARAMS = {
+    "interval": "minute30",
+    "days": 90,
+    "fast_period": 12,
+    "slow_period": 26,
+    "signal_period": 9,
+    "take_profit": 0.03,
+    "stop_loss": 0.01,
+    "macd_threshold": 0.0,
+    "min_holding_period": 2,
+    "macd_crossover_threshold": 0.0,
+    "cash": 1_000_000,
+    "commission": 0.0005,
+    "engine": "vector",
+}
+
+
+def parse_value(text: str):
+    """숫자/true/false/null은 JSON 값으로, 나머지는 문자열 그대로"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def load_param_sets(path: str) -> list:
+    """JSON 또는 CSV 파일의 파라미터 목록 ("-"면 표준 입력의 JSON)"""
+    if path == "-":
+        data = json.load(sys.stdin)
+    elif path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return [
+                {key: parse_value(value) for key, value in row.items() if value not in ("", None)}
+                for row in csv.DictReader(f)
+            ]
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = [data]
+    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        raise ValueError("파라미터 파일은 객체 또는 객체 목록이어야 합니다.")
+    return data
+
+
+def build_runs(param_sets: list, overrides: dict) -> list:
+    """기본값 + 파일의 값 + --set 값을 합친 실행 목록 (종목은 KRW-XXX 형식으로)"""
+    runs = []
+    for row in param_sets:
+        params = {**DEFAULT_PARAMS, **row, **overrides}
+        if "ticker" not in params:
+            raise ValueError(f"{len(runs) + 1}번째 실행에 ticker가 없습니다.")
+        ticker = str(params["ticker"]).strip().upper()
+        params["ticker"] = ticker if ticker.startswith("KRW-") else f"KRW-{ticker}"
+        if params["fast_period"] >= params["slow_period"]:
+            raise ValueError(f"{len(runs) + 1}번째 실행: 단기 EMA는 장기 EMA보다 작아야 합니다.")
+        runs.append(params)
+    return runs
+
+
+def run_one(index: int, params: dict) -> dict:
+    """실행 하나의 결과 줄 (표로 된 항목 _trades/_equity_curve 등은 제외)"""
+    started = time.perf_counter()
+    try:
+        from backtest_runner import run_backtest
+        from report import encode_result
+
+        result = run_backtest(params)
+        stats = encode_result(
+            {key: value for key, value in result.items() if not str(key).startswith("_")}
+        )
+        return {
+            "run": index,
+            "params": params,
+            "stats": stats,
+            "seconds": round(time.perf_counter() - started, 4),
+        }
+    except Exception as e:
+        return {
+            "run": index,
+            "params": params,
+            "error": str(e),
+            "seconds": round(time.perf_counter() - started, 4),
+        }
+
+
+def _configure_logging(level: int) -> None:
+    # 결과는 표준 출력으로 나가므로 로그는 표준 오류로
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s %(levelname)s %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+def _init_worker(level: int) -> None:
+    _configure_logging(level)
+    # 무거운 모듈은 작업을 받기 전에 미리 불러 둠
+    import backtest_runner  # noqa: F401
+    import report  # noqa: F401
+    import vector_engine  # noqa: F401
+
+
+def iter_results(runs: list, jobs: int = 1, log_level: int = logging.WARNING):
+    """끝난 순서대로 결과 줄을 내보냄 (jobs > 1이면 프로세스 풀)"""
+    if jobs <= 1 or len(runs) <= 1:
+        for index, params in enumerate(runs):
+            yield run_one(index, params)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from multiprocessing import get_context
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(runs)),
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(log_level,),
+    ) as executor:
+        futures = [executor.submit(run_one, index, params) for index, params in enumerate(runs)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="업비트 MACD 백테스트 일괄 실행")
+    parser.add_argument("params", help='파라미터 파일 (JSON/CSV, "-"는 표준 입력 JSON)')
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="모든 실행에 덮어쓸 파라미터 (여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="동시에 실행할 프로세스 수 (0: CPU 수)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="업비트에 요청하지 않고 저장된 캔들만 사용 (최신 캔들 갱신 생략)",
+    )
+    parser.add_argument("-o", "--output", help="결과 JSONL 파일 (기본: 표준 출력)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그 출력")
+    args = parser.parse_args(argv)
+
+    log_level = logging.INFO if args.verbose else logging.WARNING
+    _configure_logging(log_level)
+    try:
+        overrides = {}
+        for item in args.set:
+            key, sep, value = item.partition("=")
+            if not sep:
+                raise ValueError(f"--set 형식은 KEY=VALUE 입니다: {item}")
+            overrides[key.strip()] = parse_value(value)
+        runs = build_runs(load_param_sets(args.params), overrides)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.offline:
+        # 작업 프로세스는 환경 변수를 물려받고, 이 프로세스는 바로 지정
+        os.environ["UPBIT_OFFLINE"] = "1"
+        import data_collector
+
+        data_collector.set_offline(True)
+    jobs = args.jobs or os.cpu_count() or 1
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    try:
+        for line in iter_results(runs, jobs, log_level):
+            failed += "error" in line
+            out.write(json.dumps(line, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    if failed:
+        logger.warning(f"{len(runs)}개 중 {failed}개 실행 실패")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
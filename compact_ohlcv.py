@@ -0,0 +1,159 @@
+import os
+import threading
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from ohlcv_store import OHLCV_COLUMNS
+
+
+class CompactOHLCV:
+    """메모리를 적게 쓰는 열 단위 OHLCV
+
+    시각은 int64(ns, KST), 가격/거래량은 (5, n) float32 행렬 하나로 보관해
+    float64 DataFrame의 약 60% 크기. to_frame()은 복사 없이 이 배열을 그대로
+    쓰는 DataFrame을 만듦. float32는 유효숫자가 약 7자리라 원화 가격(최대
+    수억 원대)은 1원 단위까지 보존되지만, 소수점 아래 가격은 오차가 생길 수 있음.
+    그래서 엔진에 넘기는 get_ohlcv는 float64 DataFrame을 그대로 쓰고, 이 형식은
+    큰 데이터를 훑어보거나 보관할 때 따로 씀 (benchmarks/bench_memory.py 참고).
+    """
+
+    __slots__ = ("ts", "values")
+
+    def __init__(self, ts: np.ndarray, values: np.ndarray):
+        self.ts = ts
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.ts) == 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.ts.nbytes + self.values.nbytes
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.ts.view("datetime64[ns]"))
+
+    @classmethod
+    def allocate(cls, n: int, dtype=np.float32) -> "CompactOHLCV":
+        return cls(np.empty(n, dtype=np.int64), np.empty((len(OHLCV_COLUMNS), n), dtype=dtype))
+
+    @classmethod
+    def from_pages(
+        cls, pages: Iterable, capacity: int, dtype=np.float32
+    ) -> "CompactOHLCV":
+        """최신 페이지부터 거슬러 오는 캔들 페이지들을 미리 잡아 둔 배열에 바로 채움
+
+        페이지마다 뒤에서부터 채워 넣으므로 페이지끼리 겹치지 않으면 정렬/중복
+        제거 없이 끝나고, 페이지 목록이나 합친 DataFrame을 따로 만들지 않음.
+        capacity보다 많이 들어오면 배열을 늘리고, 순서가 어긋나면 다시 정렬함.
+        """
+        result = cls.allocate(capacity, dtype)
+        pos = capacity
+        for page in pages:
+            if page is None or len(page) == 0:
+                continue
+            n = len(page)
+            if n > pos:
+                grow = max(n - pos, capacity)
+                result = cls(
+                    np.concatenate([np.empty(grow, dtype=np.int64), result.ts]),
+                    np.concatenate(
+                        [np.empty((len(OHLCV_COLUMNS), grow), dtype=dtype), result.values],
+                        axis=1,
+                    ),
+                )
+                pos += grow
+                capacity += grow
+            columns = {str(c).lower(): c for c in page.columns}
+            result.ts[pos - n : pos] = page.index.as_unit("ns").asi8
+            for i, col in enumerate(OHLCV_COLUMNS):
+                result.values[i, pos - n : pos] = page[columns[col.lower()]].to_numpy()
+            pos -= n
+        result = cls(result.ts[pos:], result.values[:, pos:])
+        if pos > capacity // 4:
+            # 빈 페이지가 많아 남는 공간이 크면 실제 크기로 줄임
+            result = cls(result.ts.copy(), result.values.copy())
+        return result.normalized()
+
+    def normalized(self) -> "CompactOHLCV":
+        """결측 행을 빼고 시각 순 정렬, 같은 시각은 마지막 값만 남김 (이미 그렇다면 그대로)"""
+        result = self
+        valid = ~np.isnan(result.values).any(axis=0)
+        if not valid.all():
+            result = CompactOHLCV(result.ts[valid], result.values[:, valid])
+        if len(result) > 1 and not (np.diff(result.ts) > 0).all():
+            order = np.argsort(result.ts, kind="stable")
+            ts = result.ts[order]
+            keep = np.r_[ts[1:] != ts[:-1], True]
+            order = order[keep]
+            result = CompactOHLCV(ts[keep], result.values[:, order])
+        return result
+
+    @classmethod
+    def merge(cls, old: "CompactOHLCV", new: "CompactOHLCV") -> "CompactOHLCV":
+        """정렬된 두 데이터를 합침 (같은 시각은 new 우선)
+
+        new와 시간이 겹치는 old 구간만 다시 정렬하고 나머지는 그대로 이어 붙임.
+        """
+        if old.empty:
+            return new
+        if new.empty:
+            return old
+        lo = int(np.searchsorted(old.ts, new.ts[0], side="left"))
+        hi = int(np.searchsorted(old.ts, new.ts[-1], side="right"))
+        middle = cls(
+            np.concatenate([old.ts[lo:hi], new.ts]),
+            np.concatenate([old.values[:, lo:hi], new.values.astype(old.values.dtype)], axis=1),
+        ).normalized()
+        n = lo + len(middle) + len(old) - hi
+        result = cls.allocate(n, old.values.dtype)
+        for part, start in (
+            (old.slice(0, lo), 0),
+            (middle, lo),
+            (old.slice(hi, len(old)), lo + len(middle)),
+        ):
+            result.ts[start : start + len(part)] = part.ts
+            result.values[:, start : start + len(part)] = part.values
+        return result
+
+    def slice(self, start: int, stop: int) -> "CompactOHLCV":
+        """[start, stop) 행 (복사 없음)"""
+        return CompactOHLCV(self.ts[start:stop], self.values[:, start:stop])
+
+    def since(self, when) -> "CompactOHLCV":
+        """when 이후 캔들 (복사 없음)"""
+        start = int(np.searchsorted(self.ts, pd.Timestamp(when).as_unit("ns").value))
+        return self.slice(start, len(self))
+
+    def to_frame(self) -> pd.DataFrame:
+        """backtesting.py 형식 DataFrame (가능하면 배열을 복사하지 않고 공유)"""
+        return pd.DataFrame(self.values.T, index=self.index, columns=OHLCV_COLUMNS, copy=False)
+
+    def save(self, directory: str) -> None:
+        """ts.npy / values.npy로 저장 (load(mmap=True)로 메모리 매핑해 읽을 수 있음)"""
+        os.makedirs(directory, exist_ok=True)
+        for name, arr in (("ts", self.ts), ("values", self.values)):
+            # 같은 사본을 여러 스레드가 동시에 저장해도 임시 파일이 겹치지 않도록
+            tmp_path = os.path.join(
+                directory, f"{name}.{os.getpid()}.{threading.get_ident()}.tmp.npy"
+            )
+            np.save(tmp_path, np.ascontiguousarray(arr))
+            os.replace(tmp_path, os.path.join(directory, f"{name}.npy"))
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> Optional["CompactOHLCV"]:
+        """save()로 저장한 데이터. mmap이면 실제로 읽는 부분만 메모리에 올림"""
+        mode = "r" if mmap else None
+        try:
+            ts = np.load(os.path.join(directory, "ts.npy"), mmap_mode=mode)
+            values = np.load(os.path.join(directory, "values.npy"), mmap_mode=mode)
+        except FileNotFoundError:
+            return None
+        return cls(ts, values)
@@ -1,24 +1,112 @@
-import pyupbit  # type: ignore
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 import logging
+import math
+import os
+import threading
+
+from fetcher import PageFetcher
+from ohlcv_store import OHLCV_COLUMNS, OHLCVStore
+from profiling import frame_bytes, stage
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(name)s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 logger = logging.getLogger(__name__)
 
+# 차트 단위별 캔들 하나의 길이 (월봉은 최대 길이로 근사)
+INTERVAL_DELTAS = {
+    "minute1": timedelta(minutes=1),
+    "minute3": timedelta(minutes=3),
+    "minute5": timedelta(minutes=5),
+    "minute10": timedelta(minutes=10),
+    "minute15": timedelta(minutes=15),
+    "minute30": timedelta(minutes=30),
+    "minute60": timedelta(minutes=60),
+    "minute240": timedelta(minutes=240),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=31),
+}
+
+# 업비트 캔들 API 한 번에 받을 수 있는 최대 개수
+UPBIT_PAGE_SIZE = 200
+# 업비트 캔들 인덱스는 KST, to= 파라미터는 UTC 기준
+KST_OFFSET = timedelta(hours=9)
+
+# 1분봉을 합쳐서 만들 수 있는 차트 단위
+RESAMPLE_INTERVALS = (
+    "minute3",
+    "minute5",
+    "minute10",
+    "minute15",
+    "minute30",
+    "minute60",
+    "minute240",
+    "day",
+    "week",
+    "month",
+)
+
+_store = OHLCVStore()
+
+
+_fetcher = PageFetcher(max_workers=int(os.environ.get("UPBIT_FETCH_WORKERS", "4")))
+
+
+# 켜면 업비트에 요청하지 않고 저장된 캔들만 사용 (cron 등 재현 가능한 실행용)
+_offline = os.environ.get("UPBIT_OFFLINE", "") == "1"
+
+
+def set_offline(offline: bool) -> None:
+    """저장된 캔들만 쓰고 업비트에 요청하지 않음 (없는 데이터는 오류)"""
+    global _offline
+    _offline = offline
+
+
+def set_fetcher(fetcher: PageFetcher) -> None:
+    """페이지 다운로더 교체 (동시 요청 수 조정, 테스트용 가짜 API 등)"""
+    global _fetcher
+    _fetcher = fetcher
+
+
+def _now_kst() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None) + KST_OFFSET
+
+
+def plan_cursors(interval: str, start: datetime, end: datetime) -> list:
+    """end에서 start까지 페이지가 겹치지 않게 거슬러 올라가는 to= 커서 목록 (KST)"""
+    page_span = INTERVAL_DELTAS[interval] * UPBIT_PAGE_SIZE
+    n_pages = max(1, math.ceil((end - start) / page_span))
+    return [end - page_span * k for k in range(n_pages)]
+
+
+def find_gaps(index: pd.DatetimeIndex, interval: str) -> pd.DataFrame:
+    """연속되어야 할 캔들 사이의 빈 구간 (거래 없는 구간 포함)"""
+    step = INTERVAL_DELTAS[interval]
+    if interval in ("week", "month") or len(index) < 2:
+        # 주/월봉은 길이가 일정하지 않아 검사하지 않음
+        return pd.DataFrame(columns=["start", "end", "missing"])
+    ts = index.asi8
+    diffs = np.diff(ts)
+    step_ns = int(step / timedelta(microseconds=1)) * 1000
+    pos = np.flatnonzero(diffs > step_ns)
+    return pd.DataFrame(
+        {
+            "start": index[pos],
+            "end": index[pos + 1],
+            "missing": diffs[pos] // step_ns - 1,
+        }
+    )
+
+
+def _empty_ohlcv() -> pd.DataFrame:
+    return pd.DataFrame(
+        columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([]), dtype="float64"
+    )
 
-def get_ohlcv(ticker: str, interval: str, days: int) -> pd.DataFrame:
-    dfs = []
-    for i in range(days):
-        df = pyupbit.get_ohlcv(ticker, interval, to=datetime.now() - timedelta(days=i))
-        dfs.append(df)
-    result = pd.concat(dfs).sort_index()
-    # logger.info(f"get_ohlcv 갯수: {result.count}")
-    result = result.rename(
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.rename(
         columns={
             "open": "Open",
             "high": "High",
@@ -27,9 +115,209 @@ def get_ohlcv(ticker: str, interval: str, days: int) -> pd.DataFrame:
             "volume": "Volume",
         }
     )
-    result.index = pd.to_datetime(result.index)
+    df.index = pd.to_datetime(df.index)
     # value 컬럼 제거 (불필요)
-    if "value" in result.columns:
-        result = result.drop(columns=["value"])
-    result = result.dropna().sort_index()
+    if "value" in df.columns:
+        df = df.drop(columns=["value"])
+    df = df.dropna().sort_index()
+    return df[~df.index.duplicated(keep="last")]
+
+
+def _fetch_range(ticker: str, interval: str, start: datetime, end: datetime) -> tuple:
+    """start ~ end 구간을 업비트에서 받아옴 (페이지 단위로 겹침 없이 거슬러 올라감)
+
+    반환값: (캔들, 더 과거 캔들이 없는지). 모든 페이지를 받았고 가장 오래된
+    페이지가 꽉 차지 않았을 때만 상장 시점까지 닿았다고 봄 (재시도 끝에 받지
+    못한 페이지가 있으면 False이고 그보다 과거 구간은 받지 않음). 한 페이지도
+    받지 못하면 ValueError.
+    """
+    if _offline:
+        raise ValueError(f"{ticker} {interval} 저장된 데이터가 없습니다. (오프라인)")
+    cursors = plan_cursors(interval, start, end)
+    to_list = [to - KST_OFFSET for to in cursors]
+    # 페이지별 캔들 수 (받지 못한 페이지는 None)
+    sizes = []
+
+    def pages():
+        # 상장 이전 구간은 빈 페이지만 오므로 짧은 페이지를 받으면 더 요청하지 않음
+        for page in _fetcher.iter_pages(
+            ticker, interval, UPBIT_PAGE_SIZE, to_list, stop_short=True
+        ):
+            sizes.append(None if page is None else len(page))
+            yield page
+
+    with stage("fetch") as s:
+        dfs = [df for df in pages() if df is not None]
+        s.add(
+            requests=len(sizes),
+            rows=sum(len(df) for df in dfs),
+            bytes=sum(frame_bytes(df) for df in dfs),
+        )
+    if dfs:
+        with stage("concat") as s:
+            result = _normalize(pd.concat(dfs))
+            s.add(rows=len(result))
+    else:
+        result = _empty_ohlcv()
+    failed = sizes.count(None)
+    if failed and failed == len(sizes):
+        raise ValueError(f"{ticker} {interval} 데이터를 가져올 수 없습니다.")
+    if failed:
+        skipped = len(cursors) - len(sizes) + 1
+        logger.warning(f"{ticker} {interval} 페이지를 받지 못해 과거 {skipped}개 구간 생략")
+    exhausted = not failed and bool(sizes) and sizes[-1] < UPBIT_PAGE_SIZE
+    if result.empty:
+        return result, exhausted
+    index = result.index
+    gaps = find_gaps(index[index >= start], interval)
+    if not gaps.empty:
+        logger.warning(
+            f"{ticker} {interval} 빈 구간 {len(gaps)}개 (누락 캔들 {gaps['missing'].sum()}개)"
+        )
+    logger.info(f"{ticker} {interval} 요청 {len(sizes)}회, 캔들 {len(result)}개")
+    return result, exhausted
+
+
+def _load_cached_range(
+    ticker: str, interval: str, start: datetime, end: datetime
+) -> pd.DataFrame:
+    """캐시를 읽고 start ~ end 중 빠진 앞/뒤 구간만 받아 병합한 전체 데이터"""
+    step = INTERVAL_DELTAS.get(interval, timedelta(days=1))
+    with stage("cache_load") as s:
+        cached = _store.load(ticker, interval)
+        s.add(rows=0 if cached is None else len(cached), bytes=frame_bytes(cached))
+    fetched = []
+    # 상장 시점까지 받은 것이 확인되면 첫 캔들 시각 (요청 실패로 비어 있던 경우는 제외)
+    listed_from = None
+    if cached is None or cached.empty:
+        data, exhausted = _fetch_range(ticker, interval, start, end)
+        if exhausted and not data.empty:
+            listed_from = data.index[0]
+        fetched.append(data)
+    elif not _offline:
+        first, last = cached.index[0], cached.index[-1]
+        # 앞쪽(과거) 누락 구간: 상장 이전이라 더 없는 경우는 다시 받지 않음
+        if start < first - step and "listed_from" not in _store.load_meta(ticker, interval):
+            head, exhausted = _fetch_range(ticker, interval, start, first)
+            if exhausted:
+                listed_from = first if head.empty else head.index[0]
+            fetched.append(head)
+        # 뒤쪽(최신) 누락 구간: 마지막 캔들(진행 중일 수 있음)부터 다시 받아 덮어씀
+        if end - last >= step:
+            fetched.append(_fetch_range(ticker, interval, last, end)[0])
+    if listed_from is not None:
+        meta = _store.load_meta(ticker, interval)
+        _store.save_meta(
+            ticker, interval, {**meta, "listed_from": pd.Timestamp(listed_from).isoformat()}
+        )
+
+    fetched = [df for df in fetched if not df.empty]
+    if fetched:
+        logger.info(f"{ticker} {interval} 신규 캔들 {sum(len(df) for df in fetched)}개 저장")
+        with stage("cache_save") as s:
+            merged = _store.merge(ticker, interval, pd.concat(fetched))
+            s.add(rows=len(merged), bytes=frame_bytes(merged))
+        return merged
+    logger.info(f"{ticker} {interval} 캐시 데이터 사용")
+    return cached if cached is not None else _empty_ohlcv()
+
+
+def bin_labels(ts_kst: np.ndarray, interval: str) -> np.ndarray:
+    """KST 시각(ns)을 업비트 캔들 시작 시각(ns)으로 내림
+
+    업비트 캔들 경계는 UTC 기준 (일/주/월봉은 09:00 KST 시작, 주봉은 월요일,
+    240분봉은 01/05/09...시 시작)이므로 UTC로 바꿔 내린 뒤 되돌림.
+    """
+    offset = KST_OFFSET // timedelta(microseconds=1) * 1000
+    ts = ts_kst - offset
+    if interval == "month":
+        labels = ts.astype("datetime64[ns]").astype("datetime64[M]")
+        labels = labels.astype("datetime64[ns]").astype(np.int64)
+    elif interval == "week":
+        step = INTERVAL_DELTAS[interval] // timedelta(microseconds=1) * 1000
+        # 1970-01-01은 목요일이므로 월요일(1970-01-05) 기준으로 맞춤
+        monday = timedelta(days=4) // timedelta(microseconds=1) * 1000
+        labels = (ts - monday) // step * step + monday
+    else:
+        step = INTERVAL_DELTAS[interval] // timedelta(microseconds=1) * 1000
+        labels = ts // step * step
+    return labels + offset
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """정렬된 분봉을 업비트 캔들 경계에 맞춰 상위 차트 단위로 합침"""
+    if df.empty:
+        return df
+    labels = bin_labels(df.index.as_unit("ns").asi8, interval)
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(labels)] - 1
+    high = df["High"].to_numpy()
+    low = df["Low"].to_numpy()
+    volume = df["Volume"].to_numpy()
+    return pd.DataFrame(
+        {
+            "Open": df["Open"].to_numpy()[starts],
+            "High": np.maximum.reduceat(high, starts),
+            "Low": np.minimum.reduceat(low, starts),
+            "Close": df["Close"].to_numpy()[ends],
+            "Volume": np.add.reduceat(volume, starts),
+        },
+        index=pd.DatetimeIndex(labels[starts].astype("datetime64[ns]")),
+    )
+
+
+# 1분봉에서 만든 상위 차트 단위 캐시: (종목, 단위, 시작) -> (1분봉 길이, 마지막 시각, 결과)
+_resampled = OrderedDict()
+_RESAMPLED_MAX_ITEMS = 32
+# 배치/작업 스레드가 같은 캐시를 함께 쓰므로 조회/갱신은 잠금 안에서
+_resampled_lock = threading.Lock()
+
+
+def _get_resampled(
+    ticker: str, interval: str, start: datetime, end: datetime
+) -> pd.DataFrame:
+    # 첫 캔들이 잘리지 않도록 시작 시각을 캔들 경계로 내림
+    aligned_start = pd.Timestamp(
+        bin_labels(np.array([pd.Timestamp(start).value]), interval)[0]
+    )
+    minute1 = _load_cached_range(ticker, "minute1", aligned_start, end)
+    minute1 = minute1[minute1.index >= aligned_start]
+    key = (ticker, interval, aligned_start)
+    signature = (len(minute1), minute1.index[-1] if len(minute1) else None)
+    with _resampled_lock:
+        hit = _resampled.get(key)
+        if hit is not None and hit[0] == signature:
+            _resampled.move_to_end(key)
+            return hit[1]
+    with stage("resample") as s:
+        result = resample_ohlcv(minute1, interval)
+        s.add(rows=len(result))
+    with _resampled_lock:
+        _resampled[key] = (signature, result)
+        while len(_resampled) > _RESAMPLED_MAX_ITEMS:
+            _resampled.popitem(last=False)
+    return result
+
+
+def get_ohlcv(
+    ticker: str,
+    interval: str,
+    days: int,
+    use_cache: bool = True,
+    resample: bool = True,
+) -> pd.DataFrame:
+    """최근 days일 캔들. 1분봉 외 단위는 기본적으로 캐시된 1분봉을 합쳐 만듦"""
+    end = _now_kst()
+    start = end - timedelta(days=days)
+    with stage("get_ohlcv") as s:
+        if not use_cache:
+            result = _fetch_range(ticker, interval, start, end)[0]
+            result = result[result.index >= start]
+        elif resample and interval in RESAMPLE_INTERVALS:
+            result = _get_resampled(ticker, interval, start, end)
+        else:
+            result = _load_cached_range(ticker, interval, start, end)
+            result = result[result.index >= start]
+        s.add(rows=len(result))
     return result
+
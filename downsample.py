@@ -0,0 +1,111 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# 차트 한 번에 그리는 점 수 상한 (브라우저가 멈추지 않는 수준)
+MAX_POINTS = 5000
+
+METHODS = ("lttb", "minmax")
+
+# LTTB 전에 min/max로 먼저 줄여 둘 배수 (반복 횟수를 원본 길이와 무관하게 유지)
+_LTTB_PRESELECT = 4
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """구간마다 최솟값/최댓값 위치만 남긴 인덱스 (양 끝 포함, 최대 약 n_out개)
+
+    봉 수와 관계없이 NumPy 연산 몇 번으로 끝나며, 급등/급락 같은 극값은
+    구간 크기에 상관없이 항상 보존됨.
+    """
+    valid = np.flatnonzero(np.isfinite(y))
+    n = len(valid)
+    if n <= max(n_out, 2):
+        return valid
+    n_buckets = max(1, (n_out - 2) // 2)
+    size = -(-n // n_buckets)
+    n_buckets = -(-n // size)
+    values = y[valid]
+    # 마지막 구간을 끝 값으로 채워 (구간 수, 구간 크기) 행렬로 만듦
+    padded = np.empty(n_buckets * size)
+    padded[:n] = values
+    padded[n:] = values[-1]
+    buckets = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    lows = np.minimum(offsets + buckets.argmin(axis=1), n - 1)
+    highs = np.minimum(offsets + buckets.argmax(axis=1), n - 1)
+    return valid[np.unique(np.concatenate([[0, n - 1], lows, highs]))]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets로 고른 n_out개 인덱스 (양 끝 포함)
+
+    구간마다 앞 구간에서 고른 점, 다음 구간 평균과 이루는 삼각형이 가장 큰
+    점을 고름. 원본이 크면 min/max로 n_out * 4개 후보를 먼저 골라 반복 횟수와
+    구간 크기를 원본 길이와 무관하게 유지함 (MinMaxLTTB).
+    """
+    candidates = np.flatnonzero(np.isfinite(y))
+    if len(candidates) > n_out * _LTTB_PRESELECT:
+        candidates = minmax_indices(y, n_out * _LTTB_PRESELECT)
+    n = len(candidates)
+    if n <= max(n_out, 3):
+        return candidates
+    cx = x[candidates].astype(float)
+    cy = y[candidates].astype(float)
+    # 가운데 n_out - 2개 구간 경계와 구간별 평균 (다음 구간 평균으로 씀)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(cx[1:-1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(cy[1:-1], edges[:-1] - 1) / counts
+    next_x = np.r_[mean_x[1:], cx[-1]]
+    next_y = np.r_[mean_y[1:], cy[-1]]
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (cx[a] - next_x[i]) * (cy[lo:hi] - cy[a]) - (cx[a] - cx[lo:hi]) * (next_y[i] - cy[a])
+        )
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return candidates[selected]
+
+
+def downsample(
+    df: pd.DataFrame,
+    n_out: int = MAX_POINTS,
+    method: str = "lttb",
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """각 컬럼의 모양을 유지하는 점들의 합집합 행만 남긴 df (최대 약 n_out행)
+
+    columns(기본: 숫자 컬럼 전체)마다 n_out을 나눠 점을 고르므로 모든 선이
+    같은 x 위치를 공유함. 이미 n_out행 이하면 그대로 반환함.
+    """
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 방식: {method}")
+    if len(df) <= n_out:
+        return df
+    columns = list(columns or df.select_dtypes("number").columns)
+    per_column = max(3, n_out // max(1, len(columns)))
+    if isinstance(df.index, pd.DatetimeIndex):
+        x = df.index.asi8
+    else:
+        x = np.arange(len(df))
+    picked = []
+    for col in columns:
+        y = df[col].to_numpy(dtype=float)
+        if method == "lttb":
+            picked.append(lttb_indices(x, y, per_column))
+        else:
+            picked.append(minmax_indices(y, per_column))
+    return df.iloc[np.unique(np.concatenate(picked))]
+
+
+def visible_range(index: pd.DatetimeIndex, start, end) -> slice:
+    """정렬된 시각 인덱스에서 [start, end] 구간의 위치 slice (복사 없음)"""
+    lo = int(index.searchsorted(pd.Timestamp(start), side="left"))
+    hi = int(index.searchsorted(pd.Timestamp(end), side="right"))
+    return slice(lo, hi)
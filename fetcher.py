@@ -0,0 +1,205 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 업비트 시세 조회 API 초당 요청 제한 (IP 단위)
+UPBIT_QUOTA_PER_SEC = 10
+
+UPBIT_CANDLES_URL = "https://api.upbit.com/v1/candles"
+
+# 캔들 API 필드 -> pyupbit.get_ohlcv 컬럼 이름
+_CANDLE_FIELDS = {
+    "opening_price": "open",
+    "high_price": "high",
+    "low_price": "low",
+    "trade_price": "close",
+    "candle_acc_trade_volume": "volume",
+    "candle_acc_trade_price": "value",
+}
+
+_local = threading.local()
+
+
+def _candle_path(interval: str) -> str:
+    if interval.startswith("minute"):
+        return f"minutes/{interval[len('minute'):]}"
+    return {"day": "days", "week": "weeks", "month": "months"}[interval]
+
+
+def upbit_candles(ticker: str, interval: str, count: int = 200, to=None, timeout: float = 10):
+    """업비트 캔들 API를 직접 호출해 pyupbit.get_ohlcv와 같은 형식으로 반환
+
+    pyupbit는 요청 제한(429) 같은 오류와 상장 이전 구간의 빈 응답을 모두
+    None으로 돌려줘 구분할 수 없으므로, HTTP 오류는 예외로 올리고 캔들이 없으면
+    빈 DataFrame을 반환함. to는 UTC 시각 (그 이전 count개, 인덱스는 KST).
+    """
+    # requests는 실제로 받아올 때만 불러옴 (캐시만 쓰는 실행의 시작 시간 단축)
+    import requests
+
+    session = getattr(_local, "session", None)
+    if session is None:
+        # 스레드마다 연결을 재사용
+        session = _local.session = requests.Session()
+    params = {"market": ticker, "count": count}
+    if to is not None:
+        params["to"] = pd.Timestamp(to).strftime("%Y-%m-%d %H:%M:%S")
+    response = session.get(
+        f"{UPBIT_CANDLES_URL}/{_candle_path(interval)}", params=params, timeout=timeout
+    )
+    response.raise_for_status()
+    df = pd.DataFrame(response.json(), columns=["candle_date_time_kst", *_CANDLE_FIELDS])
+    df.index = pd.DatetimeIndex(pd.to_datetime(df.pop("candle_date_time_kst")).to_numpy())
+    return df.rename(columns=_CANDLE_FIELDS).sort_index()
+
+
+def is_retryable(exc: Exception) -> bool:
+    """네트워크 오류, 요청 제한(429), 서버 오류(5xx)만 다시 시도함
+
+    그 외 HTTP 오류(없는 종목의 404 등)는 다시 보내도 같은 결과이므로 바로 올림.
+    """
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    # requests의 연결/시간 초과 오류는 OSError 계열
+    return isinstance(exc, OSError)
+
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷 (초당 rate개, 최대 capacity개까지 누적)"""
+
+    def __init__(self, rate: float = UPBIT_QUOTA_PER_SEC, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class PageFetcher:
+    """캔들 페이지 요청을 병렬로 보내는 다운로더
+
+    fetch_fn은 pyupbit.get_ohlcv와 같은 시그니처를 가지며(기본: upbit_candles),
+    None을 반환하거나 네트워크 오류/429/5xx 예외를 던지면 지수 백오프로
+    재시도하고, 그 밖의 예외는 바로 올림. 빈 DataFrame은 그 구간에 캔들이
+    없다는 뜻이므로 재시도하지 않음.
+    """
+
+    def __init__(
+        self,
+        fetch_fn: Optional[Callable] = None,
+        max_workers: int = 4,
+        limiter: Optional[TokenBucket] = None,
+        max_retries: int = 4,
+        backoff: float = 0.2,
+    ):
+        self.fetch_fn = fetch_fn or upbit_candles
+        self.max_workers = max_workers
+        self.limiter = limiter or TokenBucket()
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.request_count = 0
+        self.retry_count = 0
+        self._count_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="upbit-fetch"
+            )
+        return self._executor
+
+    def fetch_page(self, ticker: str, interval: str, count: int, to):
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            with self._count_lock:
+                self.request_count += 1
+                if attempt:
+                    self.retry_count += 1
+            try:
+                df = self.fetch_fn(ticker, interval, count=count, to=to)
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                logger.debug(f"{ticker} {interval} to={to} 요청 실패: {e}")
+                df = None
+            if df is not None:
+                return df
+            if attempt < self.max_retries:
+                time.sleep(self.backoff * 2**attempt * (1 + random.random()))
+        logger.warning(f"{ticker} {interval} to={to} 재시도 {self.max_retries}회 초과")
+        return None
+
+    def iter_pages(
+        self, ticker: str, interval: str, count: int, cursors: list, stop_short: bool = False
+    ):
+        """fetch_pages와 같은 순서로, 받는 대로 하나씩 넘김 (모든 페이지를 들고 있지 않음)
+
+        재시도 끝에 받지 못한 페이지(None)를 넘기면 남은 커서는 요청하지 않음.
+        stop_short이면 커서가 최신부터 거슬러 올라간다고 보고, count개보다 적게 온
+        페이지(상장 시점에 닿음) 뒤의 더 오래된 커서도 요청하지 않음.
+        """
+
+        def is_last(page) -> bool:
+            return page is None or (stop_short and len(page) < count)
+
+        if self.max_workers <= 1 or len(cursors) <= 1:
+            for to in cursors:
+                page = self.fetch_page(ticker, interval, count, to)
+                yield page
+                if is_last(page):
+                    return
+            return
+        executor = self._get_executor()
+        remaining = iter(cursors)
+        pending = deque()
+        try:
+            while True:
+                # 동시 요청 수의 두 배까지만 미리 보내 두어 빈 페이지 뒤로 낭비를 줄임
+                while len(pending) < self.max_workers * 2:
+                    to = next(remaining, None)
+                    if to is None:
+                        break
+                    pending.append(executor.submit(self.fetch_page, ticker, interval, count, to))
+                if not pending:
+                    return
+                page = pending.popleft().result()
+                yield page
+                if is_last(page):
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def fetch_pages(
+        self, ticker: str, interval: str, count: int, cursors: list, stop_short: bool = False
+    ) -> list:
+        """커서 순서대로 결과를 반환 (실패한 페이지는 None이고 그 뒤는 요청하지 않음)"""
+        return list(self.iter_pages(ticker, interval, count, cursors, stop_short))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
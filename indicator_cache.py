@@ -0,0 +1,94 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = int(os.environ.get("INDICATOR_CACHE_MB", "256")) * 1024 * 1024
+
+
+def fingerprint(values) -> str:
+    """배열 내용 기반 식별자 (같은 데이터면 실행이 달라도 같은 값)"""
+    arr = np.ascontiguousarray(values)
+    digest = hashlib.blake2b(arr.view(np.uint8), digest_size=16).hexdigest()
+    return f"{arr.dtype.str}:{len(arr)}:{digest}"
+
+
+class IndicatorCache:
+    """지표 계산 결과를 (데이터 식별자, 지표 이름, 파라미터) 키로 보관하는 LRU 캐시"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._nbytes = 0
+        self._items: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = np.asarray(compute())
+        # 여러 실행이 공유하므로 수정되지 않도록 읽기 전용으로 보관
+        value.setflags(write=False)
+        if value.nbytes > self.max_bytes:
+            return value
+        with self._lock:
+            if key not in self._items:
+                self._items[key] = value
+                self._nbytes += value.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+                self.evictions += 1
+        return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+                "items": len(self._items),
+                "bytes": self._nbytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+
+_cache = IndicatorCache()
+
+
+def get_cache() -> IndicatorCache:
+    return _cache
+
+
+def cache_stats() -> dict:
+    return _cache.stats()
+
+
+def ema(values, span: int, data_key: str = None) -> np.ndarray:
+    data_key = data_key or fingerprint(values)
+    return _cache.get_or_compute(
+        (data_key, "ema", span),
+        lambda: pd.Series(values).ewm(span=span, adjust=False).mean().values,
+    )
+
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import Optional
+
+import pandas as pd
+
+from backtest_runner import normalize_params
+from result_cache import ResultCache, result_key
+from run_store import RunStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_DIR = os.environ.get(
+    "BACKTEST_JOB_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "jobs"),
+)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# 메모리에 남겨 둘 최대 작업 수 (넘으면 끝난 작업부터 디스크 조회로 돌림)
+MAX_JOBS_IN_MEMORY = 1000
+
+
+class JobQueueFull(RuntimeError):
+    """대기 중인 작업 수가 한도를 넘음"""
+
+
+def params_key(params: dict) -> str:
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _init_worker() -> None:
+    import backtest_runner
+
+    logging.getLogger(backtest_runner.__name__).setLevel(logging.WARNING)
+
+
+def _simulate(params: dict, df: pd.DataFrame) -> pd.Series:
+    from backtest_runner import run_backtest
+
+    result = run_backtest(params, df=df)
+    if "_strategy" in result.index:
+        # 전략 클래스는 실행 중에 만든 것이라 프로세스 간에 주고받을 수 없음
+        result = result.copy()
+        result["_strategy"] = str(result["_strategy"])
+    return result
+
+
+class JobManager:
+    """백테스트 작업 큐
+
+    작업마다 데이터 수집은 스레드에서, 시뮬레이션은 프로세스 풀에서 실행함.
+    같은 파라미터로 실행 중인 작업이 있으면 새로 만들지 않고 그 작업을 돌려주고,
+    같은 종목/차트 단위의 데이터 수집은 한 번에 하나만 실행해 캐시를 공유함.
+    작업 상태(JSON)와 결과는 store_dir에 저장되어 서버를 다시 시작해도 조회 가능.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+        store_dir: str = DEFAULT_JOB_DIR,
+        result_ttl_seconds: float = 7 * 24 * 3600,
+        run_store: Optional[RunStore] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+        self.results = ResultCache(
+            max_items=256,
+            ttl_seconds=result_ttl_seconds,
+            disk_dir=os.path.join(store_dir, "results"),
+        )
+        self.runs = run_store or RunStore()
+        self._jobs = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._fetch_locks = defaultdict(threading.Lock)
+        self._runner = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="backtest-job"
+        )
+        self._sim_executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_sim_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._sim_executor is None:
+                self._sim_executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            return self._sim_executor
+
+    def _meta_path(self, job_id: str) -> str:
+        return os.path.join(self.store_dir, f"{job_id}.json")
+
+    def _save(self, job: dict) -> None:
+        path = self._meta_path(job["id"])
+        # 같은 작업 상태를 여러 스레드가 동시에 기록할 수 있음 (락 밖에서 저장)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+    def _update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(fields)
+            snapshot = dict(job)
+        self._save(snapshot)
+
+    def submit(self, params: dict) -> tuple:
+        """(작업 정보, 중복 여부). 대기 작업이 너무 많으면 JobQueueFull"""
+        # 앱에서 직접 실행한 결과와 캐시/실행 기록 키를 맞춤
+        params = normalize_params(params)
+        key = params_key(params)
+        with self._lock:
+            job_id = self._inflight.get(key)
+            if job_id is not None:
+                return dict(self._jobs[job_id]), True
+            pending = sum(job["status"] == QUEUED for job in self._jobs.values())
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"대기 중인 작업이 {pending}개로 가득 찼습니다.")
+            job_id = uuid.uuid4().hex
+            job = {
+                "id": job_id,
+                "params": params,
+                "status": QUEUED,
+                "stage": "대기 중",
+                "progress": 0.0,
+                "created": time.time(),
+                "started": None,
+                "finished": None,
+                "error": None,
+                "from_cache": False,
+                "run_id": None,
+            }
+            self._jobs[job_id] = job
+            self._inflight[key] = job_id
+            if len(self._jobs) > MAX_JOBS_IN_MEMORY:
+                finished = [j for j in self._jobs.values() if j["status"] in (DONE, FAILED)]
+                for old in sorted(finished, key=lambda j: j["created"])[
+                    : len(self._jobs) - MAX_JOBS_IN_MEMORY
+                ]:
+                    del self._jobs[old["id"]]
+            snapshot = dict(job)
+        self._save(snapshot)
+        self._runner.submit(self._run, job_id, key, params)
+        return snapshot, False
+
+    def _run(self, job_id: str, key: str, params: dict) -> None:
+        from data_collector import get_ohlcv
+
+        try:
+            self._update(
+                job_id, status=RUNNING, stage="데이터 수집", progress=0.1, started=time.time()
+            )
+            # 분봉을 합쳐 만드는 차트 단위들이 같은 1분봉 캐시를 쓰므로 종목 단위로 잠금
+            with self._fetch_locks[params["ticker"]]:
+                df = get_ohlcv(params["ticker"], params["interval"], params["days"])
+            if df is None or df.empty:
+                raise ValueError(f"{params['ticker']} {params['interval']} 데이터 없음")
+
+            # 같은 설정/데이터의 결과가 이미 있으면 다시 계산하지 않음
+            cache_key = result_key(params, df)
+            result = self.results.get(cache_key)
+            from_cache = result is not None
+            if not from_cache:
+                self._update(job_id, stage="백테스트 실행", progress=0.4)
+                result = self._get_sim_executor().submit(_simulate, params, df).result()
+                self.results.put(cache_key, result)
+            self.results.put(job_id, result)
+            run_id = None if from_cache else self._record(params, result)
+            self._update(
+                job_id,
+                status=DONE,
+                stage="완료",
+                progress=1.0,
+                finished=time.time(),
+                from_cache=from_cache,
+                run_id=run_id,
+            )
+        except Exception as e:
+            logger.error(f"작업 {job_id} 실패: {e}")
+            self._update(
+                job_id, status=FAILED, stage="실패", error=str(e), finished=time.time()
+            )
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _record(self, params: dict, result) -> Optional[int]:
+        # 실행 기록 저장 실패는 작업 결과에 영향을 주지 않음
+        try:
+            return self.runs.save(params, result)
+        except Exception as e:
+            logger.warning(f"실행 기록 저장 실패: {e}")
+            return None
+
+    def get(self, job_id: str) -> Optional[dict]:
+        if not job_id.isalnum():
+            return None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return dict(job)
+        try:
+            with open(self._meta_path(job_id), encoding="utf-8") as f:
+                job = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if job["status"] in (QUEUED, RUNNING):
+            # 이전 서버 프로세스에서 끝나지 못한 작업
+            job.update(status=FAILED, stage="실패", error="서버 재시작으로 중단됨")
+        return job
+
+    def result(self, job_id: str):
+        return self.results.get(job_id)
+
+    def list(self, limit: int = 50) -> list:
+        with self._lock:
+            jobs = sorted(self._jobs.values(), key=lambda job: job["created"], reverse=True)
+            return [dict(job) for job in jobs[:limit]]
+
+    def shutdown(self) -> None:
+        self._runner.shutdown(wait=True)
+        if self._sim_executor is not None:
+            self._sim_executor.shutdown(wait=True)
@@ -0,0 +1,84 @@
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 기본 저장 위치 (환경변수로 변경 가능)
+DEFAULT_STORE_DIR = os.environ.get(
+    "OHLCV_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ohlcv"),
+)
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _tmp_path(path: str) -> str:
+    """같은 파일을 여러 프로세스/스레드가 동시에 써도 겹치지 않는 임시 파일 이름"""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+class OHLCVStore:
+    """종목/차트 단위별 캔들을 Parquet 파일로 보관하는 로컬 저장소"""
+
+    def __init__(self, root: str = DEFAULT_STORE_DIR):
+        self.root = root
+
+    def _base_path(self, ticker: str, interval: str) -> str:
+        return os.path.join(self.root, ticker.upper(), interval)
+
+    def path(self, ticker: str, interval: str) -> str:
+        return self._base_path(ticker, interval) + ".parquet"
+
+    def _meta_path(self, ticker: str, interval: str) -> str:
+        return self._base_path(ticker, interval) + ".meta.json"
+
+    def load(self, ticker: str, interval: str) -> Optional[pd.DataFrame]:
+        path = self.path(ticker, interval)
+        if not os.path.exists(path):
+            return None
+        try:
+            df = pd.read_parquet(path)
+        except Exception as e:
+            # 손상된 파일은 무시하고 다시 받도록 함
+            logger.warning(f"캐시 파일 읽기 실패 ({path}): {e}")
+            return None
+        df.index = pd.to_datetime(df.index)
+        return df
+
+    def save(self, ticker: str, interval: str, df: pd.DataFrame) -> None:
+        path = self.path(ticker, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 쓰기 도중 중단되어도 기존 파일이 깨지지 않도록 임시 파일 후 교체
+        tmp_path = _tmp_path(path)
+        df[OHLCV_COLUMNS].to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    def merge(self, ticker: str, interval: str, df: pd.DataFrame) -> pd.DataFrame:
+        """새로 받은 캔들을 기존 캐시에 병합 후 저장 (같은 시각은 새 값 우선)"""
+        cached = self.load(ticker, interval)
+        if cached is not None and not cached.empty:
+            df = pd.concat([cached, df[OHLCV_COLUMNS]])
+            df = df[~df.index.duplicated(keep="last")]
+        df = df.sort_index()
+        self.save(ticker, interval, df)
+        return df
+
+    def load_meta(self, ticker: str, interval: str) -> dict:
+        path = self._meta_path(ticker, interval)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_meta(self, ticker: str, interval: str, meta: dict) -> None:
+        path = self._meta_path(ticker, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = _tmp_path(path)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,172 @@
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# 결과 표에 함께 보여줄 지표
+RESULT_METRICS = [
+    "Return [%]",
+    "Max. Drawdown [%]",
+    "Win Rate [%]",
+    "# Trades",
+    "Sharpe Ratio",
+    "Profit Factor",
+    "Equity Final [$]",
+]
+
+
+def _expand(spec) -> list:
+    """(시작, 끝, 간격) 튜플은 끝값을 포함한 범위로, 리스트는 그대로 사용"""
+    if isinstance(spec, tuple) and len(spec) == 3:
+        start, stop, step = spec
+        if all(isinstance(v, int) for v in spec):
+            return list(range(start, stop + 1, step))
+        count = int(round((stop - start) / step)) + 1
+        return [round(start + step * i, 10) for i in range(count)]
+    if isinstance(spec, (list, tuple)):
+        return list(spec)
+    return [spec]
+
+
+def _is_valid(combo: dict) -> bool:
+    fast = combo.get("fast_period")
+    slow = combo.get("slow_period")
+    return fast is None or slow is None or fast < slow
+
+
+def build_grid(param_ranges: dict) -> list:
+    keys = list(param_ranges)
+    values = [_expand(param_ranges[k]) for k in keys]
+    combos = (dict(zip(keys, v)) for v in itertools.product(*values))
+    return [c for c in combos if _is_valid(c)]
+
+
+def sample_random(param_ranges: dict, n_samples: int, seed: Optional[int] = None) -> list:
+    """그리드에서 중복 없이 n_samples개 무작위 추출"""
+    grid = build_grid(param_ranges)
+    if n_samples >= len(grid):
+        return grid
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(len(grid), size=n_samples, replace=False)
+    return [grid[i] for i in sorted(picks)]
+
+
+class SharedOHLCV:
+    """OHLCV 데이터를 공유 메모리에 올려 워커들이 복사 없이 읽도록 함"""
+
+    def __init__(self, df: pd.DataFrame):
+        n = len(df)
+        self._values = shared_memory.SharedMemory(create=True, size=max(1, n * 8 * 5))
+        self._index = shared_memory.SharedMemory(create=True, size=max(1, n * 8))
+        values = np.ndarray((5, n), dtype=np.float64, buffer=self._values.buf)
+        for i, col in enumerate(OHLCV_COLUMNS):
+            values[i] = df[col].to_numpy(dtype=np.float64)
+        index = np.ndarray((n,), dtype=np.int64, buffer=self._index.buf)
+        index[:] = df.index.as_unit("ns").asi8
+        self.spec = (self._values.name, self._index.name, n)
+
+    def close(self) -> None:
+        for shm in (self._values, self._index):
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_shared_ohlcv(spec: tuple):
+    """공유 메모리 블록을 복사 없이 DataFrame으로 감쌈 (블록 핸들도 함께 반환)"""
+    values_name, index_name, n = spec
+    handles = []
+    for name in (values_name, index_name):
+        handles.append(shared_memory.SharedMemory(name=name))
+    values = np.ndarray((5, n), dtype=np.float64, buffer=handles[0].buf)
+    index = np.ndarray((n,), dtype=np.int64, buffer=handles[1].buf)
+    df = pd.DataFrame(
+        {col: values[i] for i, col in enumerate(OHLCV_COLUMNS)},
+        index=pd.DatetimeIndex(index.view("datetime64[ns]")),
+        copy=False,
+    )
+    return df, handles
+
+
+_worker_df: Optional[pd.DataFrame] = None
+_worker_handles: list = []
+
+
+def _init_worker(spec: tuple) -> None:
+    global _worker_df, _worker_handles
+    import backtest_runner
+
+    # 조합마다 남는 INFO 로그는 생략
+    logging.getLogger(backtest_runner.__name__).setLevel(logging.WARNING)
+    _worker_df, _worker_handles = attach_shared_ohlcv(spec)
+
+
+def _evaluate(params: dict) -> dict:
+    from backtest_runner import run_backtest
+
+    stats = run_backtest(params, df=_worker_df)
+    return {metric: stats.get(metric) for metric in RESULT_METRICS}
+
+
+def optimize(
+    base_params: dict,
+    param_ranges: dict,
+    metric: str = "Return [%]",
+    method: str = "grid",
+    n_samples: int = 100,
+    df: Optional[pd.DataFrame] = None,
+    max_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> pd.DataFrame:
+    """파라미터 조합을 프로세스 풀에서 평가해 metric 기준 순위표를 반환
+
+    param_ranges 값은 (시작, 끝, 간격) 튜플 또는 후보 리스트. method는
+    "grid"(전체 조합) 또는 "random"(n_samples개 무작위 추출).
+    """
+    if method == "grid":
+        combos = build_grid(param_ranges)
+    elif method == "random":
+        combos = sample_random(param_ranges, n_samples, seed)
+    else:
+        raise ValueError(f"지원하지 않는 최적화 방식: {method}")
+    if not combos:
+        raise ValueError("평가할 파라미터 조합이 없습니다.")
+
+    if df is None:
+        from data_collector import get_ohlcv
+
+        df = get_ohlcv(base_params["ticker"], base_params["interval"], base_params["days"])
+    # 최적화는 결과가 같은 벡터 엔진을 기본으로 사용
+    base = {"engine": "vector", **base_params}
+    runs = [{**base, **combo} for combo in combos]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(runs) // (max_workers * 8))
+    logger.info(f"파라미터 최적화 시작: {len(runs)}개 조합, 워커 {max_workers}개")
+    with SharedOHLCV(df) as shared:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(shared.spec,),
+        ) as executor:
+            results = list(executor.map(_evaluate, runs, chunksize=chunksize))
+
+    table = pd.concat([pd.DataFrame(combos), pd.DataFrame(results)], axis=1)
+    table = table.sort_values(metric, ascending=False, na_position="last")
+    logger.info("파라미터 최적화 완료")
+    return table.reset_index(drop=True)
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from signal_strategy import get_strategy
+from streaming import BUY, SELL, StreamingStrategy
+
+logger = logging.getLogger(__name__)
+
+# 업비트 최소 주문 금액 (원)
+MIN_ORDER_VALUE = 5000
+
+
+class Candle(NamedTuple):
+    ticker: str
+    time: pd.Timestamp
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class CandleFeed:
+    """마감된 캔들을 비동기로 흘려보내는 피드 (실시간/재생 피드가 상속)"""
+
+    def __aiter__(self) -> AsyncIterator[Candle]:
+        raise NotImplementedError
+
+
+class ReplayFeed(CandleFeed):
+    """저장된 OHLCV를 시간 순서대로 재생하는 피드
+
+    speed가 0이면 대기 없이 최대한 빠르게, 그 외에는 캔들 시각 간격을
+    speed배 빠르게 흘려보냄 (1.0이면 실제 시간).
+    """
+
+    def __init__(self, frames: Dict[str, pd.DataFrame], speed: float = 0.0):
+        self.frames = frames
+        self.speed = speed
+
+    async def __aiter__(self) -> AsyncIterator[Candle]:
+        # 전 종목 캔들을 시각 순으로 병합
+        merged = pd.concat(
+            [df.assign(ticker=ticker) for ticker, df in self.frames.items()]
+        ).sort_index(kind="stable")
+        times = merged.index
+        values = merged[["Open", "High", "Low", "Close", "Volume"]].to_numpy()
+        tickers = merged["ticker"].to_numpy()
+        prev_time = None
+        for i in range(len(merged)):
+            current = times[i]
+            if self.speed and prev_time is not None and current > prev_time:
+                await asyncio.sleep((current - prev_time).total_seconds() / self.speed)
+            elif current != prev_time:
+                # 새 시각의 캔들이 오기 전에 종목 태스크들이 처리할 기회를 줌
+                await asyncio.sleep(0)
+            prev_time = current
+            o, h, l, c, v = values[i]
+            yield Candle(tickers[i], current, o, h, l, c, v)
+
+
+class VirtualAccount:
+    """종목별 가상 계좌 (시장가 주문을 다음 캔들 시가에 수수료 포함 체결)"""
+
+    def __init__(self, cash: float, commission: float = 0.0005):
+        self.initial_cash = cash
+        self.cash = cash
+        self.commission = commission
+        self.size = 0.0
+        self.entry_price = None
+        self.entry_time = None
+        self.last_price = None
+        self.trades = []
+
+    @property
+    def equity(self) -> float:
+        price = self.last_price if self.last_price is not None else 0.0
+        return self.cash + self.size * price
+
+    def buy(self, price: float, when) -> bool:
+        size = self.cash / (price * (1 + self.commission))
+        if size * price < MIN_ORDER_VALUE:
+            return False
+        self.cash -= size * price * (1 + self.commission)
+        self.size = size
+        self.entry_price = price
+        self.entry_time = when
+        return True
+
+    def sell(self, price: float, when) -> None:
+        proceeds = self.size * price * (1 - self.commission)
+        cost = self.size * self.entry_price * (1 + self.commission)
+        self.cash += proceeds
+        self.trades.append(
+            {
+                "EntryTime": self.entry_time,
+                "ExitTime": when,
+                "EntryPrice": self.entry_price,
+                "ExitPrice": price,
+                "Size": self.size,
+                "PnL": proceeds - cost,
+                "ReturnPct": proceeds / cost - 1,
+            }
+        )
+        self.size = 0.0
+        self.entry_price = None
+        self.entry_time = None
+
+
+class _TickerRunner:
+    def __init__(self, ticker: str, params: dict, cash: float, commission: float):
+        self.ticker = ticker
+        # 백테스트 파라미터(ticker, days, cash 등)가 섞여 와도 전략 파라미터만 넘김
+        spec = get_strategy(params.get("strategy"))
+        self.engine = StreamingStrategy(
+            spec, **{name: params[name] for name in spec.params if name in params}
+        )
+        self.account = VirtualAccount(cash, commission)
+        self.pending: Optional[str] = None
+        self.latencies_ns = []
+
+    def on_candle(self, candle: Candle, received_ns: int) -> Optional[str]:
+        # 직전 봉에서 낸 주문을 이번 봉 시가에 체결
+        if self.pending == BUY:
+            if not self.account.buy(candle.open, candle.time):
+                self.engine.reset_position()
+        elif self.pending == SELL and self.account.size:
+            self.account.sell(candle.open, candle.time)
+        self.pending = None
+        self.account.last_price = candle.close
+
+        signal = self.engine.update(
+            candle.close,
+            Open=candle.open,
+            High=candle.high,
+            Low=candle.low,
+            Volume=candle.volume,
+            Time=candle.time.value,
+        )
+        self.pending = signal
+        self.latencies_ns.append(time.perf_counter_ns() - received_ns)
+        return signal
+
+
+class PaperTrader:
+    """여러 종목을 한 프로세스에서 동시에 모의 매매하는 asyncio 런타임
+
+    피드에서 받은 캔들을 종목별 큐로 나눠 각 종목 태스크가 스트리밍 전략
+    신호를 계산하고 가상 계좌로 주문을 체결함. 캔들 수신부터 매매 판단까지의
+    지연 시간을 이벤트마다 기록함.
+    """
+
+    def __init__(
+        self,
+        feed: CandleFeed,
+        params: dict,
+        cash_per_ticker: float = 1_000_000,
+        commission: float = 0.0005,
+        queue_size: int = 1000,
+    ):
+        self.feed = feed
+        self.params = params
+        self.cash_per_ticker = cash_per_ticker
+        self.commission = commission
+        self.queue_size = queue_size
+        self.runners: Dict[str, _TickerRunner] = {}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks = []
+
+    def _runner_for(self, ticker: str) -> asyncio.Queue:
+        queue = self._queues.get(ticker)
+        if queue is None:
+            runner = _TickerRunner(ticker, self.params, self.cash_per_ticker, self.commission)
+            self.runners[ticker] = runner
+            queue = asyncio.Queue(maxsize=self.queue_size)
+            self._queues[ticker] = queue
+            self._tasks.append(asyncio.create_task(self._consume(runner, queue)))
+        return queue
+
+    async def _consume(self, runner: _TickerRunner, queue: asyncio.Queue) -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            candle, received_ns = item
+            signal = runner.on_candle(candle, received_ns)
+            if signal:
+                logger.debug(f"{candle.ticker} {candle.time} {signal} @ {candle.close}")
+
+    async def run(self) -> pd.DataFrame:
+        async for candle in self.feed:
+            await self._runner_for(candle.ticker).put((candle, time.perf_counter_ns()))
+        for queue in self._queues.values():
+            await queue.put(None)
+        await asyncio.gather(*self._tasks)
+        return self.summary()
+
+    def summary(self) -> pd.DataFrame:
+        rows = []
+        for ticker, runner in self.runners.items():
+            account = runner.account
+            latencies = np.asarray(runner.latencies_ns) / 1000
+            if not len(latencies):
+                latencies = np.array([np.nan])
+            rows.append(
+                {
+                    "ticker": ticker,
+                    "equity": account.equity,
+                    "return_pct": (account.equity / account.initial_cash - 1) * 100,
+                    "trades": len(account.trades),
+                    "events": len(runner.latencies_ns),
+                    "latency_p50_us": np.percentile(latencies, 50),
+                    "latency_p99_us": np.percentile(latencies, 99),
+                    "latency_max_us": latencies.max(),
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def latencies_us(self) -> np.ndarray:
+        """전 종목의 이벤트별 판단 지연 시간 (마이크로초)"""
+        if not self.runners:
+            return np.array([])
+        return np.concatenate(
+            [np.asarray(r.latencies_ns) for r in self.runners.values()]
+        ) / 1000
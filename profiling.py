@@ -0,0 +1,147 @@
+import cProfile
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 측정 중인 실행과 현재 단계 경로 (스레드/비동기 태스크마다 따로 유지)
+_active: ContextVar[Optional["Profile"]] = ContextVar("profiling_active", default=None)
+_path: ContextVar[tuple] = ContextVar("profiling_path", default=())
+
+COUNTERS = ("requests", "rows", "bytes")
+
+
+class Profile:
+    """단계 경로별 소요 시간과 카운터(요청 수, 행 수, 바이트) 누적 결과"""
+
+    def __init__(self):
+        self.stages = {}
+        self.profile_path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _open(self, path: tuple) -> None:
+        # 상위 단계가 하위 단계보다 먼저 나오도록 시작 시점에 자리를 잡아 둠
+        with self._lock:
+            if path not in self.stages:
+                self.stages[path] = {"calls": 0, "seconds": 0.0}
+
+    def _record(self, path: tuple, seconds: float, counters: dict) -> None:
+        with self._lock:
+            entry = self.stages[path]
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            for name, value in counters.items():
+                entry[name] = entry.get(name, 0) + value
+
+    def records(self) -> list:
+        """처음 실행된 순서대로 단계별 결과 (JSON 직렬화 가능)"""
+        with self._lock:
+            return [
+                {"stage": "/".join(path), "depth": len(path) - 1, **entry}
+                for path, entry in self.stages.items()
+            ]
+
+    def to_frame(self) -> pd.DataFrame:
+        records = self.records()
+        columns = ["stage", "depth", "calls", "seconds", *COUNTERS]
+        if not records:
+            return pd.DataFrame(columns=columns)
+        df = pd.DataFrame(records).reindex(columns=columns)
+        total = df.loc[df["depth"] == 0, "seconds"].sum()
+        df["share"] = df["seconds"] / total if total else 0.0
+        return df
+
+
+class _Stage:
+    __slots__ = ("profile", "name", "counters", "_path", "_token", "_started")
+
+    def __init__(self, profile: Profile, name: str):
+        self.profile = profile
+        self.name = name
+        self.counters = {}
+
+    def add(self, **counters) -> None:
+        for name, value in counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def __enter__(self):
+        self._path = _path.get() + (self.name,)
+        self._token = _path.set(self._path)
+        self.profile._open(self._path)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._started
+        _path.reset(self._token)
+        self.profile._record(self._path, elapsed, self.counters)
+        return False
+
+
+class _NullStage:
+    """측정하지 않을 때 쓰는 빈 단계 (할당 없이 재사용)"""
+
+    __slots__ = ()
+
+    def add(self, **counters) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str):
+    """with stage("fetch") as s: ...; s.add(rows=...) 형태로 단계 시간 측정
+
+    profile() 블록 밖에서는 아무 것도 하지 않는 객체를 돌려주므로 비용이 거의 없음.
+    """
+    profile = _active.get()
+    if profile is None:
+        return _NULL_STAGE
+    return _Stage(profile, name)
+
+
+def frame_bytes(df: Optional[pd.DataFrame]) -> int:
+    if df is None:
+        return 0
+    return int(df.memory_usage(index=True, deep=False).sum())
+
+
+@contextmanager
+def profile(cprofile_path: Optional[str] = None, log: bool = True):
+    """블록 안의 stage() 측정을 켬. cprofile_path를 주면 cProfile 결과(.prof)도 저장
+
+    저장된 파일은 python -m pstats 또는 snakeviz 등으로 열어 볼 수 있음.
+    """
+    result = Profile()
+    token = _active.set(result)
+    profiler = cProfile.Profile() if cprofile_path else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield result
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            directory = os.path.dirname(cprofile_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            profiler.dump_stats(cprofile_path)
+            result.profile_path = cprofile_path
+        _active.reset(token)
+        if log:
+            logger.info(f"단계별 소요 시간 {json.dumps(result.records(), ensure_ascii=False)}")
@@ -0,0 +1,117 @@
+import io
+import math
+
+import numpy as np
+import pandas as pd
+
+column_mapping = {
+    "EntryBar": "진입 바 (인덱스)",
+    "ExitBar": "종료 바 (인덱스)",
+    "EntryTime": "진입 시간",
+    "ExitTime": "종료 시간",
+    "EntryPrice": "진입 가격",
+    "ExitPrice": "종료 가격",
+    "PnL": "손익",
+    "ReturnPct": "수익률 (%)",
+    "Size": "거래 수량",
+    "Value": "거래 금액",
+    "Commission": "수수료",
+    "TradeDuration": "보유 기간 (바)",
+}
+
+
+def rename_and_filter_columns(df, mapping):
+    # 실제로 존재하는 칼럼만 매핑
+    available_cols = [col for col in mapping.keys() if col in df.columns]
+    # 한글로 변환
+    renamed_df = df[available_cols].rename(columns=mapping)
+    if "수익률 (%)" in renamed_df.columns:
+        renamed_df["수익률 (%)"] = (renamed_df["수익률 (%)"] * 100).round(2)
+    return renamed_df
+
+
+def extract_trades(result):
+    """run_backtest 결과(Series 또는 dict)에서 거래 내역 추출"""
+    if hasattr(result, "_trades"):
+        return result._trades
+    elif isinstance(result, dict) and "_trades" in result:
+        return result["_trades"]
+    return None
+
+
+def summarize_trades(trades_df) -> dict:
+    """거래 내역 요약 (총/수익/손실 거래 수, 최대 투자금, 승률)"""
+    if trades_df is not None and not trades_df.empty:
+        total_trades = len(trades_df)
+        profit_trades = (trades_df["PnL"] > 0).sum()
+        loss_trades = (trades_df["PnL"] <= 0).sum()
+        max_investment = (trades_df["Size"] * trades_df["EntryPrice"]).max()
+        win_rate = (profit_trades / total_trades * 100) if total_trades > 0 else 0
+    else:
+        total_trades = profit_trades = loss_trades = max_investment = win_rate = 0
+    return {
+        "total_trades": total_trades,
+        "profit_trades": profit_trades,
+        "loss_trades": loss_trades,
+        "max_investment": max_investment,
+        "win_rate": win_rate,
+    }
+
+
+def _encode_value(value):
+    if isinstance(value, pd.DataFrame):
+        return {
+            "__type__": "frame",
+            "json": value.to_json(
+                orient="split", date_format="iso", date_unit="ns", double_precision=15
+            ),
+            "dtypes": {str(col): str(dtype) for col, dtype in value.dtypes.items()},
+            "index_dtype": str(value.index.dtype),
+        }
+    if value is pd.NaT or value is None:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return {"__type__": "timestamp", "value": value.isoformat()}
+    if isinstance(value, pd.Timedelta):
+        return {"__type__": "timedelta", "value": value.isoformat()}
+    if isinstance(value, (np.integer, np.floating, np.bool_)):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        # JSON은 NaN/inf를 표현하지 못하므로 없는 값으로 처리
+        return None
+    if isinstance(value, (int, float, str, bool)):
+        return value
+    return str(value)
+
+
+def _decode_value(value):
+    if not isinstance(value, dict):
+        return value
+    kind = value.get("__type__")
+    if kind == "timestamp":
+        return pd.Timestamp(value["value"])
+    if kind == "timedelta":
+        return pd.Timedelta(value["value"])
+    if kind == "frame":
+        df = pd.read_json(io.StringIO(value["json"]), orient="split", convert_dates=False)
+        for col, dtype in value["dtypes"].items():
+            if col not in df.columns:
+                continue
+            if dtype.startswith("datetime64"):
+                df[col] = pd.to_datetime(df[col])
+            elif dtype.startswith("timedelta64"):
+                df[col] = pd.to_timedelta(df[col])
+        if value["index_dtype"].startswith("datetime64"):
+            df.index = pd.to_datetime(df.index)
+        return df
+    return value
+
+
+def encode_result(result) -> dict:
+    """run_backtest 결과를 JSON으로 보낼 수 있는 dict로 변환 (거래/자산 표 포함)"""
+    return {str(key): _encode_value(value) for key, value in result.items()}
+
+
+def decode_result(data: dict) -> dict:
+    """encode_result의 역변환 (앱에서 로컬 실행 결과와 같은 방식으로 사용)"""
+    return {key: _decode_value(value) for key, value in data.items()}
@@ -0,0 +1,136 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """OHLCV 데이터 내용(인덱스 포함) 해시"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(df.index.as_unit("ns").asi8.tobytes())
+    for col in df.columns:
+        h.update(str(col).encode())
+        h.update(df[col].to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def result_key(params: dict, df: pd.DataFrame) -> str:
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(f"{payload}|{frame_fingerprint(df)}".encode()).hexdigest()
+
+
+class ResultCache:
+    """백테스트 결과 캐시 (개수/유효 시간 기준 제거, 선택적으로 디스크 보관)"""
+
+    def __init__(
+        self,
+        max_items: int = 128,
+        ttl_seconds: float = 6 * 3600,
+        disk_dir: Optional[str] = None,
+    ):
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                stored_at, result = item
+                if now - stored_at <= self.ttl_seconds:
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._items[key]
+        result = self._load_disk(key, now)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def _load_disk(self, key: str, now: float):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            if now - os.path.getmtime(path) > self.ttl_seconds:
+                os.remove(path)
+                return None
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"결과 캐시 파일 읽기 실패 ({path}): {e}")
+            return None
+        self._remember(key, result, os.path.getmtime(path))
+        return result
+
+    def _remember(self, key: str, result, stored_at: float) -> None:
+        with self._lock:
+            self._items[key] = (stored_at, result)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def put(self, key: str, result) -> None:
+        self._remember(key, result, time.time())
+        if not self.disk_dir:
+            return
+        stored = result
+        if isinstance(result, pd.Series) and "_strategy" in result.index:
+            # 전략 인스턴스는 실행 중에 만든 클래스라 직렬화할 수 없으므로 이름만 보관
+            stored = result.copy()
+            stored["_strategy"] = str(result["_strategy"])
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(stored, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"결과 캐시 파일 저장 실패 ({path}): {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """디스크에도 max_items개까지만 최신순으로 유지"""
+        entries = [
+            os.path.join(self.disk_dir, name)
+            for name in os.listdir(self.disk_dir)
+            if name.endswith(".pkl")
+        ]
+        if len(entries) <= self.max_items:
+            return
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for path in entries[self.max_items :]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "items": len(self._items)}
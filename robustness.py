@@ -0,0 +1,146 @@
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 거래 순서를 섞는 방식
+#   bootstrap: 거래 결과를 복원 추출 (거래 분포 자체의 불확실성)
+#   permute: 같은 거래들의 순서만 바꿈 (최종 자산은 같고 경로/낙폭만 달라짐)
+#   block: 봉별 자산 수익률을 구간(블록) 단위로 복원 추출 (연속 손익의 뭉침 유지)
+METHODS = ("bootstrap", "permute", "block")
+
+# 한 번에 계산할 시뮬레이션 수 (경로 행렬 크기 제한)
+BATCH_SIZE = 2000
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _trade_steps(
+    rng: np.random.Generator, values: np.ndarray, n_sims: int, method: str
+) -> np.ndarray:
+    """(n_sims, 거래 수) 표본 행렬"""
+    n = len(values)
+    if method == "bootstrap":
+        return values[rng.integers(0, n, size=(n_sims, n))]
+    return rng.permuted(np.broadcast_to(values, (n_sims, n)), axis=1)
+
+
+def _block_steps(
+    rng: np.random.Generator, returns: np.ndarray, n_sims: int, block_size: int
+) -> np.ndarray:
+    """수익률을 block_size 길이 구간 단위로 이어 붙인 (n_sims, 길이) 표본 행렬"""
+    n = len(returns)
+    block_size = max(1, min(block_size, n))
+    n_blocks = -(-n // block_size)
+    starts = rng.integers(0, n - block_size + 1, size=(n_sims, n_blocks))
+    index = (starts[:, :, None] + np.arange(block_size)).reshape(n_sims, -1)[:, :n]
+    return returns[index]
+
+
+def _equity_returns(equity: np.ndarray, max_steps: int) -> np.ndarray:
+    """자산 곡선을 최대 max_steps 구간으로 나눈 구간별 수익률
+
+    1분봉 1년치처럼 봉이 많으면 그대로 시뮬레이션하기에 너무 크므로, 같은
+    간격의 시점만 골라 구간 수익률로 바꿈 (구간 안의 흐름은 그대로 반영됨).
+    """
+    n_points = min(len(equity), max_steps + 1)
+    points = np.unique(np.linspace(0, len(equity) - 1, n_points).astype(int))
+    sampled = equity[points]
+    return sampled[1:] / sampled[:-1] - 1
+
+
+def _path_metrics(paths: np.ndarray, ruin_equity: float) -> tuple:
+    """경로 행렬(시작 자산 열 포함)의 최종 자산, 최대 낙폭(%), 파산 여부"""
+    peak = np.maximum.accumulate(paths, axis=1)
+    max_dd = ((paths - peak) / peak).min(axis=1) * 100
+    ruined = (paths <= ruin_equity).any(axis=1)
+    return paths[:, -1], max_dd, ruined
+
+
+def monte_carlo(
+    trades: Optional[pd.DataFrame] = None,
+    cash: float = 1_000_000,
+    n_sims: int = 10_000,
+    method: str = "bootstrap",
+    use_pnl: bool = False,
+    equity: Optional[np.ndarray] = None,
+    block_size: int = 20,
+    max_steps: int = 1000,
+    ruin_fraction: float = 0.5,
+    n_paths: int = 100,
+    seed: Optional[int] = None,
+) -> dict:
+    """거래 결과(또는 자산 곡선)를 다시 뽑아 만든 가상 경로들의 분포
+
+    bootstrap/permute는 trades의 ReturnPct를 복리로(use_pnl이면 PnL을 더해서)
+    이어 붙이고, block은 equity(봉별 자산)의 구간 수익률을 블록 단위로 다시 뽑음.
+    자산이 한 번이라도 cash * ruin_fraction 이하로 떨어진 경로를 파산으로 봄.
+
+    반환값: {"final_equity", "max_drawdown": 시뮬레이션별 배열,
+            "ruin_probability": 파산 비율, "summary": 백분위 표,
+            "paths": 차트용 경로 일부 (n_paths개, 시작 자산 포함)}
+    """
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 방식: {method}")
+    if method == "block":
+        if equity is None or len(equity) < 2:
+            raise ValueError("블록 재추출에는 자산 곡선이 필요합니다.")
+        values = _equity_returns(np.asarray(equity, dtype=float), max_steps)
+        compound = True
+    else:
+        if trades is None or trades.empty:
+            raise ValueError("분석할 거래가 없습니다.")
+        column = "PnL" if use_pnl else "ReturnPct"
+        values = trades[column].to_numpy(dtype=float)
+        compound = not use_pnl
+
+    rng = np.random.default_rng(seed)
+    ruin_equity = cash * ruin_fraction
+    finals, drawdowns, ruins, paths = [], [], [], None
+    for start in range(0, n_sims, BATCH_SIZE):
+        size = min(BATCH_SIZE, n_sims - start)
+        if method == "block":
+            steps = _block_steps(rng, values, size, block_size)
+        else:
+            steps = _trade_steps(rng, values, size, method)
+        batch = np.empty((size, steps.shape[1] + 1))
+        batch[:, 0] = cash
+        if compound:
+            np.cumprod(1 + steps, axis=1, out=batch[:, 1:])
+            batch[:, 1:] *= cash
+        else:
+            np.cumsum(steps, axis=1, out=batch[:, 1:])
+            batch[:, 1:] += cash
+        final, max_dd, ruined = _path_metrics(batch, ruin_equity)
+        finals.append(final)
+        drawdowns.append(max_dd)
+        ruins.append(ruined)
+        if paths is None:
+            paths = batch[:n_paths].copy()
+
+    final_equity = np.concatenate(finals)
+    max_drawdown = np.concatenate(drawdowns)
+    ruin_probability = float(np.concatenate(ruins).mean())
+    summary = pd.DataFrame(
+        {
+            "최종 자산": np.percentile(final_equity, PERCENTILES),
+            "수익률 (%)": (np.percentile(final_equity, PERCENTILES) / cash - 1) * 100,
+            # 낙폭은 음수라 낮은 백분위가 나쁜 경우 (행마다 같은 방향: 5%가 비관적)
+            "최대 낙폭 (%)": np.percentile(max_drawdown, PERCENTILES),
+        },
+        index=[f"{p}%" for p in PERCENTILES],
+    )
+    logger.info(
+        f"몬테카를로 {n_sims}회 ({method}, 단계 {len(values)}개): "
+        f"중앙 최종 자산 {np.median(final_equity):,.0f}, 파산 확률 {ruin_probability:.2%}"
+    )
+    return {
+        "final_equity": final_equity,
+        "max_drawdown": max_drawdown,
+        "ruin_probability": ruin_probability,
+        "summary": summary,
+        "paths": paths,
+    }
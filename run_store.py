@@ -0,0 +1,204 @@
+import io
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from typing import Optional
+
+import pandas as pd
+
+from report import decode_result, encode_result
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RUN_DB = os.environ.get(
+    "BACKTEST_RUN_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "runs.sqlite3"),
+)
+
+# 결과 통계 이름 -> 인덱스가 있는 컬럼
+METRIC_COLUMNS = {
+    "Return [%]": "return_pct",
+    "Buy & Hold Return [%]": "buy_hold_return_pct",
+    "Max. Drawdown [%]": "max_drawdown_pct",
+    "Win Rate [%]": "win_rate_pct",
+    "# Trades": "n_trades",
+    "Sharpe Ratio": "sharpe",
+    "Equity Final [$]": "equity_final",
+}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    engine TEXT,
+    data_start TEXT,
+    data_end TEXT,
+    params TEXT NOT NULL,
+    {", ".join(f"{column} REAL" for column in METRIC_COLUMNS.values())}
+);
+CREATE TABLE IF NOT EXISTS run_results (
+    run_id INTEGER PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS run_frames (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS runs_market_return ON runs (ticker, interval, return_pct);
+CREATE INDEX IF NOT EXISTS runs_market_sharpe ON runs (ticker, interval, sharpe);
+CREATE INDEX IF NOT EXISTS runs_market_range ON runs (ticker, interval, data_start, data_end);
+CREATE INDEX IF NOT EXISTS runs_return ON runs (return_pct);
+CREATE INDEX IF NOT EXISTS runs_sharpe ON runs (sharpe);
+CREATE INDEX IF NOT EXISTS runs_drawdown ON runs (max_drawdown_pct);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (created);
+"""
+
+
+def _metric_value(value) -> Optional[float]:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if value == value else None
+
+
+def _frame_bytes(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_parquet(buffer)
+    return buffer.getvalue()
+
+
+def _read_frame(data: bytes) -> pd.DataFrame:
+    return pd.read_parquet(io.BytesIO(data))
+
+
+class RunStore:
+    """백테스트 실행 기록 저장소 (SQLite)
+
+    요약 지표는 인덱스가 있는 컬럼으로, 전체 통계는 압축한 JSON으로, 거래/자산
+    곡선 표는 Parquet 바이트로 따로 보관해 목록 조회는 가볍게 하고 다시 불러올
+    때만 읽음. 긴 자산 곡선도 JSON 변환 없이 바로 쓰고 읽음.
+    """
+
+    def __init__(self, path: str = DEFAULT_RUN_DB):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def save(self, params: dict, result) -> int:
+        """실행 결과(Series 또는 dict)를 저장하고 실행 번호를 반환"""
+        start, end = result.get("Start"), result.get("End")
+        row = {
+            "created": time.time(),
+            "ticker": params["ticker"],
+            "interval": params["interval"],
+            "engine": params.get("engine", "backtesting"),
+            "data_start": pd.Timestamp(start).isoformat() if start is not None else None,
+            "data_end": pd.Timestamp(end).isoformat() if end is not None else None,
+            "params": json.dumps(params, sort_keys=True, default=str),
+            **{
+                column: _metric_value(result.get(metric))
+                for metric, column in METRIC_COLUMNS.items()
+            },
+        }
+        stats, frames = {}, {}
+        for key, value in result.items():
+            if isinstance(value, pd.DataFrame):
+                frames[str(key)] = _frame_bytes(value)
+            else:
+                stats[key] = value
+        payload = zlib.compress(json.dumps(encode_result(stats)).encode())
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                f"INSERT INTO runs ({columns}) VALUES ({placeholders})", list(row.values())
+            )
+            run_id = cursor.lastrowid
+            conn.execute(
+                "INSERT INTO run_results (run_id, payload) VALUES (?, ?)", (run_id, payload)
+            )
+            conn.executemany(
+                "INSERT INTO run_frames (run_id, name, data) VALUES (?, ?, ?)",
+                [(run_id, name, data) for name, data in frames.items()],
+            )
+        logger.info(f"실행 기록 저장: #{run_id} {params['ticker']} {params['interval']}")
+        return run_id
+
+    def top(
+        self,
+        ticker: Optional[str] = None,
+        interval: Optional[str] = None,
+        metric: str = "Return [%]",
+        limit: int = 20,
+        ascending: bool = False,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """조건에 맞는 실행을 metric 순으로 limit개 (전체 결과는 읽지 않음)
+
+        start/end를 주면 데이터 구간이 그 범위 안에 있는 실행만 고름.
+        """
+        column = METRIC_COLUMNS.get(metric)
+        if column is None:
+            raise ValueError(f"지원하지 않는 정렬 기준: {metric}")
+        conditions, args = [f"{column} IS NOT NULL"], []
+        for name, value, op in (
+            ("ticker", ticker, "="),
+            ("interval", interval, "="),
+            ("data_start", start, ">="),
+            ("data_end", end, "<="),
+        ):
+            if value is not None:
+                conditions.append(f"{name} {op} ?")
+                args.append(value)
+        query = (
+            f"SELECT * FROM runs WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {column} {'ASC' if ascending else 'DESC'} LIMIT ?"
+        )
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(query, conn, params=[*args, limit])
+        df["created"] = pd.to_datetime(df["created"], unit="s")
+        return df.rename(columns={c: m for m, c in METRIC_COLUMNS.items()})
+
+    def load(self, run_id: int) -> Optional[dict]:
+        """저장된 실행의 전체 결과 (run_backtest 결과를 dict로 바꾼 것과 같은 형식)"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT payload FROM run_results WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            frames = conn.execute(
+                "SELECT name, data FROM run_frames WHERE run_id = ?", (run_id,)
+            ).fetchall()
+        if row is None:
+            return None
+        # 예전 기록은 표까지 payload JSON 안에 들어 있음 (decode_result가 처리)
+        result = decode_result(json.loads(zlib.decompress(row[0])))
+        result.update({name: _read_frame(data) for name, data in frames})
+        return result
+
+    def params(self, run_id: int) -> Optional[dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT params FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, run_id: int) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM runs WHERE id = ?", (run_id,))
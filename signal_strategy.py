@@ -0,0 +1,472 @@
+import importlib
+import logging
+import sys
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+import indicator_cache
+from profiling import stage
+
+logger = logging.getLogger(__name__)
+
+# 캔들 컬럼 (지표 입력으로 바로 쓸 수 있음)
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+# 봉 시작 시각 (KST, int64 ns) 입력 이름
+TIME_COLUMN = "Time"
+
+DEFAULT_STRATEGY = "macd_v2"
+# get_strategy()가 처음 불릴 때 불러와 등록하는 기본 전략 모듈
+_BUILTIN_MODULES = ("strategy", "strategy_v2", "strategy_mtf")
+
+
+def _param(value, params: dict):
+    """파라미터 이름(str)이면 params에서 찾고, 숫자면 그대로"""
+    return params[value] if isinstance(value, str) else value
+
+
+def frame_data(df: pd.DataFrame, columns) -> dict:
+    """DataFrame에서 지표 입력 배열 (Time은 인덱스의 int64 ns, 나머지는 float)"""
+    return {
+        col: df.index.as_unit("ns").asi8 if col == TIME_COLUMN else df[col].to_numpy(dtype=float)
+        for col in columns
+    }
+
+
+class Indicator:
+    """선언형 지표: 전체 배열 계산(compute)과 봉 단위 갱신(streamer)을 함께 정의
+
+    inputs는 캔들 컬럼 이름이나 앞에서 선언한 지표 이름. 두 방식의 결과가
+    같아야 같은 전략이 백테스트와 실시간 엔진에서 같은 신호를 냄.
+    """
+
+    inputs: tuple = ()
+
+    def describe(self, params: dict, input_keys: list) -> str:
+        """지표 캐시 키에 쓰는 설명 (입력과 파라미터가 같으면 같은 값)"""
+        raise NotImplementedError
+
+    def compute(self, values: list, params: dict, data_key: str, input_keys: list) -> np.ndarray:
+        raise NotImplementedError
+
+    def streamer(self, params: dict):
+        """update(*입력값) -> 값, value 속성을 가진 증분 계산기"""
+        raise NotImplementedError
+
+
+class EMA(Indicator):
+    """pandas ewm(span, adjust=False) 지수이동평균"""
+
+    def __init__(self, source: str, span):
+        self.inputs = (source,)
+        self.span = span
+
+    def describe(self, params, input_keys):
+        return f"ema({input_keys[0]},{_param(self.span, params)})"
+
+    def compute(self, values, params, data_key, input_keys):
+        span = _param(self.span, params)
+        if self.inputs[0] in PRICE_COLUMNS:
+            # data_key는 종가 기준 식별자이므로 다른 컬럼은 이름을 붙여 구분
+            key = data_key if self.inputs[0] == "Close" else f"{data_key}:{self.inputs[0]}"
+            return indicator_cache.ema(values[0], span, key)
+        return indicator_cache.get_cache().get_or_compute(
+            (data_key, self.describe(params, input_keys)),
+            lambda: pd.Series(values[0]).ewm(span=span, adjust=False).mean().values,
+        )
+
+    def streamer(self, params):
+        from streaming import StreamingEMA
+
+        return StreamingEMA(_param(self.span, params))
+
+
+class _DiffStream:
+    def __init__(self):
+        self.value = None
+
+    def update(self, a: float, b: float) -> float:
+        self.value = a - b
+        return self.value
+
+
+class Diff(Indicator):
+    """두 입력의 차 (a - b)"""
+
+    def __init__(self, a: str, b: str):
+        self.inputs = (a, b)
+
+    def describe(self, params, input_keys):
+        return f"({input_keys[0]}-{input_keys[1]})"
+
+    def compute(self, values, params, data_key, input_keys):
+        return indicator_cache.get_cache().get_or_compute(
+            (data_key, self.describe(params, input_keys)), lambda: values[0] - values[1]
+        )
+
+    def streamer(self, params):
+        return _DiffStream()
+
+
+def macd_indicators(source: str = "Close") -> dict:
+    """MACD 전략들이 함께 쓰는 지표 선언 (단기/장기 EMA, MACD, 신호선)"""
+    return {
+        "ema_fast": EMA(source, "fast_period"),
+        "ema_slow": EMA(source, "slow_period"),
+        "macd": Diff("ema_fast", "ema_slow"),
+        "signal": EMA("macd", "signal_period"),
+    }
+
+
+def _interval_ns(interval: str) -> int:
+    from data_collector import INTERVAL_DELTAS
+
+    if interval not in INTERVAL_DELTAS:
+        raise ValueError(f"지원하지 않는 차트 단위: {interval}")
+    return INTERVAL_DELTAS[interval] // timedelta(microseconds=1) * 1000
+
+
+class HigherTimeframe(Indicator):
+    """상위 차트 단위 봉에서 계산한 지표를 기준 봉에 맞춰 펼친 값
+
+    기준 봉 종가를 interval 단위(업비트 캔들 경계)로 묶은 봉 마감 종가에서
+    indicators(입력은 "Close")를 한 번만 계산하고, 기준 봉마다 그 봉이
+    마감될 때까지 끝난 마지막 상위 봉의 output 값을 searchsorted로 찾아 채움.
+    진행 중인 상위 봉은 쓰지 않으므로 미래 데이터를 참조하지 않음.
+    interval/base_interval은 파라미터 이름 (base_interval은 기준 봉 단위).
+    """
+
+    def __init__(self, interval: str, indicators: dict, output: str, base_interval="interval"):
+        for ind in indicators.values():
+            for i in ind.inputs:
+                if (i in PRICE_COLUMNS and i != "Close") or i == TIME_COLUMN:
+                    raise ValueError(f"상위 차트 지표의 입력은 종가만 쓸 수 있습니다: {i}")
+        self.inputs = (TIME_COLUMN, "Close")
+        self.interval = interval
+        self.indicators = indicators
+        self.output = output
+        self.base_interval = base_interval
+
+    def intervals(self, params: dict) -> tuple:
+        """(상위 단위, 기준 봉 길이 ns)"""
+        interval = _param(self.interval, params)
+        base = _param(self.base_interval, params)
+        base_ns = _interval_ns(base)
+        if _interval_ns(interval) <= base_ns:
+            raise ValueError(f"상위 차트 단위({interval})는 기준 단위({base})보다 커야 합니다.")
+        return interval, base_ns
+
+    def describe(self, params, input_keys):
+        interval, base_ns = self.intervals(params)
+        keys = _describe_all(self.indicators, params, {"Close": "Close"})
+        return f"{interval}/{base_ns}[{keys[self.output]}]"
+
+    def compute(self, values, params, data_key, input_keys):
+        from data_collector import bin_labels
+
+        times, close = values
+        interval, base_ns = self.intervals(params)
+        if not len(times):
+            return np.empty(0)
+        # 같은 종가라도 시각이 다르면 묶음이 달라지므로 시각 범위를 키에 더함
+        key = f"{data_key}@{times[0]}-{times[-1]}:{interval}"
+        cache = indicator_cache.get_cache()
+        labels = None
+
+        def get_labels():
+            nonlocal labels
+            if labels is None:
+                labels = bin_labels(times, interval)
+            return labels
+
+        def htf_close():
+            lab = get_labels()
+            ends = np.r_[np.flatnonzero(lab[1:] != lab[:-1]), len(lab) - 1]
+            return close[ends]
+
+        def completed():
+            # 기준 봉 i가 마감되는 시각까지 끝난 마지막 상위 봉 번호 (없으면 -1)
+            lab = get_labels()
+            starts = lab[np.r_[0, np.flatnonzero(lab[1:] != lab[:-1]) + 1]]
+            bin_ends = bin_labels(starts + _interval_ns(interval), interval)
+            return np.searchsorted(bin_ends, times + base_ns, side="right") - 1
+
+        def expand():
+            closes = cache.get_or_compute((key, "close"), htf_close)
+            done = cache.get_or_compute((key, f"completed/{base_ns}"), completed)
+            inner = _compute_declared(self.indicators, {"Close": closes}, params, key)
+            result = np.full(len(times), np.nan)
+            valid = done >= 0
+            result[valid] = inner[self.output][done[valid]]
+            return result
+
+        return cache.get_or_compute((data_key, self.describe(params, input_keys)), expand)
+
+    def streamer(self, params):
+        return _HigherTimeframeStream(self, params)
+
+
+class _HigherTimeframeStream:
+    """HigherTimeframe의 봉 단위 계산 (상위 봉이 끝나는 봉에서만 내부 지표를 갱신)"""
+
+    def __init__(self, ind: HigherTimeframe, params: dict):
+        self.interval, self.base_ns = ind.intervals(params)
+        self.step_ns = _interval_ns(self.interval)
+        self.indicators = ind.indicators
+        self.output = ind.output
+        self._streams = {name: i.streamer(params) for name, i in ind.indicators.items()}
+        self.bin = None
+        self.bin_end = None
+        self.close = None
+        self.done = True
+        self.value = float("nan")
+
+    def _label(self, time: int) -> int:
+        from data_collector import bin_labels
+
+        return int(bin_labels(np.array([time], dtype=np.int64), self.interval)[0])
+
+    def _finish(self) -> None:
+        values = {}
+        for name, ind in self.indicators.items():
+            inputs = [values[i] if i in values else self.close for i in ind.inputs]
+            values[name] = self._streams[name].update(*inputs)
+        self.value = values[self.output]
+        self.done = True
+
+    def update(self, time: int, close: float) -> float:
+        time = int(time)
+        label = self._label(time)
+        if label != self.bin:
+            # 마지막 기준 봉이 빠져 있던 상위 봉은 다음 상위 봉이 시작될 때 마감
+            if not self.done:
+                self._finish()
+            self.bin = label
+            self.bin_end = self._label(label + self.step_ns)
+            self.done = False
+        self.close = close
+        if time + self.base_ns >= self.bin_end:
+            self._finish()
+        return self.value
+
+    def get_state(self) -> dict:
+        return {
+            "bin": self.bin,
+            "bin_end": self.bin_end,
+            "close": self.close,
+            "done": self.done,
+            "value": self.value,
+            "streams": {name: stream.value for name, stream in self._streams.items()},
+        }
+
+    def set_state(self, state: dict) -> None:
+        for name in ("bin", "bin_end", "close", "done", "value"):
+            setattr(self, name, state[name])
+        for name, value in state["streams"].items():
+            self._streams[name].value = value
+
+
+class SignalStrategy:
+    """지표와 매수/매도 조건을 배열 식으로 선언하는 전략
+
+    entry/exit는 (cur, prev, p)를 받아 조건을 반환함. cur/prev는 지표 이름으로
+    현재/직전 봉 값을 꺼내는 객체이고 p는 파라미터. 백테스트에서는 배열이,
+    실시간 엔진에서는 숫자가 들어가므로 비교 연산과 &, | 만으로 작성함.
+    (and/or, if 는 배열에서 동작하지 않음)
+
+    익절/손절(진입 신호 봉 종가 기준)과 최소 보유 기간은 엔진이 공통으로 처리함.
+    register로 등록하면 backtesting.py, 벡터 엔진(최적화/일괄/워크포워드 포함),
+    스트리밍 엔진(모의 매매)에서 그대로 실행됨.
+    """
+
+    name: str = ""
+    label: str = ""
+    params: dict = {"take_profit": 0.03, "stop_loss": 0.01, "min_holding_period": 2}
+    indicators: dict = {}
+
+    @staticmethod
+    def entry(cur, prev, p):
+        raise NotImplementedError
+
+    @staticmethod
+    def exit(cur, prev, p):
+        raise NotImplementedError
+
+    @classmethod
+    def resolve_params(cls, params: dict) -> dict:
+        """기본값에 params 중 이 전략이 쓰는 값만 덮어씀"""
+        return {name: params.get(name, default) for name, default in cls.params.items()}
+
+    @classmethod
+    def columns(cls) -> list:
+        """지표 계산에 필요한 캔들 컬럼 (익절/손절과 데이터 식별에 쓰는 종가는 항상 포함)"""
+        sources = (*PRICE_COLUMNS, TIME_COLUMN)
+        return sorted(
+            {"Close"}
+            | {col for ind in cls.indicators.values() for col in ind.inputs if col in sources}
+        )
+
+
+STRATEGIES = {}
+
+
+def register(cls):
+    """전략 클래스를 이름으로 등록 (데코레이터)"""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__}: 전략 이름(name)이 없습니다.")
+    STRATEGIES[cls.name] = cls
+    return cls
+
+
+def _load_builtins() -> None:
+    for module in _BUILTIN_MODULES:
+        importlib.import_module(module)
+
+
+def get_strategy(name: Optional[str] = None):
+    name = name or DEFAULT_STRATEGY
+    if name not in STRATEGIES:
+        _load_builtins()
+    if name not in STRATEGIES:
+        raise ValueError(f"등록되지 않은 전략: {name}")
+    return STRATEGIES[name]
+
+
+def list_strategies() -> dict:
+    """등록된 전략 이름 -> 설명"""
+    _load_builtins()
+    return {name: cls.label or name for name, cls in STRATEGIES.items()}
+
+
+def _describe_all(indicators: dict, params: dict, source_keys: dict = None) -> dict:
+    """지표 이름 -> 캐시 키 설명 (입력 지표의 설명을 이어 붙임)"""
+    keys = dict(source_keys or {})
+    for name, ind in indicators.items():
+        keys[name] = ind.describe(params, [keys.get(i, i) for i in ind.inputs])
+    return keys
+
+
+def _compute_declared(indicators: dict, data: dict, params: dict, data_key: str) -> dict:
+    values, keys = {}, {}
+    for name, ind in indicators.items():
+        inputs = [values[i] if i in values else data[i] for i in ind.inputs]
+        input_keys = [keys.get(i, i) for i in ind.inputs]
+        values[name] = ind.compute(inputs, params, data_key, input_keys)
+        keys[name] = ind.describe(params, input_keys)
+    return values
+
+
+def compute_indicators(spec, data: dict, params: dict, data_key: Optional[str] = None) -> dict:
+    """data(컬럼 이름 -> 배열)로 전략의 지표 배열을 선언 순서대로 계산"""
+    params = spec.resolve_params(params)
+    data_key = data_key or indicator_cache.fingerprint(data["Close"])
+    return _compute_declared(spec.indicators, data, params, data_key)
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    shifted = np.empty(len(values))
+    shifted[:1] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def signals_from_indicators(spec, indicators: dict, params: dict):
+    """지표 배열로 봉별 (매수, 매도) 조건 배열 (첫 봉은 직전 값이 없어 NaN과 비교)"""
+    p = SimpleNamespace(**spec.resolve_params(params))
+    cur = SimpleNamespace(**indicators)
+    prev = SimpleNamespace(**{name: _shift(v) for name, v in indicators.items()})
+    n = len(next(iter(indicators.values())))
+    buy = np.broadcast_to(np.asarray(spec.entry(cur, prev, p), dtype=bool), n)
+    sell = np.broadcast_to(np.asarray(spec.exit(cur, prev, p), dtype=bool), n)
+    return buy, sell
+
+
+def compute_signals(spec, data: dict, params: dict, data_key: Optional[str] = None):
+    return signals_from_indicators(spec, compute_indicators(spec, data, params, data_key), params)
+
+
+def backtesting_strategy(spec, class_name: Optional[str] = None) -> type:
+    """선언형 전략을 backtesting.py Strategy 클래스로 변환 (파라미터는 클래스 변수)
+
+    지표/조건 배열은 init에서 한 번 계산하고 next()는 포지션 관리만 함.
+    """
+    # backtesting.py(bokeh 포함)는 이 엔진을 쓸 때만 불러옴
+    from backtesting import Strategy  # type: ignore
+
+    def init(self):
+        logger.info("전략 초기화 시작")
+        params = {name: getattr(self, name) for name in spec.params}
+        data = frame_data(self.data.df, spec.columns())
+        with stage("indicators"):
+            indicators = compute_indicators(spec, data, params)
+            for name, values in indicators.items():
+                setattr(self, name, self.I(lambda v=values: v, name=name))
+        self._entry, self._exit = signals_from_indicators(spec, indicators, params)
+        self.entry_price = None
+        self.entry_bar = None
+        self.last_signal_bar = None
+
+    def next(self):
+        current_bar = len(self.data) - 1
+        current_price = self.data.Close[-1]
+
+        # 같은 봉에서 신호 중복 방지
+        if self.last_signal_bar == current_bar:
+            return
+
+        if self.position:
+            bars_since_entry = current_bar - self.entry_bar
+            # 익절/손절
+            tp_price = self.entry_price * (1 + self.take_profit)
+            sl_price = self.entry_price * (1 - self.stop_loss)
+            if current_price >= tp_price or current_price <= sl_price:
+                self.position.close()
+                self.entry_price = None
+                self.entry_bar = None
+                self.last_signal_bar = current_bar
+                return
+
+            # 최소 보유 기간
+            if bars_since_entry < self.min_holding_period:
+                return
+
+            # 매도 신호
+            if self._exit[current_bar]:
+                self.position.close()
+                self.entry_price = None
+                self.entry_bar = None
+                self.last_signal_bar = current_bar
+
+        if not self.position:
+            # 매수 신호
+            if self._entry[current_bar]:
+                self.buy()
+                self.entry_price = current_price
+                self.entry_bar = current_bar
+                self.last_signal_bar = current_bar
+
+    return type(
+        class_name or f"{spec.__name__}Backtest",
+        (Strategy,),
+        {**spec.params, "spec": spec, "init": init, "next": next, "__module__": spec.__module__},
+    )
+
+
+def lazy_backtesting_strategy(spec, class_name: str):
+    """전략 모듈의 __getattr__: class_name을 처음 읽을 때 backtesting_strategy로 만듦
+
+    벡터 엔진만 쓰는 실행(CLI 등)은 backtesting.py를 불러오지 않도록 모듈을
+    불러오는 시점에는 클래스를 만들지 않음. 만든 클래스는 모듈에 저장됨.
+    """
+
+    def __getattr__(name):
+        if name != class_name:
+            raise AttributeError(f"module {spec.__module__!r} has no attribute {name!r}")
+        cls = backtesting_strategy(spec, class_name)
+        setattr(sys.modules[spec.__module__], class_name, cls)
+        return cls
+
+    return __getattr__
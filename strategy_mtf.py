@@ -0,0 +1,32 @@
+from signal_strategy import HigherTimeframe, lazy_backtesting_strategy, macd_indicators, register
+from strategy_v2 import MACDSignalsV2
+
+
+@register
+class MACDSignalsMTF(MACDSignalsV2):
+    """v2 매수 신호 중 상위 차트(trend_interval)의 MACD가 신호선 위일 때만 진입
+
+    상위 차트 MACD는 같은 EMA 기간으로 상위 봉 종가에서 계산하며, 아직 끝나지
+    않은 상위 봉은 쓰지 않음. interval은 백테스트 차트 단위(기준 봉)로 채워짐.
+    """
+
+    name = "macd_mtf"
+    label = "MACD 교차 + 상위 차트 추세 필터"
+    params = {
+        **MACDSignalsV2.params,
+        "interval": "minute5",
+        "trend_interval": "minute60",
+    }
+    indicators = {
+        **macd_indicators(),
+        "trend_macd": HigherTimeframe("trend_interval", macd_indicators(), "macd"),
+        "trend_signal": HigherTimeframe("trend_interval", macd_indicators(), "signal"),
+    }
+
+    @staticmethod
+    def entry(cur, prev, p):
+        return MACDSignalsV2.entry(cur, prev, p) & (cur.trend_macd > cur.trend_signal)
+
+
+# backtesting.py용 클래스 (strategy_mtf.MACDStrategy 처음 사용 시 생성)
+__getattr__ = lazy_backtesting_strategy(MACDSignalsMTF, "MACDStrategy")
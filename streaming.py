@@ -0,0 +1,162 @@
+import logging
+from types import SimpleNamespace
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+BUY = "buy"
+SELL = "sell"
+
+
+class StreamingEMA:
+    """pandas ewm(span, adjust=False).mean()과 비트 단위로 같은 값을 내는 증분 EMA"""
+
+    def __init__(self, span: int, value: Optional[float] = None):
+        self.span = span
+        com = (span - 1) / 2
+        self._alpha = 1.0 / (1.0 + com)
+        self._old_weight = 1.0 - self._alpha
+        self.value = value
+
+    def update(self, x: float) -> float:
+        if self.value is None:
+            self.value = x
+        # 상수 구간의 수치 오차 방지 (pandas와 동일)
+        elif self.value != x:
+            weighted = self._old_weight * self.value + self._alpha * x
+            self.value = weighted / (self._old_weight + self._alpha)
+        return self.value
+
+
+class StreamingStrategy:
+    """선언형 전략(SignalStrategy)의 신호를 캔들 하나마다 증분 계산하는 엔진
+
+    update()는 봉이 마감될 때 호출하며 "buy" / "sell" / None을 반환함.
+    backtesting.py와 같이 신호는 다음 봉 시가에 체결된다고 가정하고 포지션
+    상태를 갱신함. 주문이 거부되면 reset_position()으로 되돌림.
+    """
+
+    def __init__(self, strategy=None, **params):
+        from signal_strategy import get_strategy
+
+        if strategy is None or isinstance(strategy, str):
+            strategy = get_strategy(strategy)
+        self.spec = strategy
+        for name in params:
+            if name not in self.spec.params:
+                raise ValueError(f"알 수 없는 파라미터: {name}")
+        self.params = self.spec.resolve_params(params)
+        self._p = SimpleNamespace(**self.params)
+        self._streams = {
+            name: ind.streamer(self.params) for name, ind in self.spec.indicators.items()
+        }
+        self.values = None
+        self.prev_values = None
+        self.bar_index = -1
+        self.in_position = False
+        self.entry_price = None
+        self.entry_bar = None
+
+    def _update_indicators(self, bar: dict) -> None:
+        values = {}
+        for name, ind in self.spec.indicators.items():
+            inputs = [values[i] if i in values else bar[i] for i in ind.inputs]
+            values[name] = self._streams[name].update(*inputs)
+        self.prev_values, self.values = self.values, values
+        self.bar_index += 1
+
+    def prime(self, closes, times=None) -> None:
+        """과거 종가(상위 차트 지표를 쓰면 봉 시각 ns도)로 지표만 채움 (포지션/신호 없음)"""
+        if times is None:
+            for close in closes:
+                self._update_indicators({"Close": float(close)})
+        else:
+            for close, time in zip(closes, times):
+                self._update_indicators({"Close": float(close), "Time": int(time)})
+
+    def update(self, close: float, **bar) -> Optional[str]:
+        """마감된 봉의 종가 (다른 컬럼을 쓰는 전략은 Open=..., Time=봉 시각(ns)도 전달)"""
+        close = float(close)
+        self._update_indicators({**bar, "Close": close})
+        if self.prev_values is None:
+            return None
+        current_bar = self.bar_index
+        cur = SimpleNamespace(**self.values)
+        prev = SimpleNamespace(**self.prev_values)
+
+        if self.in_position:
+            bars_since_entry = current_bar - self.entry_bar
+            # 익절/손절
+            tp_price = self.entry_price * (1 + self._p.take_profit)
+            sl_price = self.entry_price * (1 - self._p.stop_loss)
+            if close >= tp_price or close <= sl_price:
+                self.reset_position()
+                return SELL
+
+            # 최소 보유 기간
+            if bars_since_entry < self._p.min_holding_period:
+                return None
+
+            # 매도 신호
+            if self.spec.exit(cur, prev, self._p):
+                self.reset_position()
+                return SELL
+            return None
+
+        # 매수 신호
+        if self.spec.entry(cur, prev, self._p):
+            self.in_position = True
+            self.entry_price = close
+            self.entry_bar = current_bar
+            return BUY
+        return None
+
+    def reset_position(self) -> None:
+        self.in_position = False
+        self.entry_price = None
+        self.entry_bar = None
+
+    def checkpoint(self) -> dict:
+        """재시작 후 restore()로 이어서 실행할 수 있는 상태 (JSON 직렬화 가능)"""
+        return {
+            "strategy": self.spec.name,
+            "params": dict(self.params),
+            "streams": {
+                name: stream.get_state() if hasattr(stream, "get_state") else stream.value
+                for name, stream in self._streams.items()
+            },
+            "values": self.values,
+            "prev_values": self.prev_values,
+            "bar_index": self.bar_index,
+            "in_position": self.in_position,
+            "entry_price": self.entry_price,
+            "entry_bar": self.entry_bar,
+        }
+
+    @classmethod
+    def restore(cls, state: dict) -> "StreamingStrategy":
+        engine = cls.__new__(cls)
+        StreamingStrategy.__init__(engine, state["strategy"], **state["params"])
+        for name, value in state["streams"].items():
+            stream = engine._streams[name]
+            if hasattr(stream, "set_state"):
+                stream.set_state(value)
+            else:
+                stream.value = value
+        for name in (
+            "values",
+            "prev_values",
+            "bar_index",
+            "in_position",
+            "entry_price",
+            "entry_bar",
+        ):
+            setattr(engine, name, state[name])
+        return engine
+
+
+class StreamingMACD(StreamingStrategy):
+    """MACDStrategy(v2) 신호 엔진"""
+
+    def __init__(self, **params):
+        super().__init__("macd_v2", **params)
@@ -0,0 +1,369 @@
+import logging
+import sys
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from profiling import stage
+from signal_strategy import (
+    compute_indicators,
+    frame_data,
+    get_strategy,
+    signals_from_indicators,
+)
+
+logger = logging.getLogger(__name__)
+
+# backtesting.py의 buy() 기본 주문 크기 (자본 전액)
+_FULL_EQUITY = 1 - sys.float_info.epsilon
+
+
+def _first_exit(close, start, stop, tp_price, sl_price):
+    """start 이후 처음으로 익절/손절 가격에 닿는 봉 (없으면 stop)"""
+    chunk = 64
+    while start < stop:
+        end = min(start + chunk, stop)
+        seg = close[start:end]
+        hit = (seg >= tp_price) | (seg <= sl_price)
+        if hit.any():
+            return start + int(hit.argmax())
+        start = end
+        chunk *= 2
+    return stop
+
+
+class SubBars:
+    """분봉 안에서 익절/손절 체결 시점을 찾기 위한 1분봉 배열
+
+    bar_ts는 매매 봉 시작 시각(ns). 매매 봉 k에는 bar_ts[k] 이상
+    bar_ts[k + 1] 미만의 1분봉이 속함.
+    """
+
+    def __init__(self, minute1: pd.DataFrame, bar_index: pd.DatetimeIndex):
+        self.ts = minute1.index.as_unit("ns").asi8
+        self.open = minute1["Open"].to_numpy(dtype=float)
+        self.high = minute1["High"].to_numpy(dtype=float)
+        self.low = minute1["Low"].to_numpy(dtype=float)
+        self.bar_ts = bar_index.as_unit("ns").asi8
+        # 매매 봉 k의 첫 1분봉 위치 (마지막 원소는 1분봉 개수)
+        self.bounds = np.r_[np.searchsorted(self.ts, self.bar_ts), len(self.ts)]
+        if len(self.ts) and len(self.bar_ts) > 1 and self.ts[0] > self.bar_ts[1]:
+            logger.warning(
+                f"1분봉이 {minute1.index[0]}부터만 있어 그 이전 봉은 분봉 내 판정을 하지 않음"
+            )
+
+    def first_hit(self, start_bar: int, stop_bar: int, tp_price: float, sl_price: float):
+        """start_bar ~ stop_bar 직전 봉 안에서 처음 익절/손절 가격에 닿는 (봉, 체결가)
+
+        누적 최고/최저가는 단조이므로 searchsorted로 첫 도달 위치를 찾고, 거래가
+        길 수 있어 구간을 두 배씩 늘려 가며 검사함. 같은 1분봉에서 둘 다 닿으면
+        순서를 알 수 없으므로 손절로 봄. 시가부터 가격을 넘어 있으면 시가에 체결.
+        """
+        start, stop = self.bounds[start_bar], self.bounds[stop_bar]
+        chunk = 256
+        while start < stop:
+            end = min(start + chunk, stop)
+            high = np.maximum.accumulate(self.high[start:end])
+            low = np.minimum.accumulate(self.low[start:end])
+            tp_at = int(np.searchsorted(high, tp_price, side="left"))
+            sl_at = int(np.searchsorted(-low, -sl_price, side="left"))
+            if sl_at < len(low) and sl_at <= tp_at:
+                k = start + sl_at
+                price = min(self.open[k], sl_price)
+            elif tp_at < len(high):
+                k = start + tp_at
+                price = max(self.open[k], tp_price)
+            else:
+                start = end
+                chunk *= 2
+                continue
+            bar = int(np.searchsorted(self.bar_ts, self.ts[k], side="right")) - 1
+            return bar, price
+        return None
+
+
+def simulate(
+    open_: np.ndarray,
+    close: np.ndarray,
+    buy: np.ndarray,
+    sell: np.ndarray,
+    take_profit: float,
+    stop_loss: float,
+    min_holding_period: int,
+    cash: float,
+    commission: float,
+    sub_bars: Optional[SubBars] = None,
+    finalize: bool = False,
+):
+    """신호 배열로 거래를 시뮬레이션 (거래 단위로만 반복)
+
+    backtesting.py와 같이 신호가 난 봉의 다음 봉 시가에 체결하고, 익절/손절은
+    신호 봉의 종가 기준으로 판단함. sub_bars를 주면 익절/손절은 봉 안의
+    1분봉 고가/저가로 판단해 닿은 시점에 그 가격으로 체결함.
+    끝까지 보유 중인 거래는 평가 손익만 반영하고 거래 목록에 넣지 않지만,
+    finalize이면 backtesting.py의 finalize_trades처럼 마지막 봉 종가에
+    수수료를 내고 청산해 거래 목록에 넣음.
+    반환값: (거래 목록, 봉별 자산, 총 수수료)
+    """
+    n = len(close)
+    buy_bars = np.flatnonzero(buy)
+    sell_bars = np.flatnonzero(sell)
+    cash_delta = np.zeros(n)
+    cash_delta[0] = cash
+    unrealized = np.zeros(n)
+    trades = []
+    commissions = 0.0
+
+    i = 1  # backtesting.py가 next()를 처음 호출하는 봉
+    while True:
+        k = np.searchsorted(buy_bars, i)
+        if k == len(buy_bars):
+            break
+        signal_bar = int(buy_bars[k])
+        fill = signal_bar + 1
+        if fill >= n:
+            break
+        price = open_[fill]
+        size = int(
+            (cash * 1.0 * _FULL_EQUITY) // (price + abs(_FULL_EQUITY) * price * commission)
+        )
+        if not size:
+            # 자본 부족으로 주문 취소
+            i = fill
+            continue
+        entry_commission = abs(size) * price * commission
+        cash -= entry_commission
+        cash_delta[fill] -= entry_commission
+
+        ref_price = close[signal_bar]
+        tp_price = ref_price * (1 + take_profit)
+        sl_price = ref_price * (1 - stop_loss)
+        k = np.searchsorted(sell_bars, max(fill, signal_bar + min_holding_period))
+        exit_signal = int(sell_bars[k]) if k < len(sell_bars) else n
+        if sub_bars is None:
+            exit_bar = _first_exit(close, fill, min(exit_signal, n), tp_price, sl_price)
+            exit_fill = exit_bar + 1
+            hit = None
+        else:
+            exit_fill = exit_signal + 1
+            hit = sub_bars.first_hit(fill, min(exit_fill, n), tp_price, sl_price)
+            if hit is not None:
+                exit_fill = hit[0]
+        if exit_fill >= n:
+            if not finalize:
+                # 마지막까지 보유 중인 거래 (평가 손익만 반영)
+                unrealized[fill:] = size * (close[fill:] - price)
+                break
+            exit_fill = n - 1
+            exit_price = close[exit_fill]
+        else:
+            exit_price = open_[exit_fill] if hit is None else hit[1]
+        unrealized[fill:exit_fill] = size * (close[fill:exit_fill] - price)
+        pnl = size * (exit_price - price)
+        exit_commission = abs(size) * exit_price * commission
+        cash += pnl - exit_commission
+        cash_delta[exit_fill] += pnl - exit_commission
+        commissions += exit_commission + entry_commission
+        trades.append((size, fill, exit_fill, price, exit_price, pnl))
+        i = exit_fill
+
+    equity = np.cumsum(cash_delta) + unrealized
+    return trades, equity, commissions
+
+
+def run_vector_backtest(
+    df: pd.DataFrame, params: dict, minute1: Optional[pd.DataFrame] = None
+) -> pd.Series:
+    """backtesting.py 없이 params["strategy"] 전략(기본 MACDStrategy v2)과 같은 결과를 계산
+
+    minute1을 주면 익절/손절을 봉 종가 대신 봉 안의 1분봉으로 판단함.
+    """
+    spec = get_strategy(params.get("strategy"))
+    p = spec.resolve_params(params)
+    close = df["Close"].to_numpy(dtype=float)
+    open_ = df["Open"].to_numpy(dtype=float)
+    data = frame_data(df, spec.columns())
+    with stage("indicators"):
+        indicators = compute_indicators(spec, data, p)
+    with stage("signals"):
+        buy, sell = signals_from_indicators(spec, indicators, p)
+    sub_bars = None
+    if minute1 is not None:
+        with stage("sub_bars") as s:
+            sub_bars = SubBars(minute1, df.index)
+            s.add(rows=len(minute1))
+    with stage("simulate") as s:
+        trades, equity, commissions = simulate(
+            open_,
+            close,
+            buy,
+            sell,
+            p["take_profit"],
+            p["stop_loss"],
+            p["min_holding_period"],
+            params["cash"],
+            params["commission"],
+            sub_bars,
+        )
+        s.add(rows=len(close))
+    with stage("stats"):
+        return make_stats(df, trades, equity, commissions)
+
+
+class _Stats(pd.Series):
+    """backtesting.py 결과와 같은 모양으로 출력되는 통계 Series"""
+
+    def __repr__(self):
+        with pd.option_context(
+            "display.max_colwidth", 20, "display.max_rows", len(self), "display.precision", 5
+        ):
+            return super().__repr__()
+
+
+def _data_period(index) -> pd.Timedelta:
+    return pd.Series(index[-100:]).diff().dropna().median()
+
+
+def _geometric_mean(returns: pd.Series) -> float:
+    returns = returns.fillna(0) + 1
+    if np.any(returns <= 0):
+        return 0
+    return np.exp(np.log(returns).sum() / (len(returns) or np.nan)) - 1
+
+
+def _drawdown_duration_peaks(dd: np.ndarray, index: pd.DatetimeIndex) -> tuple:
+    """낙폭 구간별 길이와 최대 낙폭 (구간이 끝나는 봉에만 값이 있는 Series 두 개)"""
+    iloc = np.unique(np.r_[np.flatnonzero(dd == 0), len(dd) - 1])
+    prev = iloc[:-1]
+    iloc = iloc[1:]
+    keep = iloc > prev + 1
+    prev, iloc = prev[keep], iloc[keep]
+    if not len(iloc):
+        dd = pd.Series(dd, index=index).replace(0, np.nan)
+        return dd, dd
+    delta = index[iloc] - index[prev]
+    duration = pd.Series(pd.NaT, index=index, dtype=delta.dtype)
+    duration.iloc[iloc] = delta
+    peaks = pd.Series(np.nan, index=index)
+    # prev ~ iloc 구간 최댓값을 reduceat 한 번으로 (짝수 번째 결과만 사용)
+    bounds = np.ravel(np.column_stack([prev, iloc + 1]))
+    peaks.iloc[iloc] = np.maximum.reduceat(np.r_[dd, 0], bounds)[::2]
+    return duration, peaks
+
+
+def compute_stats(
+    trades_df: pd.DataFrame, equity: np.ndarray, df: pd.DataFrame, commissions: float = 0
+) -> pd.Series:
+    """backtesting.py 0.6의 compute_stats와 같은 계산 (backtesting/bokeh를 불러오지 않음)
+
+    전략 인스턴스가 없으므로 _strategy는 None, 매수 후 보유 수익률은 첫 봉부터.
+    """
+    index = df.index
+    dd = 1 - equity / np.maximum.accumulate(equity)
+    dd_dur, dd_peaks = _drawdown_duration_peaks(dd, index)
+    equity_df = pd.DataFrame(
+        {"Equity": equity, "DrawdownPct": dd, "DrawdownDuration": dd_dur}, index=index
+    )
+    pl = trades_df["PnL"]
+    returns = trades_df["ReturnPct"]
+    durations = trades_df["Duration"]
+    period = _data_period(index)
+
+    def round_timedelta(value):
+        if not isinstance(value, pd.Timedelta):
+            return value
+        return value.ceil(getattr(period, "resolution_string", None) or period.resolution)
+
+    s = {"Start": index[0], "End": index[-1]}
+    s["Duration"] = s["End"] - s["Start"]
+    # 포지션을 들고 있던 봉 (진입 봉 ~ 청산 봉)
+    held = np.zeros(len(index) + 1, dtype=np.int64)
+    np.add.at(held, trades_df["EntryBar"].to_numpy(np.int64), 1)
+    np.add.at(held, trades_df["ExitBar"].to_numpy(np.int64) + 1, -1)
+    s["Exposure Time [%]"] = (np.cumsum(held[:-1]) > 0).mean() * 100
+    s["Equity Final [$]"] = equity[-1]
+    s["Equity Peak [$]"] = equity.max()
+    if commissions:
+        s["Commissions [$]"] = commissions
+    s["Return [%]"] = (equity[-1] - equity[0]) / equity[0] * 100
+    c = df["Close"].to_numpy()
+    s["Buy & Hold Return [%]"] = (c[-1] - c[0]) / c[0] * 100
+
+    freq_days = period.days
+    have_weekends = index.dayofweek.to_series().between(5, 6).mean() > 2 / 7 * 0.6
+    annual_trading_days = (
+        52 if freq_days == 7
+        else 12 if freq_days == 31
+        else 1 if freq_days == 365
+        else (365 if have_weekends else 252)
+    )
+    freq = {7: "W", 31: "ME", 365: "YE"}.get(freq_days, "D")
+    day_returns = equity_df["Equity"].resample(freq).last().dropna().pct_change()
+    gmean_day_return = _geometric_mean(day_returns)
+    annualized_return = (1 + gmean_day_return) ** annual_trading_days - 1
+    s["Return (Ann.) [%]"] = annualized_return * 100
+    s["Volatility (Ann.) [%]"] = (
+        np.sqrt(
+            (day_returns.var(ddof=1) + (1 + gmean_day_return) ** 2) ** annual_trading_days
+            - (1 + gmean_day_return) ** (2 * annual_trading_days)
+        )
+        * 100
+    )
+    time_in_years = (s["Duration"].days + s["Duration"].seconds / 86400) / annual_trading_days
+    s["CAGR [%]"] = (
+        ((s["Equity Final [$]"] / equity[0]) ** (1 / time_in_years) - 1) * 100
+        if time_in_years
+        else np.nan
+    )
+    s["Sharpe Ratio"] = s["Return (Ann.) [%]"] / (s["Volatility (Ann.) [%]"] or np.nan)
+    with np.errstate(divide="ignore"):
+        s["Sortino Ratio"] = annualized_return / (
+            np.sqrt(np.mean(day_returns.clip(-np.inf, 0) ** 2)) * np.sqrt(annual_trading_days)
+        )
+    max_dd = -np.nan_to_num(dd.max())
+    s["Calmar Ratio"] = annualized_return / (-max_dd or np.nan)
+    equity_log_returns = np.log(equity[1:] / equity[:-1])
+    market_log_returns = np.log(c[1:] / c[:-1])
+    beta = np.nan
+    if len(equity_log_returns) > 1 and len(market_log_returns) > 1:
+        cov_matrix = np.cov(equity_log_returns, market_log_returns)
+        beta = cov_matrix[0, 1] / cov_matrix[1, 1]
+    s["Alpha [%]"] = s["Return [%]"] - beta * s["Buy & Hold Return [%]"]
+    s["Beta"] = beta
+    s["Max. Drawdown [%]"] = max_dd * 100
+    s["Avg. Drawdown [%]"] = -dd_peaks.mean() * 100
+    s["Max. Drawdown Duration"] = round_timedelta(dd_dur.max())
+    s["Avg. Drawdown Duration"] = round_timedelta(dd_dur.mean())
+    s["# Trades"] = n_trades = len(trades_df)
+    win_rate = np.nan if not n_trades else (pl > 0).mean()
+    s["Win Rate [%]"] = win_rate * 100
+    s["Best Trade [%]"] = returns.max() * 100
+    s["Worst Trade [%]"] = returns.min() * 100
+    s["Avg. Trade [%]"] = _geometric_mean(returns) * 100
+    s["Max. Trade Duration"] = round_timedelta(durations.max())
+    s["Avg. Trade Duration"] = round_timedelta(durations.mean())
+    s["Profit Factor"] = returns[returns > 0].sum() / (abs(returns[returns < 0].sum()) or np.nan)
+    s["Expectancy [%]"] = returns.mean() * 100
+    s["SQN"] = np.sqrt(n_trades) * pl.mean() / (pl.std() or np.nan)
+    s["Kelly Criterion"] = win_rate - (1 - win_rate) / (pl[pl > 0].mean() / -pl[pl < 0].mean())
+    s["_strategy"] = None
+    s["_equity_curve"] = equity_df
+    s["_trades"] = trades_df
+    return _Stats(s, dtype=object)
+
+
+def make_stats(df, trades, equity, commissions) -> pd.Series:
+    """simulate() 결과로 backtesting.py와 같은 형식의 통계 생성"""
+    columns = ["Size", "EntryBar", "ExitBar", "EntryPrice", "ExitPrice", "PnL"]
+    trades_df = pd.DataFrame(trades, columns=columns).astype(
+        {"Size": "int64", "EntryBar": "int64", "ExitBar": "int64", "PnL": "float64"}
+    )
+    trades_df.insert(5, "SL", None)
+    trades_df.insert(6, "TP", None)
+    trades_df["ReturnPct"] = trades_df["ExitPrice"] / trades_df["EntryPrice"] - 1
+    trades_df["EntryTime"] = df.index[trades_df["EntryBar"].to_numpy()]
+    trades_df["ExitTime"] = df.index[trades_df["ExitBar"].to_numpy()]
+    trades_df["Duration"] = trades_df["ExitTime"] - trades_df["EntryTime"]
+    trades_df["Tag"] = None
+    return compute_stats(trades_df, equity, df, commissions)
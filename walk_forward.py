@@ -0,0 +1,214 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+import indicator_cache
+from optimizer import (
+    OHLCV_COLUMNS,
+    SharedOHLCV,
+    attach_shared_ohlcv,
+    build_grid,
+    sample_random,
+)
+from signal_strategy import TIME_COLUMN, compute_signals, frame_data, get_strategy
+from vector_engine import make_stats, simulate
+
+logger = logging.getLogger(__name__)
+
+# 학습 구간에서 파라미터를 고를 때 쓸 수 있는 지표
+OBJECTIVES = ("Return [%]", "Max. Drawdown [%]", "Return/Drawdown")
+
+
+def make_folds(
+    n_bars: int, n_folds: int, train_ratio: float = 4.0, anchored: bool = False
+) -> list:
+    """(학습 시작, 학습 끝, 검증 시작, 검증 끝) 봉 인덱스 목록 (끝은 포함하지 않음)
+
+    검증 구간은 서로 겹치지 않고 이어지며 길이가 같음. 학습 구간 길이는
+    검증 구간의 train_ratio배이고, anchored이면 항상 처음부터 시작함.
+    나누어 떨어지지 않고 남는 봉은 가장 오래된 쪽에서 버림.
+    """
+    test_bars = int(n_bars // (n_folds + train_ratio))
+    train_bars = int(test_bars * train_ratio)
+    if test_bars < 2 or train_bars < 2:
+        raise ValueError(f"{n_bars}개 봉으로는 {n_folds}개 구간을 만들 수 없습니다.")
+    offset = n_bars - train_bars - n_folds * test_bars
+    folds = []
+    for k in range(n_folds):
+        test_start = offset + train_bars + k * test_bars
+        train_start = 0 if anchored else test_start - train_bars
+        folds.append((train_start, test_start, test_start, test_start + test_bars))
+    return folds
+
+
+def _window_metrics(equity: np.ndarray, n_trades: int) -> dict:
+    peak = np.maximum.accumulate(equity)
+    max_dd = ((equity - peak) / peak).min() * 100
+    ret = (equity[-1] / equity[0] - 1) * 100
+    return {
+        "Return [%]": ret,
+        "Max. Drawdown [%]": max_dd,
+        "Return/Drawdown": ret / -max_dd if max_dd < 0 else ret,
+        "# Trades": n_trades,
+    }
+
+
+class _Series:
+    """전체 구간 지표를 한 번 계산해 두고 구간별로 잘라 쓰는 도우미
+
+    EMA는 과거 값만 사용하므로 전체 구간에서 계산한 값을 잘라도 미래 정보가
+    섞이지 않고, 겹치는 구간끼리 같은 지표를 다시 계산하지 않음.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns = frame_data(df, [*OHLCV_COLUMNS, TIME_COLUMN])
+        self.open = self.columns["Open"]
+        self.close = self.columns["Close"]
+        # 데이터 해시는 한 번만 계산하고 지표는 캐시(용량 제한 있음)에서 재사용
+        self.data_key = indicator_cache.fingerprint(self.close)
+
+    def run(self, params: dict, start: int, end: int, cash: float):
+        spec = get_strategy(params.get("strategy"))
+        p = spec.resolve_params(params)
+        buy, sell = compute_signals(spec, self.columns, p, self.data_key)
+        return simulate(
+            self.open[start:end],
+            self.close[start:end],
+            buy[start:end],
+            sell[start:end],
+            p["take_profit"],
+            p["stop_loss"],
+            p["min_holding_period"],
+            cash,
+            params["commission"],
+            finalize=True,
+        )
+
+
+_worker_series: Optional[_Series] = None
+_worker_handles: list = []
+
+
+def _init_worker(spec: tuple) -> None:
+    global _worker_series, _worker_handles
+    df, _worker_handles = attach_shared_ohlcv(spec)
+    _worker_series = _Series(df)
+
+
+def _optimize_fold(fold: tuple, base: dict, combos: list, objective: str) -> tuple:
+    """학습 구간에서 objective가 가장 좋은 조합과 그 지표"""
+    train_start, train_end = fold[:2]
+    best, best_score, best_metrics = combos[0], -np.inf, None
+    for combo in combos:
+        trades, equity, _ = _worker_series.run(
+            {**base, **combo}, train_start, train_end, base["cash"]
+        )
+        metrics = _window_metrics(equity, len(trades))
+        if best_metrics is None or metrics[objective] > best_score:
+            best, best_score, best_metrics = combo, metrics[objective], metrics
+    return best, best_metrics
+
+
+def walk_forward(
+    base_params: dict,
+    param_ranges: dict,
+    n_folds: int = 20,
+    train_ratio: float = 4.0,
+    anchored: bool = False,
+    objective: str = "Return [%]",
+    method: str = "grid",
+    n_samples: int = 100,
+    df: Optional[pd.DataFrame] = None,
+    max_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> dict:
+    """학습/검증 구간을 옮겨 가며 최적화하고 검증 구간 결과만 이어 붙임
+
+    반환값: {"folds": 구간별 선택 파라미터와 학습/검증 지표 표,
+            "equity": 검증 구간을 이어 붙인 자산 곡선,
+            "stats": 이어 붙인 검증 구간 전체의 backtesting.py 형식 통계}
+    구간 끝에 남은 포지션은 backtesting.py의 finalize_trades처럼 마지막 종가에
+    수수료를 내고 청산해 거래 목록에 넣고, 다음 검증 구간은 그 현금으로 시작함.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"지원하지 않는 최적화 지표: {objective}")
+    if method == "grid":
+        combos = build_grid(param_ranges)
+    elif method == "random":
+        combos = sample_random(param_ranges, n_samples, seed)
+    else:
+        raise ValueError(f"지원하지 않는 최적화 방식: {method}")
+    if not combos:
+        raise ValueError("평가할 파라미터 조합이 없습니다.")
+
+    if df is None:
+        from data_collector import get_ohlcv
+
+        df = get_ohlcv(base_params["ticker"], base_params["interval"], base_params["days"])
+    folds = make_folds(len(df), n_folds, train_ratio, anchored)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(folds))
+    logger.info(
+        f"워크포워드 시작: {len(folds)}개 구간 x {len(combos)}개 조합, 워커 {max_workers}개"
+    )
+    with SharedOHLCV(df) as shared:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(shared.spec,),
+        ) as executor:
+            chosen = list(
+                executor.map(
+                    _optimize_fold,
+                    folds,
+                    [base_params] * len(folds),
+                    [combos] * len(folds),
+                    [objective] * len(folds),
+                )
+            )
+
+    # 검증 구간은 앞 구간이 끝난 자산으로 이어서 차례로 실행 (한 번씩이라 빠름)
+    series = _Series(df)
+    oos_start = folds[0][2]
+    capital = base_params["cash"]
+    equity_parts, trades, commissions = [], [], 0.0
+    rows = []
+    for k, (fold, (params, train_metrics)) in enumerate(zip(folds, chosen)):
+        test_start, test_end = fold[2:]
+        fold_trades, equity, fold_commissions = series.run(
+            {**base_params, **params}, test_start, test_end, capital
+        )
+        equity_parts.append(equity)
+        shift = test_start - oos_start
+        for size, fill, exit_fill, price, exit_price, pnl in fold_trades:
+            trades.append((size, fill + shift, exit_fill + shift, price, exit_price, pnl))
+        commissions += fold_commissions
+        capital = equity[-1]
+        test_metrics = _window_metrics(equity, len(fold_trades))
+        rows.append(
+            {
+                "fold": k,
+                "train_start": df.index[fold[0]],
+                "train_end": df.index[fold[1] - 1],
+                "test_start": df.index[fold[2]],
+                "test_end": df.index[fold[3] - 1],
+                **params,
+                **{f"train {name}": value for name, value in train_metrics.items()},
+                **{f"test {name}": value for name, value in test_metrics.items()},
+            }
+        )
+
+    oos_df = df.iloc[oos_start : folds[-1][3]]
+    equity = np.concatenate(equity_parts)
+    stats = make_stats(oos_df, trades, equity, commissions)
+    logger.info("워크포워드 완료")
+    return {
+        "folds": pd.DataFrame(rows),
+        "equity": pd.Series(equity, index=oos_df.index, name="Equity"),
+        "stats": stats,
+    }